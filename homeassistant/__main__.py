@@ -105,6 +105,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--lazy-platform-imports",
+        action="store_true",
+        help="Import platforms like diagnostics or logbook on first use at startup",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -201,6 +206,7 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        lazy_platform_imports=args.lazy_platform_imports,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
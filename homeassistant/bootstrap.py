@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Mapping
 import contextlib
 from functools import partial
 from itertools import chain
@@ -16,7 +17,7 @@ import platform
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypedDict
 
 # Import cryptography early since import openssl is not thread-safe
 # _frozen_importlib._DeadlockError: deadlock detected by _ModuleLock('cryptography.hazmat.backends.openssl.backend')
@@ -69,6 +70,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -87,7 +89,8 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.json import json_bytes
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -97,11 +100,13 @@ from .setup import (
     # which integrations are being set up.
     _setup_started,
     async_get_setup_timings,
+    async_get_setup_trace,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from .util.async_ import create_eager_task
+from .util.file import WriteError, write_utf8_file
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_docker_env, is_virtual_env
@@ -127,6 +132,17 @@ DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
+STARTUP_TRACE_FILENAME = "home-assistant.startup_trace.json"
+
+SETUP_TIMINGS_STORAGE_KEY = "core.setup_timings"
+SETUP_TIMINGS_STORAGE_VERSION = 1
+SETUP_TIMINGS_SAVE_DELAY = 60
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+# Setup time assumed for integrations which have not been set up before
+DEFAULT_SETUP_TIME = 0.1
+
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
@@ -251,6 +267,7 @@ PRELOAD_STORAGE = [
     "assist_pipeline.pipelines",
     "core.analytics",
     "auth_module.totp",
+    SETUP_TIMINGS_STORAGE_KEY,
 ]
 
 
@@ -263,6 +280,8 @@ async def async_setup_hass(
         """Create the hass object and do basic setup."""
         hass = core.HomeAssistant(runtime_config.config_dir)
         loader.async_setup(hass)
+        if runtime_config.lazy_platform_imports:
+            loader.async_enable_lazy_platform_imports(hass)
 
         await async_enable_logging(
             hass,
@@ -434,6 +453,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -451,6 +471,7 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    manifest_cache = await _async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -492,6 +513,9 @@ async def async_from_config_dict(
 
     await _async_set_up_integrations(hass, config)
 
+    if manifest_cache is not None:
+        _async_save_manifest_cache(hass, *manifest_cache)
+
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
 
@@ -773,13 +797,17 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    priorities: Mapping[str, float] | None = None,
 ) -> None:
     """Set up multiple domains. Log on failure."""
     # Avoid creating tasks for domains that were setup in a previous stage
     domains_not_yet_setup = domains - hass.config.components
+    priorities = priorities or {}
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # The other domains are started by priority so the domains on the
+    # longest dependency chains do not wait behind the short ones.
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -787,7 +815,12 @@ async def async_setup_multi_components(
             eager_start=True,
         )
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+            domains_not_yet_setup,
+            key=lambda domain: (
+                SETUP_ORDER_SORT_KEY(domain),
+                priorities.get(domain, 0.0),
+            ),
+            reverse=True,
         )
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
@@ -965,6 +998,116 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+def _critical_path_priorities(
+    domains: set[str],
+    integration_cache: dict[str, loader.Integration],
+    setup_timings: Mapping[str, float],
+) -> dict[str, float]:
+    """Return the setup time of the longest chain of dependants of each domain.
+
+    A domain blocks all domains which depend on it, so the domains which
+    start the longest chains are the ones to set up first.
+    """
+    dependants: defaultdict[str, set[str]] = defaultdict(set)
+    for domain in domains:
+        if (integration := integration_cache.get(domain)) is None:
+            continue
+        for dep in chain(integration.dependencies, integration.after_dependencies):
+            if dep in domains:
+                dependants[dep].add(domain)
+
+    priorities: dict[str, float] = {}
+
+    def _critical_path(domain: str, visiting: set[str]) -> float:
+        if (priority := priorities.get(domain)) is not None:
+            return priority
+        visiting.add(domain)
+        priority = setup_timings.get(domain, DEFAULT_SETUP_TIME) + max(
+            (
+                _critical_path(dependant, visiting)
+                for dependant in dependants[domain]
+                # After dependencies can form cycles
+                if dependant not in visiting
+            ),
+            default=0.0,
+        )
+        visiting.discard(domain)
+        priorities[domain] = priority
+        return priority
+
+    for domain in sorted(domains):
+        _critical_path(domain, set())
+    return priorities
+
+
+@core.callback
+def _async_save_setup_timings(
+    hass: core.HomeAssistant,
+    store: Store[dict[str, float]],
+    domains: set[str],
+    previous_timings: Mapping[str, float],
+) -> None:
+    """Save the setup times of this startup averaged with the previous ones."""
+    timings = {
+        domain: round((previous_timings.get(domain, time_taken) + time_taken) / 2, 3)
+        for domain, time_taken in async_get_setup_timings(hass).items()
+        if domain in domains
+    }
+    store.async_delay_save(lambda: timings, SETUP_TIMINGS_SAVE_DELAY)
+
+
+class _ManifestCacheData(TypedDict):
+    """Data of the manifest cache store."""
+
+    ha_version: str
+    manifests: dict[str, loader.ManifestCacheEntry]
+
+
+async def _async_load_manifest_cache(
+    hass: core.HomeAssistant,
+) -> tuple[Store[_ManifestCacheData], dict[str, loader.ManifestCacheEntry]] | None:
+    """Enable the manifest cache of the loader with the saved manifests.
+
+    Development versions are not cached as their built-in manifests
+    change without a version bump.
+    """
+    if "dev" in __version__:
+        return None
+    store: Store[_ManifestCacheData] = Store(
+        hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+    )
+    manifests: dict[str, loader.ManifestCacheEntry] = {}
+    if (data := await store.async_load()) and data["ha_version"] == __version__:
+        manifests = data["manifests"]
+    hass.data[loader.DATA_MANIFEST_CACHE] = manifests
+    return store, manifests.copy()
+
+
+@core.callback
+def _async_save_manifest_cache(
+    hass: core.HomeAssistant,
+    store: Store[_ManifestCacheData],
+    loaded_manifests: dict[str, loader.ManifestCacheEntry],
+) -> None:
+    """Save the manifest cache if manifests were read during startup."""
+    manifests = hass.data[loader.DATA_MANIFEST_CACHE]
+    if manifests.keys() == loaded_manifests.keys() and all(
+        entry is loaded_manifests[path] for path, entry in manifests.items()
+    ):
+        return
+    data: _ManifestCacheData = {"ha_version": __version__, "manifests": manifests}
+    store.async_delay_save(lambda: data, MANIFEST_CACHE_SAVE_DELAY)
+
+
+async def _async_write_startup_trace(hass: core.HomeAssistant) -> None:
+    """Write the startup trace to the config directory."""
+    trace = json_bytes(async_get_setup_trace(hass))
+    path = hass.config.path(STARTUP_TRACE_FILENAME)
+    # write_utf8_file logs the error
+    with contextlib.suppress(WriteError):
+        await hass.async_add_executor_job(write_utf8_file, path, trace, False, "wb")
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -980,6 +1123,14 @@ async def _async_set_up_integrations(
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
 
+    timings_store: Store[dict[str, float]] = Store(
+        hass, SETUP_TIMINGS_STORAGE_VERSION, SETUP_TIMINGS_STORAGE_KEY
+    )
+    previous_timings = await timings_store.async_load() or {}
+    priorities = _critical_path_priorities(
+        domains_to_setup, integration_cache, previous_timings
+    )
+
     pre_stage_domains = [
         (name, domains_to_setup & domain_group) for name, domain_group in SETUP_ORDER
     ]
@@ -1020,7 +1171,7 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            await async_setup_multi_components(hass, domain_group, config, priorities)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1032,7 +1183,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1048,7 +1201,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1068,9 +1223,23 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    _async_save_setup_timings(hass, timings_store, domains_to_setup, previous_timings)
+    hass.async_create_background_task(
+        _async_write_startup_trace(hass), "write startup trace", eager_start=True
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        import_time = {
+            domain: round(sum(timings.values()), 3)
+            for domain, timings in loader.async_get_import_timings(hass).items()
+            if timings
+        }
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
@@ -216,12 +216,12 @@ class APIStatesView(HomeAssistantView):
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states = (state.as_dict_json for state in hass.states.async_all_snapshot())
         else:
             entity_perm = user.permissions.check_entity
             states = (
                 state.as_dict_json
-                for state in hass.states.async_all()
+                for state in hass.states.async_all_snapshot()
                 if entity_perm(state.entity_id, "read")
             )
         response = web.Response(
@@ -1029,12 +1029,17 @@ async def _async_process_config(
         An automation or configuration is only allowed to match at most once to handle
         the case of multiple automations with identical configuration.
 
+        Configurations are indexed by id, or by name if they have no id, so each
+        automation is only compared to the configurations it can match.
+
         Returns a tuple of sets of indices: ({automation_matches}, {config_matches})
         """
         automation_matches: set[int] = set()
         config_matches: set[int] = set()
         automation_configs_with_id: dict[str, tuple[int, AutomationEntityConfig]] = {}
-        automation_configs_without_id: list[tuple[int, AutomationEntityConfig]] = []
+        automation_configs_without_id: dict[
+            str, list[tuple[int, AutomationEntityConfig]]
+        ] = {}
 
         for config_idx, automation_config in enumerate(automation_configs):
             if automation_id := automation_config.config_block.get(CONF_ID):
@@ -1043,7 +1048,9 @@ async def _async_process_config(
                     automation_config,
                 )
                 continue
-            automation_configs_without_id.append((config_idx, automation_config))
+            automation_configs_without_id.setdefault(
+                _automation_name(automation_config), []
+            ).append((config_idx, automation_config))
 
         for automation_idx, automation in enumerate(automations):
             if automation.unique_id:
@@ -1057,7 +1064,11 @@ async def _async_process_config(
                     config_matches.add(config_idx)
                 continue
 
-            for config_idx, automation_config in automation_configs_without_id:
+            if not isinstance(automation.name, str):
+                continue
+            for config_idx, automation_config in automation_configs_without_id.get(
+                automation.name, []
+            ):
                 if config_idx in config_matches:
                     # Only allow an automation config to match at most once
                     continue
@@ -1092,6 +1103,13 @@ async def _async_process_config(
     entities = await _create_automation_entities(hass, updated_automation_configs)
     await component.async_add_entities(entities)
 
+    LOGGER.debug(
+        "Processed automations: %d unchanged, %d removed, %d created",
+        len(automation_matches),
+        len(tasks),
+        len(entities),
+    )
+
 
 def _automation_matches_config(
     automation: BaseAutomationEntity | None, config: AutomationEntityConfig | None
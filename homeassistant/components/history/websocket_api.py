@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import async_add_read_job_for_connection
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -156,7 +157,10 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -279,7 +283,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -5,12 +5,15 @@ from __future__ import annotations
 from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import batched
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -150,6 +153,32 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Generate the logbook statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def get_events(
         self,
         start_day: dt,
@@ -157,32 +186,46 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
+            stmt = self._statement_for_request(session, start_day, end_day)
+            return self.humanify(
+                execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
-            stmt = statement_for_request(
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+        chunk_size: int,
+    ) -> Generator[list[dict[str, Any]]]:
+        """Get events for a period of time in chunks of up to chunk_size events.
+
+        Periods longer than a day are fetched from the database with
+        yield_per and the rows are humanified as they are fetched, so
+        the first chunk is available before the whole period is read.
+
+        The generator must be consumed in the thread it was created in.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, start_day, end_day)
+            rows = execute_stmt_lambda_element(
+                session,
+                stmt,
                 start_day,
                 end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+                yield_per=chunk_size,
+                orm_rows=False,
             )
+            for events in batched(
+                _humanify(
+                    self.hass,
+                    rows,
+                    self.ent_reg,
+                    self.logbook_run,
+                    self.context_augmenter,
+                ),
+                chunk_size,
+            ):
+                yield list(events)
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.util import async_add_read_job_for_connection
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
@@ -35,6 +36,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many historical events to deliver in each message
+HISTORICAL_EVENTS_CHUNK_SIZE = 1000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,74 +105,70 @@ async def _async_send_historical_events(
     )
 
     if not is_big_query:
-        message, last_event_time = await _async_get_ws_stream_events(
+        return await _async_send_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             event_processor,
             partial,
+            force_send,
         )
-        # If there is no last_event_time, there are no historical
-        # results, but we still send an empty message
-        # if its the last one (not partial) so
-        # consumers of the api know their request was
-        # answered but there were no results
-        if last_event_time or not partial or force_send:
-            connection.send_message(message)
-        return last_event_time
 
     # This is a big query so we deliver
     # the first three hours and then
     # we fetch the old data
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
+    recent_query_last_event_time = await _async_send_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         event_processor,
         partial=True,
     )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
-
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
+    older_query_last_event_time = await _async_send_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         event_processor,
         partial,
+        force_send,
     )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
-async def _async_get_ws_stream_events(
+async def _async_send_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
+    force_send: bool = False,
+) -> dt | None:
+    """Async wrapper around _ws_stream_send_events."""
+    loop = hass.loop
+
+    def _send_message(message: bytes) -> None:
+        loop.call_soon_threadsafe(connection.send_message, message)
+
+    return await get_instance(hass).async_add_read_job(
+        _ws_stream_send_events,
+        _send_message,
         msg_id,
         start_time,
         end_time,
         event_processor,
         partial,
+        force_send,
     )
 
 
@@ -184,18 +183,14 @@ def _generate_stream_message(
     }
 
 
-def _ws_stream_get_events(
+def _ws_stream_message(
     msg_id: int,
+    events: list[dict[str, Any]],
     start_day: dt,
     end_day: dt,
-    event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+) -> bytes:
+    """Generate a json logbook stream event message."""
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -203,7 +198,41 @@ def _ws_stream_get_events(
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return json_bytes(messages.event_message(msg_id, message)), last_time
+    return json_bytes(messages.event_message(msg_id, message))
+
+
+def _ws_stream_send_events(
+    send_message: Callable[[bytes], None],
+    msg_id: int,
+    start_day: dt,
+    end_day: dt,
+    event_processor: EventProcessor,
+    partial: bool,
+    force_send: bool,
+) -> dt | None:
+    """Fetch events and send them as json in chunks from the executor.
+
+    Every chunk except the last one is marked as partial so the
+    first events can be shown while the rest are still being fetched.
+
+    If there are no events, an empty message is only sent if it is
+    the last one (not partial) or force_send is set, so consumers of
+    the api know their request was answered but there were no results.
+
+    Returns the time of the most recent event that was sent.
+    """
+    events: list[dict[str, Any]] = []
+    for chunk in event_processor.iter_events(
+        start_day, end_day, HISTORICAL_EVENTS_CHUNK_SIZE
+    ):
+        if events:
+            send_message(_ws_stream_message(msg_id, events, start_day, end_day, True))
+        events = chunk
+    if events or not partial or force_send:
+        send_message(_ws_stream_message(msg_id, events, start_day, end_day, partial))
+    if not events:
+        return None
+    return dt_util.utc_from_timestamp(events[-1]["when"])
 
 
 async def _async_events_consumer(
@@ -501,7 +530,10 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_formatted_get_events,
             msg["id"],
             start_time,
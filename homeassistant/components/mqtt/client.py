@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -83,6 +83,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -266,8 +267,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -373,10 +372,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
 
-        self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
-            set
-        )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._subscriptions: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -430,10 +426,7 @@ class MQTT:
     @property
     def subscriptions(self) -> set[Subscription]:
         """Return the tracked subscriptions."""
-        return {
-            *chain.from_iterable(self._simple_subscriptions.values()),
-            *self._wildcard_subscriptions,
-        }
+        return set(self._subscriptions)
 
     def cleanup(self) -> None:
         """Clean up listeners."""
@@ -624,9 +617,7 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
-        )
+        return self._subscriptions.has_topic_filter(topic)
 
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
@@ -741,39 +732,24 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if subscription.is_simple_match:
-            self._simple_subscriptions[subscription.topic].add(subscription)
-        else:
-            self._wildcard_subscriptions.add(subscription)
+        self._subscriptions.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        topic = subscription.topic
         try:
-            if subscription.is_simple_match:
-                simple_subscriptions = self._simple_subscriptions
-                simple_subscriptions[topic].remove(subscription)
-                if not simple_subscriptions[topic]:
-                    del simple_subscriptions[topic]
-            else:
-                self._wildcard_subscriptions.remove(subscription)
-        except (KeyError, ValueError) as exc:
+            self._subscriptions.remove(subscription.topic, subscription)
+        except KeyError as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
     @callback
@@ -834,12 +810,8 @@ class MQTT:
             )
 
         job = HassJob(msg_callback, job_type=job_type)
-        is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
-
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -851,7 +823,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -864,7 +835,7 @@ class MQTT:
         if self._is_active_subscription(topic):
             if self._max_qos[topic] == 0:
                 return
-            subs = self._matching_subscriptions(topic)
+            subs = self._subscriptions.match(topic)
             self._max_qos[topic] = max(sub.qos for sub in subs)
             # Other subscriptions on topic remaining - don't unsubscribe.
             return
@@ -898,7 +869,7 @@ class MQTT:
         pending_subscriptions: dict[str, int] = self._pending_subscriptions
         pending_wildcard_subscriptions = {
             subscription.topic: pending_subscriptions.pop(subscription.topic)
-            for subscription in self._wildcard_subscriptions
+            for subscription in self._subscriptions.iter_wildcard()
             if subscription.topic in pending_subscriptions
         }
 
@@ -1044,20 +1015,6 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
-    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
-        return subscriptions
-
     @callback
     def _async_mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
@@ -1084,7 +1041,7 @@ class MQTT:
             msg.qos,
             msg.payload[0:8192],
         )
-        subscriptions = self._matching_subscriptions(topic)
+        subscriptions = self._subscriptions.match(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
 
         for subscription in subscriptions:
@@ -1247,13 +1204,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
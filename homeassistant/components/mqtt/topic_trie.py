@@ -0,0 +1,174 @@
+"""Index of MQTT topic filters for matching received messages."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+
+MATCH_CACHE_SIZE = 8192
+
+
+class _TrieNode[_T]:
+    """A level of the topic filters in the trie."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TrieNode[_T]] = {}
+        self.items: set[_T] = set()
+
+
+def _filter_matches(filter_levels: list[str], topic: str) -> bool:
+    """Return if a topic filter split in levels matches a topic."""
+    topic_levels = topic.split("/")
+    # Wildcards at the first level do not match topics starting with $
+    normal = not topic.startswith("$")
+    for idx, level in enumerate(filter_levels):
+        if level == "#":
+            return normal or idx > 0
+        if idx == len(topic_levels):
+            return False
+        if level == "+":
+            if not normal and idx == 0:
+                return False
+        elif level != topic_levels[idx]:
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+class TopicTrie[_T]:
+    """Match topics against the topic filters of subscriptions.
+
+    Topic filters without wildcards are looked up by topic. Topic
+    filters with the + and # wildcards are stored in a trie with one
+    level per node, so matching a topic only visits the levels of the
+    filters that can match it instead of testing every wildcard filter.
+
+    The matches for received topics are kept in a LRU cache. Adding
+    or removing a filter only drops the cached topics it matches.
+    """
+
+    __slots__ = ("_cache", "_cache_size", "_root", "_simple")
+
+    def __init__(self, cache_size: int = MATCH_CACHE_SIZE) -> None:
+        """Initialize the trie."""
+        self._simple: dict[str, set[_T]] = {}
+        self._root: _TrieNode[_T] = _TrieNode()
+        self._cache: OrderedDict[str, list[_T]] = OrderedDict()
+        self._cache_size = cache_size
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all items."""
+        for items in self._simple.values():
+            yield from items
+        yield from self.iter_wildcard()
+
+    def iter_wildcard(self) -> Iterator[_T]:
+        """Iterate over the items of the topic filters with wildcards."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.items
+            nodes.extend(node.children.values())
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        if not ("+" in topic_filter or "#" in topic_filter):
+            self._simple.setdefault(topic_filter, set()).add(item)
+            self._cache.pop(topic_filter, None)
+            return
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TrieNode()
+            node = child
+        node.items.add(item)
+        self._invalidate_wildcard(topic_filter)
+
+    def remove(self, topic_filter: str, item: _T) -> None:
+        """Remove an item for a topic filter.
+
+        Raises KeyError if the item was not added for the topic filter.
+        """
+        if not ("+" in topic_filter or "#" in topic_filter):
+            items = self._simple[topic_filter]
+            items.remove(item)
+            if not items:
+                del self._simple[topic_filter]
+            self._cache.pop(topic_filter, None)
+            return
+        path = [self._root]
+        for level in topic_filter.split("/"):
+            path.append(path[-1].children[level])
+        path[-1].items.remove(item)
+        # Prune the nodes which no longer lead to any item
+        for level, node, parent in zip(
+            reversed(topic_filter.split("/")),
+            reversed(path[1:]),
+            reversed(path[:-1]),
+            strict=True,
+        ):
+            if node.items or node.children:
+                break
+            del parent.children[level]
+        self._invalidate_wildcard(topic_filter)
+
+    def _invalidate_wildcard(self, topic_filter: str) -> None:
+        """Drop the cached matches of the topics a wildcard filter matches."""
+        filter_levels = topic_filter.split("/")
+        cache = self._cache
+        for topic in [
+            topic for topic in cache if _filter_matches(filter_levels, topic)
+        ]:
+            del cache[topic]
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if there are items for exactly this topic filter."""
+        if not ("+" in topic_filter or "#" in topic_filter):
+            return topic_filter in self._simple
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.items)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the items of all topic filters matching a topic."""
+        cache = self._cache
+        if (matches := cache.get(topic)) is not None:
+            cache.move_to_end(topic)
+            return matches
+        matches = self._match(topic)
+        cache[topic] = matches
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return matches
+
+    def _match(self, topic: str) -> list[_T]:
+        """Match a topic without the cache."""
+        matches: list[_T] = []
+        if (items := self._simple.get(topic)) is not None:
+            matches.extend(items)
+        if not self._root.children:
+            return matches
+        levels = topic.split("/")
+        last_idx = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        normal = not topic.startswith("$")
+        stack: list[tuple[_TrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcard_allowed = normal or idx > 0
+            if wildcard_allowed and (multi := children.get("#")) is not None:
+                matches.extend(multi.items)
+            if idx == last_idx:
+                matches.extend(node.items)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if wildcard_allowed and (single := children.get("+")) is not None:
+                stack.append((single, idx + 1))
+        return matches
@@ -7,6 +7,7 @@ from contextlib import suppress
 from datetime import timedelta
 from functools import _lru_cache_wrapper
 import logging
+from operator import itemgetter
 import reprlib
 import sys
 import threading
@@ -25,6 +26,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.loader import async_get_import_timings
 
 from .const import DOMAIN
 
@@ -40,6 +42,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_IMPORT_TIMES = "log_import_times"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +66,7 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_IMPORT_TIMES,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -260,6 +264,28 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_log_import_times(call: ServiceCall) -> None:
+        """Log the import times of the modules of each integration."""
+        import_times = {
+            domain: (sum(timings.values()), timings)
+            for domain, timings in async_get_import_timings(hass).items()
+            if timings
+        }
+        for domain, (total, timings) in sorted(
+            import_times.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            _LOGGER.critical(
+                "Import time of %s: %.3fs %s",
+                domain,
+                total,
+                {
+                    module: round(import_time, 3)
+                    for module, import_time in sorted(
+                        timings.items(), key=itemgetter(1), reverse=True
+                    )
+                },
+            )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +408,13 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_IMPORT_TIMES,
+        _async_log_import_times,
+    )
+
     return True
 
 
@@ -0,0 +1,193 @@
+"""Bulk writer for the states, state_attributes and states_meta tables."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.dml import ReturningInsert
+
+from homeassistant.util.collection import chunked_or_all
+
+from .const import SupportedDialect
+from .db_schema import (
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES,
+    TABLE_STATES_META,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+type _BulkRow = States | StateAttributes | StatesMeta
+
+
+@cache
+def _insert_stmt_and_columns(
+    table: Table, sort_by_parameter_order: bool
+) -> tuple[ReturningInsert, tuple[str, ...], str]:
+    """Return a multi-row insert returning the id, the columns and the id key."""
+    (primary_key,) = table.primary_key.columns
+    return (
+        insert(table).returning(
+            primary_key, sort_by_parameter_order=sort_by_parameter_order
+        ),
+        tuple(column.key for column in table.columns if column is not primary_key),
+        primary_key.key,
+    )
+
+
+def bulk_write_supported(dialect: Dialect) -> bool:
+    """Return if the dialect can return the ids of a multi-row insert."""
+    if dialect.name == SupportedDialect.SQLITE:
+        return bool(dialect.insert_executemany_returning)
+    return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class StatesBulkWriter:
+    """Write pending states rows with multi-row inserts.
+
+    The ORM unit of work has to insert States rows one at a time
+    because old_state is a self-referential relationship, and every
+    object added to the session goes through the identity map.
+
+    The bulk writer keeps the transient States, StateAttributes and
+    StatesMeta objects out of the session and writes them at commit
+    time with one multi-row INSERT ... RETURNING per table. The
+    returned ids are assigned back to the objects so the table
+    managers can pick them up in post_commit_pending exactly as if
+    the ORM had flushed them.
+    """
+
+    def __init__(self, max_bind_vars: int, dialect: Dialect) -> None:
+        """Initialize the bulk writer.
+
+        SQLite cannot return the ids of a multi-row insert in parameter
+        order without falling back to one INSERT per row. Since the
+        recorder is the only writer and the tables use rowid aliases,
+        the ids of a multi-row insert are assigned in ascending order
+        so we can sort the returned ids instead.
+        """
+        self._max_bind_vars = max_bind_vars
+        self._sort_ids = dialect.name == SupportedDialect.SQLITE
+        self._pending: dict[str, list[Any]] = {
+            TABLE_STATES_META: [],
+            TABLE_STATE_ATTRIBUTES: [],
+            TABLE_STATES: [],
+        }
+
+    def add(self, obj: _BulkRow) -> None:
+        """Add a row that will be written at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending[obj.__tablename__].append(obj)
+
+    @property
+    def pending_states(self) -> list[States]:
+        """Return the States that will be written at the next commit."""
+        return self._pending[TABLE_STATES]
+
+    def write(self, session: Session) -> None:
+        """Write all pending rows in the session's transaction.
+
+        The ids of the new rows are assigned to the pending objects.
+        If the write fails, the rows written before the failure are
+        still part of the transaction so the session must be discarded.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        pending = self._pending
+        if not any(pending.values()):
+            return
+        connection = session.connection()
+        if states_meta := pending[TABLE_STATES_META]:
+            self._insert(connection, states_meta)
+        if state_attributes := pending[TABLE_STATE_ATTRIBUTES]:
+            self._insert(connection, state_attributes)
+        if states := pending[TABLE_STATES]:
+            for generation in _states_generations(states):
+                self._insert(connection, generation)
+
+    def _insert(self, connection: Connection, objs: Sequence[_BulkRow]) -> None:
+        """Insert rows for objs and assign the returned ids."""
+        stmt, columns, id_key = _insert_stmt_and_columns(
+            objs[0].__table__,  # type: ignore[arg-type]
+            not self._sort_ids,
+        )
+        is_states = objs[0].__tablename__ == TABLE_STATES
+        max_rows = max(1, self._max_bind_vars // len(columns))
+        for chunk in chunked_or_all(objs, max_rows):
+            params = [_row_params(obj, columns, is_states) for obj in chunk]
+            ids = connection.execute(stmt, params).scalars().all()
+            if self._sort_ids:
+                ids = sorted(ids)
+            for obj, row_id in zip(chunk, ids, strict=True):
+                setattr(obj, id_key, row_id)
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to clear the written rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for objs in self._pending.values():
+            objs.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.post_commit_pending()
+
+
+def _states_generations(states: list[States]) -> list[list[States]]:
+    """Split the pending states into generations.
+
+    A state whose old_state is pending in the same commit can only
+    be inserted once the old state has a state_id, so it is placed in
+    the generation after the old state. The first pending state of
+    each entity is in generation zero.
+    """
+    generations: list[list[States]] = []
+    generation_by_state: dict[int, int] = {}
+    for dbstate in states:
+        generation = 0
+        if (old_state := dbstate.__dict__.get("old_state")) is not None and (
+            old_generation := generation_by_state.get(id(old_state))
+        ) is not None:
+            generation = old_generation + 1
+        generation_by_state[id(dbstate)] = generation
+        if generation == len(generations):
+            generations.append([])
+        generations[generation].append(dbstate)
+    return generations
+
+
+def _row_params(
+    obj: _BulkRow, columns: tuple[str, ...], is_states: bool
+) -> dict[str, Any]:
+    """Build the insert parameters for a pending object.
+
+    The foreign keys of States are resolved from the related pending
+    objects which have already been assigned ids when the row is built.
+    """
+    obj_dict = obj.__dict__
+    params = {column: obj_dict.get(column) for column in columns}
+    if not is_states:
+        return params
+    if (old_state := obj_dict.get("old_state")) is not None:
+        params["old_state_id"] = old_state.__dict__.get("state_id")
+    if (state_attributes := obj_dict.get("state_attributes")) is not None:
+        params["attributes_id"] = state_attributes.__dict__.get("attributes_id")
+    if (states_meta := obj_dict.get("states_meta_rel")) is not None:
+        params["metadata_id"] = states_meta.__dict__.get("metadata_id")
+    return params
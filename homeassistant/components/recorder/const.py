@@ -45,6 +45,10 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READER_PREFIX = "DbReader"
+
+# Seconds a read-only job may wait for a thread of the read executor
+READ_JOB_TIMEOUT = 300
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -58,15 +62,18 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+REF_COUNT_SCHEMA_VERSION = 48
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
+INTEGRATION_PLATFORM_ACCUMULATE_STATISTICS = "accumulate_statistics"
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
 INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES = "update_statistics_issues"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 
 INTEGRATION_PLATFORM_METHODS = {
+    INTEGRATION_PLATFORM_ACCUMULATE_STATISTICS,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
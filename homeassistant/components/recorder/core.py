@@ -50,7 +50,9 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_writer import StatesBulkWriter, bulk_write_supported
 from .const import (
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -61,6 +63,8 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    READ_JOB_TIMEOUT,
+    REF_COUNT_SCHEMA_VERSION,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -77,7 +81,8 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, QueueWaitStats
+from .history.cache import HistoryCache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -87,7 +92,11 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import get_migration_changes
+from .queries import (
+    get_migration_changes,
+    update_event_data_ref_counts,
+    update_state_attributes_ref_counts,
+)
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -120,6 +129,7 @@ from .util import (
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
+    execute_on_connection,
     execute_stmt_lambda_element,
     is_second_sunday,
     move_away_broken_database,
@@ -173,6 +183,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        history_cache_size: int,
+        db_read_workers: int,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -183,6 +195,7 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.db_read_workers = db_read_workers
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -220,6 +233,13 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.states_bulk_writer: StatesBulkWriter | None = None
+        self.statistics_accumulators: dict[
+            str, Callable[[HomeAssistant, Event[EventStateChangedData]], None]
+        ] = {}
+        self.history_cache = (
+            HistoryCache(history_cache_size) if history_cache_size else None
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -229,6 +249,9 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_thread_ids: set[int] = set()
+        self.read_queue_stats = QueueWaitStats()
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -291,6 +314,18 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.db_read_workers:
+            self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+                self.recorder_and_worker_thread_ids,
+                thread_name_prefix=DB_READER_PREFIX,
+                max_workers=self.db_read_workers,
+                shutdown_hook=self._shutdown_pool,
+                initializer=self._setup_read_thread,
+            )
+
+    def _setup_read_thread(self) -> None:
+        """Mark the current thread as a read executor thread."""
+        self._db_read_thread_ids.add(threading.get_ident())
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -365,6 +400,45 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    async def async_add_read_job[_T](
+        self,
+        target: Callable[..., _T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> _T:
+        """Run a read-only job in the read executor and return the result.
+
+        The read executor is separate from the db executor if read workers
+        are configured, so reads for the frontend do not queue behind other
+        database jobs. If no timeout is given, READ_JOB_TIMEOUT applies when
+        read workers are configured. If the timeout expires or the caller is
+        cancelled before the job started, the job is dropped from the queue
+        and TimeoutError is raised. A job which already started runs to
+        completion.
+        """
+        queued = time.monotonic()
+
+        def _run_read_job() -> _T:
+            self.read_queue_stats.add(time.monotonic() - queued)
+            return target(*args)
+
+        if timeout is None and self._db_read_executor:
+            timeout = READ_JOB_TIMEOUT
+        executor = self._db_read_executor or self._db_executor
+        concurrent_future = executor.submit(_run_read_job)
+        future = asyncio.wrap_future(concurrent_future, loop=self.hass.loop)
+        if timeout is None:
+            return await future
+        try:
+            done, _ = await asyncio.wait((future,), timeout=timeout)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        # Cancelling only succeeds if the job did not get a thread yet
+        if not done and concurrent_future.cancel():
+            raise TimeoutError
+        return await future
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -699,6 +773,20 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_states_row(
+        self, session: Session, obj: States | StateAttributes | StatesMeta
+    ) -> None:
+        """Add a states, state_attributes or states_meta row.
+
+        When the database supports it, the rows are kept out of the
+        session and written with multi-row inserts at commit time.
+        """
+        if (states_bulk_writer := self.states_bulk_writer) is None:
+            self._add_to_session(session, obj)
+            return
+        self._event_session_has_pending_writes = True
+        states_bulk_writer.add(obj)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -1027,6 +1115,8 @@ class Recorder(threading.Thread):
             return
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
+            for accumulate_statistics in self.statistics_accumulators.values():
+                accumulate_statistics(self.hass, event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
@@ -1061,18 +1151,25 @@ class Recorder(threading.Thread):
 
         # Map the event data to the EventData table
         shared_data = shared_data_bytes.decode("utf-8")
+        count_refs = self.schema_version >= REF_COUNT_SCHEMA_VERSION
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
             dbevent.event_data_rel = pending_event_data
+            if count_refs:
+                pending_event_data.ref_count += 1  # type: ignore[operator]
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            if count_refs:
+                event_data_manager.add_reference(data_id)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+            if count_refs:
+                dbevent_data.ref_count = 1
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
@@ -1132,15 +1229,18 @@ class Recorder(threading.Thread):
         else:
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
+            self._add_states_row(session, states_meta)
             dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
         dbstate.attributes = None
+        count_refs = self.schema_version >= REF_COUNT_SCHEMA_VERSION
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
+            if count_refs:
+                pending_event_data.ref_count += 1  # type: ignore[operator]
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
@@ -1153,14 +1253,20 @@ class Recorder(threading.Thread):
             )
         ):
             dbstate.attributes_id = attributes_id
+            if count_refs:
+                state_attributes_manager.add_reference(attributes_id)
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            if count_refs:
+                dbstate_attributes.ref_count = 1
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
+            self._add_states_row(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_states_row(session, dbstate)
+        if self.history_cache and states_meta_manager.active:
+            self.history_cache.add_pending(dbstate, shared_attrs)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1184,6 +1290,17 @@ class Recorder(threading.Thread):
         """Commit the event session if there is work to do."""
         if not self._event_session_has_pending_writes:
             return
+        if self.states_bulk_writer:
+            assert self.event_session is not None
+            try:
+                self.states_bulk_writer.write(self.event_session)
+            except Exception:
+                # The rows inserted before the failure are still part
+                # of the transaction so the write cannot be retried.
+                # Discard the session like the ORM does when a flush
+                # fails and let the caller handle the error.
+                self._reopen_event_session()
+                raise
         tries = 1
         while tries <= self.db_max_retries:
             try:
@@ -1223,6 +1340,8 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self.schema_version >= REF_COUNT_SCHEMA_VERSION:
+            self._write_pending_references(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1230,11 +1349,17 @@ class Recorder(threading.Thread):
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
+        if self.history_cache:
+            self.history_cache.post_commit_pending(
+                self.states_manager.get_pending_last_reported_timestamp()
+            )
         self.states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        if self.states_bulk_writer:
+            self.states_bulk_writer.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1243,6 +1368,26 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _write_pending_references(self, session: Session) -> None:
+        """Add the new references to committed attributes and event data to their ref_count."""
+        connection = session.connection()
+        if pending_references := self.state_attributes_manager.get_pending_references():
+            connection.execute(
+                update_state_attributes_ref_counts(),
+                [
+                    {"b_attributes_id": attributes_id, "b_count": count}
+                    for attributes_id, count in pending_references.items()
+                ],
+            )
+        if pending_references := self.event_data_manager.get_pending_references():
+            connection.execute(
+                update_event_data_ref_counts(),
+                [
+                    {"b_data_id": data_id, "b_count": count}
+                    for data_id, count in pending_references.items()
+                ],
+            )
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1263,6 +1408,10 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self.states_bulk_writer:
+            self.states_bulk_writer.reset()
+        if self.history_cache:
+            self.history_cache.reset()
 
         if not self.event_session:
             return
@@ -1282,6 +1431,11 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        assert self.engine is not None
+        if bulk_write_supported(dialect := self.engine.dialect):
+            self.states_bulk_writer = StatesBulkWriter(self.max_bind_vars, dialect)
+        else:
+            self.states_bulk_writer = None
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
@@ -1376,6 +1530,14 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if (
+            self._using_file_sqlite
+            and threading.get_ident() in self._db_read_thread_ids
+        ):
+            # Each thread has its own SQLite connection, so the connections
+            # of the read executor can be made read-only. They read from
+            # the WAL concurrently with the writer.
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1392,6 +1554,7 @@ class Recorder(threading.Thread):
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
+            kwargs["pool_size"] = POOL_SIZE + self.db_read_workers
         elif self.db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
@@ -1413,6 +1576,10 @@ class Recorder(threading.Thread):
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
+            if self.db_read_workers:
+                # Keep a pooled connection for the recorder, the db executor
+                # and the read executor threads
+                kwargs["pool_size"] = POOL_SIZE + self.db_read_workers
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1424,7 +1591,9 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
-        Base.metadata.create_all(self.engine)
+        Base.metadata.create_all(
+            self.engine, migration.get_tables_to_create(self.engine)
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1479,13 +1648,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
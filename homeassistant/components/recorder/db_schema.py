@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,9 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
+TABLE_STATISTICS_ROLLUP_RUNS = "statistics_rollup_runs"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +119,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
+    TABLE_STATISTICS_ROLLUP_RUNS,
 ]
 
 TABLES_TO_CHECK = [
@@ -361,6 +367,8 @@ class EventData(Base):
     shared_data: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The number of events referencing the row, None if it is unknown
+    ref_count: Mapped[int | None] = mapped_column(BigInteger)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -586,6 +594,8 @@ class StateAttributes(Base):
     shared_attrs: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The number of states referencing the row, None if it is unknown
+    ref_count: Mapped[int | None] = mapped_column(BigInteger)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -745,6 +755,42 @@ class Statistics(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS
 
 
+class StatisticsDaily(Base, StatisticsBase):
+    """Long term statistics rolled up per local day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsBase):
+    """Long term statistics rolled up per local month."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class _StatisticsShortTerm(StatisticsBase):
     """Short term statistics."""
 
@@ -903,6 +949,26 @@ class StatisticsRuns(Base):
         )
 
 
+class StatisticsRollupRuns(Base):
+    """Representation of the period covered by a statistics rollup table."""
+
+    __tablename__ = TABLE_STATISTICS_ROLLUP_RUNS
+    __table_args__ = (_DEFAULT_TABLE_ARGS,)
+
+    period: Mapped[str] = mapped_column(String(16), primary_key=True)
+    time_zone: Mapped[str | None] = mapped_column(String(64))
+    start_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatisticsRollupRuns(period='{self.period}',"
+            f" time_zone='{self.time_zone}', start_ts={self.start_ts},"
+            f" end_ts={self.end_ts})>"
+        )
+
+
 EVENT_DATA_JSON = type_coerce(
     EventData.shared_data.cast(JSONB_VARIANT_CAST), JSONLiteral(none_as_null=True)
 )
@@ -11,6 +11,34 @@ import weakref
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
 
+class QueueWaitStats:
+    """Track how long jobs wait for a thread of a database executor."""
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self._lock = threading.Lock()
+        self.jobs = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def add(self, wait: float) -> None:
+        """Add the time a job waited before it started."""
+        with self._lock:
+            self.jobs += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue wait counters in milliseconds."""
+        with self._lock:
+            average_wait = self.total_wait / self.jobs if self.jobs else 0.0
+            return {
+                "read_jobs": self.jobs,
+                "read_queue_wait_average": round(average_wait * 1000, 1),
+                "read_queue_wait_max": round(self.max_wait * 1000, 1),
+            }
+
+
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None],
     recorder_and_worker_thread_ids: set[int],
@@ -0,0 +1,457 @@
+"""In-memory cache of recently recorded states for history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, NamedTuple
+
+from ..db_schema import States
+
+# How far back the cache keeps states
+CACHE_WINDOW = 86400
+# How far the window may lag behind before it is trimmed
+CACHE_WINDOW_SLACK = 300
+# When the cache is over its row limit, drop this share of the window
+TRIM_RATIO = 0.1
+
+
+class CachedStateRow(NamedTuple):
+    """A cached state in the same shape as a history query row."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    last_reported_ts: float | None
+    attributes: str | None
+
+
+@dataclass(slots=True)
+class HistoryCacheResult:
+    """States served from the history cache.
+
+    If cutoff_ts is set, only the states at or after cutoff_ts were
+    served from the cache and the caller must fetch the states before
+    cutoff_ts (including the start time states) from the database.
+    """
+
+    cutoff_ts: float | None
+    rows: dict[int, list[CachedStateRow]]
+
+
+class _EntityHistory:
+    """Columnar storage of the recent states of a single metadata_id.
+
+    Timestamps that are None in the database are stored as 0.
+    """
+
+    __slots__ = (
+        "attributes_id",
+        "last_changed_ts",
+        "last_reported_ts",
+        "last_state_id",
+        "last_updated_ts",
+        "state_idx",
+        "state_to_idx",
+        "states",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        self.last_reported_ts = array("d")
+        self.attributes_id = array("q")
+        self.state_idx = array("I")
+        self.states: list[str | None] = []
+        self.state_to_idx: dict[str | None, int] = {}
+        self.last_state_id: int | None = None
+
+    def insert(
+        self,
+        state_id: int | None,
+        last_updated_ts: float,
+        last_changed_ts: float,
+        last_reported_ts: float,
+        attributes_id: int,
+        state: str | None,
+    ) -> bool:
+        """Insert a state keeping the columns sorted by last_updated_ts.
+
+        Returns True if the state is the latest state.
+        """
+        if (state_idx := self.state_to_idx.get(state)) is None:
+            state_idx = self.state_to_idx[state] = len(self.states)
+            self.states.append(state)
+        columns = self.last_updated_ts
+        if not columns or columns[-1] <= last_updated_ts:
+            columns.append(last_updated_ts)
+            self.last_changed_ts.append(last_changed_ts)
+            self.last_reported_ts.append(last_reported_ts)
+            self.attributes_id.append(attributes_id)
+            self.state_idx.append(state_idx)
+            self.last_state_id = state_id
+            return True
+        # Out of order states are rare, so the cost of inserting
+        # in the middle of the arrays is acceptable.
+        idx = bisect_right(columns, last_updated_ts)
+        columns.insert(idx, last_updated_ts)
+        self.last_changed_ts.insert(idx, last_changed_ts)
+        self.last_reported_ts.insert(idx, last_reported_ts)
+        self.attributes_id.insert(idx, attributes_id)
+        self.state_idx.insert(idx, state_idx)
+        return False
+
+    def trim_before(self, cutoff_ts: float) -> array[int]:
+        """Remove the states before cutoff_ts and return their attributes_ids."""
+        if not (idx := bisect_left(self.last_updated_ts, cutoff_ts)):
+            return array("q")
+        removed_attributes_ids = self.attributes_id[:idx]
+        del self.last_updated_ts[:idx]
+        del self.last_changed_ts[:idx]
+        del self.last_reported_ts[:idx]
+        del self.attributes_id[:idx]
+        del self.state_idx[:idx]
+        return removed_attributes_ids
+
+
+class HistoryCache:
+    """Cache the states the recorder committed within the last day.
+
+    Every state the recorder commits with a last_updated_ts at or after
+    covered_from_ts is in the cache, so history queries for periods
+    after covered_from_ts can be answered without the database, and
+    queries that start before it only need the database up to
+    covered_from_ts.
+
+    The cache is written from the recorder thread and read from
+    the database executor threads.
+    """
+
+    def __init__(self, max_rows: int) -> None:
+        """Initialize the history cache."""
+        self.max_rows = max_rows
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending: list[tuple[States, str | None]] = []
+        self._entities: dict[int, _EntityHistory] = {}
+        self._metadata_id_by_last_state_id: dict[int, int] = {}
+        self._shared_attrs: dict[int, str] = {}
+        self._shared_attrs_refs: Counter[int] = Counter()
+        self._rows = 0
+        self.covered_from_ts = time.time()
+
+    @property
+    def rows(self) -> int:
+        """Return the number of cached states."""
+        return self._rows
+
+    def add_pending(self, dbstate: States, shared_attrs: str | None) -> None:
+        """Add a state that will be cached once it is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append((dbstate, shared_attrs))
+
+    def post_commit_pending(self, pending_last_reported: dict[int, float]) -> None:
+        """Call after commit to move the committed states into the cache.
+
+        pending_last_reported maps the state_id of previously committed
+        states to the last_reported_ts that was updated in the commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        now = time.time()
+        with self._lock:
+            self._update_last_reported(pending_last_reported)
+            for dbstate, shared_attrs in self._pending:
+                self._insert(dbstate, shared_attrs)
+            if self.covered_from_ts < now - CACHE_WINDOW - CACHE_WINDOW_SLACK:
+                self._trim_before(now - CACHE_WINDOW)
+            while self._rows > self.max_rows:
+                covered_from_ts = self.covered_from_ts
+                self._trim_before(
+                    covered_from_ts + max(now - covered_from_ts, 1) * TRIM_RATIO
+                )
+        self._pending.clear()
+
+    def _update_last_reported(self, pending_last_reported: dict[int, float]) -> None:
+        """Update the last_reported_ts of the latest state of entities."""
+        for state_id, last_reported_ts in pending_last_reported.items():
+            if (
+                (metadata_id := self._metadata_id_by_last_state_id.get(state_id))
+                is not None
+                and (entity := self._entities.get(metadata_id)) is not None
+                and entity.last_state_id == state_id
+            ):
+                entity.last_reported_ts[-1] = last_reported_ts
+
+    def _insert(self, dbstate: States, shared_attrs: str | None) -> None:
+        """Insert a committed state."""
+        if (
+            last_updated_ts := dbstate.last_updated_ts
+        ) is None or last_updated_ts < self.covered_from_ts:
+            return
+        if (metadata_id := dbstate.metadata_id) is None and (
+            states_meta := dbstate.states_meta_rel
+        ) is not None:
+            metadata_id = states_meta.metadata_id
+        if metadata_id is None:
+            return
+        if (attributes_id := dbstate.attributes_id) is None and (
+            state_attributes := dbstate.state_attributes
+        ) is not None:
+            attributes_id = state_attributes.attributes_id
+        if attributes_id is None or shared_attrs is None:
+            attributes_id = 0
+        else:
+            self._shared_attrs.setdefault(attributes_id, shared_attrs)
+            self._shared_attrs_refs[attributes_id] += 1
+        if (entity := self._entities.get(metadata_id)) is None:
+            entity = self._entities[metadata_id] = _EntityHistory()
+        previous_last_state_id = entity.last_state_id
+        if entity.insert(
+            state_id := dbstate.state_id,
+            last_updated_ts,
+            dbstate.last_changed_ts or 0,
+            dbstate.last_reported_ts or 0,
+            attributes_id,
+            dbstate.state,
+        ):
+            if previous_last_state_id is not None:
+                self._metadata_id_by_last_state_id.pop(previous_last_state_id, None)
+            if state_id is not None:
+                self._metadata_id_by_last_state_id[state_id] = metadata_id
+        self._rows += 1
+
+    def _release_attributes_ids(self, attributes_ids: Iterable[int]) -> None:
+        """Release the shared attributes of removed states."""
+        shared_attrs_refs = self._shared_attrs_refs
+        for attributes_id in attributes_ids:
+            if not attributes_id:
+                continue
+            shared_attrs_refs[attributes_id] -= 1
+            if not shared_attrs_refs[attributes_id]:
+                del shared_attrs_refs[attributes_id]
+                del self._shared_attrs[attributes_id]
+
+    def _trim_entity_before(self, metadata_id: int, cutoff_ts: float) -> None:
+        """Remove the states of an entity before cutoff_ts."""
+        if (entity := self._entities.get(metadata_id)) is None:
+            return
+        removed_attributes_ids = entity.trim_before(cutoff_ts)
+        self._rows -= len(removed_attributes_ids)
+        self._release_attributes_ids(removed_attributes_ids)
+        if entity.last_updated_ts:
+            return
+        del self._entities[metadata_id]
+        if entity.last_state_id is not None:
+            self._metadata_id_by_last_state_id.pop(entity.last_state_id, None)
+
+    def _trim_before(self, cutoff_ts: float) -> None:
+        """Remove all states before cutoff_ts and advance the covered window."""
+        if cutoff_ts <= self.covered_from_ts:
+            return
+        self.covered_from_ts = cutoff_ts
+        for metadata_id in list(self._entities):
+            self._trim_entity_before(metadata_id, cutoff_ts)
+
+    def evict_purged_before(self, purge_before_ts: float) -> None:
+        """Evict the states that were purged from the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            self._trim_before(purge_before_ts)
+
+    def evict_purged_entity_states(
+        self, metadata_ids: Iterable[int], purge_before_ts: float
+    ) -> None:
+        """Evict the states of metadata_ids that were purged from the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            for metadata_id in metadata_ids:
+                self._trim_entity_before(metadata_id, purge_before_ts)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+        with self._lock:
+            self._entities.clear()
+            self._metadata_id_by_last_state_id.clear()
+            self._shared_attrs.clear()
+            self._shared_attrs_refs.clear()
+            self._rows = 0
+            self.covered_from_ts = time.time()
+
+    def get_states(
+        self,
+        metadata_ids: list[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        *,
+        significant_metadata_ids: set[int] | None,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+        no_attributes: bool,
+        include_last_changed: bool,
+        include_last_reported: bool,
+        limit: int | None = None,
+    ) -> HistoryCacheResult | None:
+        """Get the states of metadata_ids in the period from the cache.
+
+        The rows match what the history queries select from the database.
+        If significant_metadata_ids is not None, only significant changes
+        are returned, where all changes of significant_metadata_ids are
+        significant. If run_start_ts is set, start time states before
+        run_start_ts are not returned.
+
+        Returns None if the cache cannot serve the period.
+
+        This call is thread-safe.
+        """
+        with self._lock:
+            covered_from_ts = self.covered_from_ts
+            if end_time_ts and end_time_ts <= covered_from_ts:
+                self.misses += 1
+                return None
+            cutoff_ts: float | None = None
+            if start_time_ts < covered_from_ts:
+                cutoff_ts = covered_from_ts
+            elif include_start_time_state and (
+                run_start_ts is None or run_start_ts < covered_from_ts
+            ):
+                # The start time state of an entity that has no cached
+                # state before the start time is in the database.
+                for metadata_id in metadata_ids:
+                    if not (entity := self._entities.get(metadata_id)) or (
+                        entity.last_updated_ts[0] >= start_time_ts
+                    ):
+                        cutoff_ts = covered_from_ts
+                        break
+            if cutoff_ts is not None and limit:
+                self.misses += 1
+                return None
+            rows = {
+                metadata_id: entity_rows
+                for metadata_id in metadata_ids
+                if (entity := self._entities.get(metadata_id))
+                and (
+                    entity_rows := self._entity_rows(
+                        metadata_id,
+                        entity,
+                        start_time_ts,
+                        end_time_ts,
+                        significant_metadata_ids is not None
+                        and metadata_id not in significant_metadata_ids,
+                        include_start_time_state and cutoff_ts is None,
+                        run_start_ts,
+                        no_attributes,
+                        include_last_changed,
+                        include_last_reported,
+                        limit,
+                    )
+                )
+            }
+            if cutoff_ts is None:
+                self.hits += 1
+            else:
+                self.partial_hits += 1
+        return HistoryCacheResult(cutoff_ts, rows)
+
+    def _entity_rows(
+        self,
+        metadata_id: int,
+        entity: _EntityHistory,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+        no_attributes: bool,
+        include_last_changed: bool,
+        include_last_reported: bool,
+        limit: int | None,
+    ) -> list[CachedStateRow]:
+        """Return the rows for a single entity."""
+        last_updated_ts = entity.last_updated_ts
+        last_changed_ts = entity.last_changed_ts
+        last_reported_ts = entity.last_reported_ts
+        attributes_id = entity.attributes_id
+        state_idx = entity.state_idx
+        states = entity.states
+        shared_attrs = self._shared_attrs
+        start_idx = bisect_right(last_updated_ts, start_time_ts)
+        end_idx = (
+            bisect_left(last_updated_ts, end_time_ts)
+            if end_time_ts
+            else len(last_updated_ts)
+        )
+        rows: list[CachedStateRow] = []
+        start_state_idx = bisect_left(last_updated_ts, start_time_ts) - 1
+        if (
+            include_start_time_state
+            and start_state_idx >= 0
+            and (
+                run_start_ts is None or last_updated_ts[start_state_idx] >= run_start_ts
+            )
+        ):
+            rows.append(
+                CachedStateRow(
+                    metadata_id,
+                    states[state_idx[start_state_idx]],
+                    0,
+                    0 if include_last_changed else None,
+                    0 if include_last_reported else None,
+                    None
+                    if no_attributes
+                    else shared_attrs.get(attributes_id[start_state_idx]),
+                )
+            )
+        found = 0
+        for idx in range(start_idx, end_idx):
+            updated_ts = last_updated_ts[idx]
+            changed_ts = last_changed_ts[idx]
+            if significant_changes_only and changed_ts and changed_ts != updated_ts:
+                continue
+            rows.append(
+                CachedStateRow(
+                    metadata_id,
+                    states[state_idx[idx]],
+                    updated_ts,
+                    (changed_ts or None) if include_last_changed else None,
+                    (last_reported_ts[idx] or None) if include_last_reported else None,
+                    None if no_attributes else shared_attrs.get(attributes_id[idx]),
+                )
+            )
+            found += 1
+            if limit and found >= limit:
+                break
+        return rows
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache counters."""
+        return {
+            "history_cache_rows": self._rows,
+            "history_cache_hits": self.hits,
+            "history_cache_partial_hits": self.partial_hits,
+            "history_cache_misses": self.misses,
+        }
@@ -38,6 +38,7 @@ from ..models import (
     row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
+from .cache import CachedStateRow, HistoryCacheResult
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -254,29 +255,58 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
-        lambda: _significant_states_stmt(
+    cached: HistoryCacheResult | None = None
+    if history_cache := instance.history_cache:
+        cached = history_cache.get_states(
+            metadata_ids,
             start_time_ts,
             end_time_ts,
-            single_metadata_id,
-            metadata_ids,
-            metadata_ids_in_significant_domains,
-            significant_changes_only,
-            no_attributes,
-            include_start_time_state,
-            run_start_ts,
-        ),
-        track_on=[
-            bool(single_metadata_id),
-            bool(metadata_ids_in_significant_domains),
-            bool(end_time_ts),
-            significant_changes_only,
-            no_attributes,
-            include_start_time_state,
-        ],
-    )
+            significant_metadata_ids=set(metadata_ids_in_significant_domains)
+            if significant_changes_only
+            else None,
+            include_start_time_state=include_start_time_state,
+            # The start time state of a single entity is not limited
+            # to the current run
+            run_start_ts=None if single_metadata_id else run_start_ts,
+            no_attributes=no_attributes,
+            include_last_changed=not significant_changes_only,
+            include_last_reported=False,
+        )
+    rows: Iterable[Row | CachedStateRow]
+    if cached and cached.cutoff_ts is None:
+        rows = _merge_cached_rows((), cached.rows)
+    else:
+        if cached:
+            # Only the states before the cutoff are not in the cache
+            end_time_ts = cached.cutoff_ts
+        stmt = lambda_stmt(
+            lambda: _significant_states_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+                run_start_ts,
+            ),
+            track_on=[
+                bool(single_metadata_id),
+                bool(metadata_ids_in_significant_domains),
+                bool(end_time_ts),
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+            ],
+        )
+        rows = execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False
+        )
+        if cached:
+            rows = _merge_cached_rows(rows, cached.rows)
     return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        rows,
         start_time_ts if include_start_time_state else None,
         entity_ids,
         entity_id_to_metadata_id,
@@ -418,31 +448,55 @@ def state_changes_during_period(
             include_start_time_state = False
         start_time_ts = dt_util.utc_to_timestamp(start_time)
         end_time_ts = datetime_to_timestamp_or_none(end_time)
-        stmt = lambda_stmt(
-            lambda: _state_changed_during_period_stmt(
+        cached: HistoryCacheResult | None = None
+        if history_cache := instance.history_cache:
+            cached = history_cache.get_states(
+                [single_metadata_id],
                 start_time_ts,
                 end_time_ts,
-                single_metadata_id,
-                no_attributes,
-                limit,
-                include_start_time_state,
-                run_start_ts,
-                has_last_reported,
-            ),
-            track_on=[
-                bool(end_time_ts),
-                no_attributes,
-                bool(limit),
-                include_start_time_state,
-                has_last_reported,
-            ],
-        )
+                significant_metadata_ids=set(),
+                include_start_time_state=include_start_time_state,
+                run_start_ts=None,
+                no_attributes=no_attributes,
+                include_last_changed=False,
+                include_last_reported=has_last_reported,
+                limit=limit,
+            )
+        rows: Iterable[Row | CachedStateRow]
+        if cached and cached.cutoff_ts is None:
+            rows = _merge_cached_rows((), cached.rows)
+        else:
+            if cached:
+                # Only the states before the cutoff are not in the cache
+                end_time_ts = cached.cutoff_ts
+            stmt = lambda_stmt(
+                lambda: _state_changed_during_period_stmt(
+                    start_time_ts,
+                    end_time_ts,
+                    single_metadata_id,
+                    no_attributes,
+                    limit,
+                    include_start_time_state,
+                    run_start_ts,
+                    has_last_reported,
+                ),
+                track_on=[
+                    bool(end_time_ts),
+                    no_attributes,
+                    bool(limit),
+                    include_start_time_state,
+                    has_last_reported,
+                ],
+            )
+            rows = execute_stmt_lambda_element(
+                session, stmt, None, end_time, orm_rows=False
+            )
+            if cached:
+                rows = _merge_cached_rows(rows, cached.rows)
         return cast(
             dict[str, list[State]],
             _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
+                rows,
                 start_time_ts if include_start_time_state else None,
                 entity_ids,
                 entity_id_to_metadata_id,
@@ -671,8 +725,27 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _merge_cached_rows(
+    db_rows: Iterable[Row], cached_rows: dict[int, list[CachedStateRow]]
+) -> list[Row | CachedStateRow]:
+    """Merge the database rows before the cache cutoff with the cached rows.
+
+    The rows are returned sorted by metadata_id and last_updated_ts.
+    """
+    rows_by_metadata_id: dict[int, list[Row | CachedStateRow]] = {}
+    for row in db_rows:
+        rows_by_metadata_id.setdefault(row[0], []).append(row)
+    for metadata_id, entity_rows in cached_rows.items():
+        rows_by_metadata_id.setdefault(metadata_id, []).extend(entity_rows)
+    return [
+        row
+        for metadata_id in sorted(rows_by_metadata_id)
+        for row in rows_by_metadata_id[metadata_id]
+    ]
+
+
 def _sorted_states_to_dict(
-    states: Iterable[Row],
+    states: Iterable[Row | CachedStateRow],
     start_time_ts: float | None,
     entity_ids: list[str],
     entity_id_to_metadata_id: dict[str, int | None],
@@ -65,7 +65,11 @@ from .db_schema import (
     MYSQL_DEFAULT_CHARSET,
     SCHEMA_VERSION,
     STATISTICS_TABLES,
+    TABLE_EVENTS,
     TABLE_STATES,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
+    TABLE_STATISTICS_ROLLUP_RUNS,
     Base,
     Events,
     EventTypes,
@@ -75,7 +79,10 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -118,6 +125,8 @@ if TYPE_CHECKING:
 # Schema version 42 was introduced in HA Core 2023.11
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 42
 
+REF_COUNT_BACKFILL_BATCH_SIZE = 10000
+
 MIGRATION_NOTE_OFFLINE = (
     "Note: this may take several hours on large databases and slow machines. "
     "Home Assistant will not start until the upgrade is completed. Please be patient "
@@ -271,6 +280,27 @@ def pre_migrate_schema(engine: Engine) -> None:
         )
 
 
+# Tables an existing database only gets from the migration to the schema version
+# which added them. Creating them up front could fail, as the foreign key columns
+# they reference may not have been migrated to their current type yet.
+_TABLES_CREATED_BY_MIGRATION = (
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
+    TABLE_STATISTICS_ROLLUP_RUNS,
+)
+
+
+def get_tables_to_create(engine: Engine) -> list[Table]:
+    """Return the tables to create before migrating.
+
+    A new database is created with all tables.
+    """
+    tables = Base.metadata.sorted_tables
+    if not sqlalchemy.inspect(engine).has_table(TABLE_EVENTS):
+        return tables
+    return [table for table in tables if table.name not in _TABLES_CREATED_BY_MIGRATION]
+
+
 def _migrate_schema(
     instance: Recorder,
     hass: HomeAssistant,
@@ -1758,6 +1788,75 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        for table, id_column, referencing_table in (
+            ("state_attributes", "attributes_id", "states"),
+            ("event_data", "data_id", "events"),
+        ):
+            _add_columns(
+                self.session_maker,
+                table,
+                [f"ref_count {self.column_types.big_int_type}"],
+            )
+            _backfill_ref_counts(
+                self.instance,
+                self.session_maker,
+                table,
+                id_column,
+                referencing_table,
+            )
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics rollup tables reference statistics_meta, so they are
+        # only created once its id column has been migrated to a big integer
+        for table in (StatisticsDaily, StatisticsMonthly, StatisticsRollupRuns):
+            # We need to cast __table__ to Table, explanation in
+            # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+            cast(Table, table.__table__).create(self.engine, checkfirst=True)
+
+
+@database_job_retry_wrapper("Backfill ref counts", 3)
+def _backfill_ref_counts(
+    instance: Recorder,
+    session_maker: Callable[[], Session],
+    table: str,
+    id_column: str,
+    referencing_table: str,
+) -> None:
+    """Count the rows referencing each row of a table.
+
+    The rows are counted in id ranges so the transactions stay small
+    on large databases.
+    """
+    with session_scope(session=session_maker()) as session:
+        max_id = (
+            session.connection()
+            .execute(text(f"SELECT MAX({id_column}) FROM {table}"))  # noqa: S608
+            .scalar()
+        )
+    if max_id is None:
+        return
+    for start_id in range(0, max_id + 1, REF_COUNT_BACKFILL_BATCH_SIZE):
+        with session_scope(session=session_maker()) as session:
+            session.connection().execute(
+                text(
+                    f"UPDATE {table} SET ref_count = ("  # noqa: S608
+                    f"SELECT COUNT(*) FROM {referencing_table} "
+                    f"WHERE {referencing_table}.{id_column} = {table}.{id_column}"
+                    f") WHERE {id_column} >= :start_id AND {id_column} < :end_id"
+                ),
+                {
+                    "start_id": start_id,
+                    "end_id": start_id + REF_COUNT_BACKFILL_BATCH_SIZE,
+                },
+            )
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
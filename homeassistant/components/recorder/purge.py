@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
 from typing import TYPE_CHECKING
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from .const import REF_COUNT_SCHEMA_VERSION
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -30,6 +32,8 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    find_attributes_ids_ref_counts_for_state_ids,
+    find_data_ids_ref_counts_for_event_ids,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -40,6 +44,10 @@ from .queries import (
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unreferenced_attributes_ids,
+    find_unreferenced_data_ids,
+    update_event_data_ref_counts,
+    update_state_attributes_ref_counts,
 )
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
@@ -93,6 +101,9 @@ def purge_old_data(
                 instance, session, events_batch_size, purge_before
             )
 
+        if history_cache := instance.history_cache:
+            history_cache.evict_purged_before(purge_before.timestamp())
+
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
@@ -147,7 +158,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_event_ids(instance, session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -234,7 +245,7 @@ def _purge_events_and_data_ids(
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(instance, session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -361,6 +372,45 @@ def _select_unused_attributes_ids(
     return to_remove
 
 
+def _release_attributes_ids_references(
+    instance: Recorder,
+    session: Session,
+    ref_counts: Sequence[Row[tuple[int | None, int]]],
+) -> set[int]:
+    """Subtract the states about to be purged from the ref_count of their attributes.
+
+    Returns the attributes ids referenced by the states.
+    """
+    attributes_ids = {
+        attributes_id for attributes_id, _ in ref_counts if attributes_id is not None
+    }
+    if attributes_ids and instance.schema_version >= REF_COUNT_SCHEMA_VERSION:
+        session.connection().execute(
+            update_state_attributes_ref_counts(),
+            [
+                {"b_attributes_id": attributes_id, "b_count": -count}
+                for attributes_id, count in ref_counts
+                if attributes_id is not None
+            ],
+        )
+    return attributes_ids
+
+
+def _select_unreferenced_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> set[int]:
+    """Return the attributes ids whose ref_count dropped to zero or is unknown."""
+    unreferenced_ids: set[int] = set()
+    for attributes_ids_chunk in chunked_or_all(attributes_ids, instance.max_bind_vars):
+        unreferenced_ids.update(
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_unreferenced_attributes_ids(attributes_ids_chunk)
+            )
+        )
+    return unreferenced_ids
+
+
 def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
@@ -369,6 +419,12 @@ def _purge_unused_attributes_ids(
     """Purge unused attributes ids."""
     database_engine = instance.database_engine
     assert database_engine is not None
+    if instance.schema_version >= REF_COUNT_SCHEMA_VERSION:
+        # Only the attributes which are no longer referenced according to
+        # their ref_count have to be confirmed against the states table
+        attributes_ids_batch = _select_unreferenced_attributes_ids(
+            instance, session, attributes_ids_batch
+        )
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
@@ -411,11 +467,53 @@ def _select_unused_event_data_ids(
     return to_remove
 
 
+def _release_data_ids_references(
+    instance: Recorder,
+    session: Session,
+    ref_counts: Sequence[Row[tuple[int | None, int]]],
+) -> set[int]:
+    """Subtract the events about to be purged from the ref_count of their data.
+
+    Returns the data ids referenced by the events.
+    """
+    data_ids = {data_id for data_id, _ in ref_counts if data_id is not None}
+    if data_ids and instance.schema_version >= REF_COUNT_SCHEMA_VERSION:
+        session.connection().execute(
+            update_event_data_ref_counts(),
+            [
+                {"b_data_id": data_id, "b_count": -count}
+                for data_id, count in ref_counts
+                if data_id is not None
+            ],
+        )
+    return data_ids
+
+
+def _select_unreferenced_data_ids(
+    instance: Recorder, session: Session, data_ids: set[int]
+) -> set[int]:
+    """Return the event data ids whose ref_count dropped to zero or is unknown."""
+    unreferenced_ids: set[int] = set()
+    for data_ids_chunk in chunked_or_all(data_ids, instance.max_bind_vars):
+        unreferenced_ids.update(
+            data_id
+            for (data_id,) in session.execute(
+                find_unreferenced_data_ids(data_ids_chunk)
+            )
+        )
+    return unreferenced_ids
+
+
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
 ) -> None:
     database_engine = instance.database_engine
     assert database_engine is not None
+    if instance.schema_version >= REF_COUNT_SCHEMA_VERSION:
+        # See _purge_unused_attributes_ids
+        data_ids_batch = _select_unreferenced_data_ids(
+            instance, session, data_ids_batch
+        )
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
@@ -514,6 +612,12 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     if not state_ids:
         return
 
+    _release_attributes_ids_references(
+        instance,
+        session,
+        session.execute(find_attributes_ids_ref_counts_for_state_ids(state_ids)).all(),
+    )
+
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
     # since some databases (MSSQL) cannot do the ON DELETE SET NULL
@@ -570,10 +674,15 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
+def _purge_event_ids(instance: Recorder, session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
         return
+    _release_data_ids_references(
+        instance,
+        session,
+        session.execute(find_data_ids_ref_counts_for_event_ids(event_ids)).all(),
+    )
     deleted_rows = session.execute(delete_event_rows(event_ids))
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
@@ -640,7 +749,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -676,7 +785,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -702,10 +811,14 @@ def _purge_filtered_states(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
     _purge_state_ids(instance, session, set(state_ids))
+    if history_cache := instance.history_cache:
+        history_cache.evict_purged_entity_states(
+            metadata_ids_to_purge, purge_before_timestamp
+        )
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
-    _purge_event_ids(session, filtered_event_ids)
+    _purge_event_ids(instance, session, filtered_event_ids)
     unused_attribute_ids_set = _select_unused_attributes_ids(
         instance,
         session,
@@ -755,7 +868,7 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
-    _purge_event_ids(session, event_ids_set)
+    _purge_event_ids(instance, session, event_ids_set)
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, set(data_ids), database_engine
     ):
@@ -774,7 +887,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -5,7 +5,18 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    bindparam,
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.sql.dml import Update
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -648,6 +659,76 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def find_attributes_ids_ref_counts_for_state_ids(
+    state_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Count the states to purge by attributes_id."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id, func.count())
+        .filter(States.state_id.in_(state_ids))
+        .group_by(States.attributes_id)
+    )
+
+
+def find_unreferenced_attributes_ids(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find the attributes_ids which may no longer be used by any states."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.attributes_id.in_(attributes_ids))
+        .filter(
+            or_(StateAttributes.ref_count.is_(None), StateAttributes.ref_count <= 0)
+        )
+    )
+
+
+def update_state_attributes_ref_counts() -> Update:
+    """Add b_count to the ref_count of the b_attributes_id row.
+
+    This query is intentionally not a lambda statement as it is
+    executed with many sets of parameters at once.
+    """
+    return (
+        update(StateAttributes)
+        .where(StateAttributes.attributes_id == bindparam("b_attributes_id"))
+        .values(ref_count=StateAttributes.ref_count + bindparam("b_count"))
+    )
+
+
+def find_data_ids_ref_counts_for_event_ids(
+    event_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Count the events to purge by data_id."""
+    return lambda_stmt(
+        lambda: select(Events.data_id, func.count())
+        .filter(Events.event_id.in_(event_ids))
+        .group_by(Events.data_id)
+    )
+
+
+def find_unreferenced_data_ids(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find the data_ids which may no longer be used by any events."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.data_id.in_(data_ids))
+        .filter(or_(EventData.ref_count.is_(None), EventData.ref_count <= 0))
+    )
+
+
+def update_event_data_ref_counts() -> Update:
+    """Add b_count to the ref_count of the b_data_id row.
+
+    This query is intentionally not a lambda statement as it is
+    executed with many sets of parameters at once.
+    """
+    return (
+        update(EventData)
+        .where(EventData.data_id == bindparam("b_data_id"))
+        .values(ref_count=EventData.ref_count + bindparam("b_count"))
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -60,6 +60,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -239,13 +242,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_to_display_unit(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if the statistic must be converted."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -263,6 +265,24 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+    allow_none: bool = True,
+) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+
+    converter, display_unit = conversion
     if allow_none:
         return converter.converter_factory_allow_none(
             from_unit=statistic_unit, to_unit=display_unit
@@ -270,6 +290,25 @@ def _get_statistic_to_display_unit_converter(
     return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
 
 
+def _get_statistic_to_display_unit_batch_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[Sequence[float | None]], list[float | None]] | None:
+    """Prepare a converter of columns from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+
+    converter, display_unit = conversion
+    return converter.converter_factory_batch(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
 def _get_display_to_statistic_unit_converter(
     display_unit: str | None,
     statistic_unit: str | None,
@@ -601,6 +640,7 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        _compile_rollup_statistics(session, end)
 
     session.add(StatisticsRuns(start=start))
 
@@ -1113,6 +1153,242 @@ def _reduce_statistics_per_month(
     )
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StatisticsRollup:
+    """A table of hourly statistics rolled up per local day or month."""
+
+    period: Literal["day", "month"]
+    table: type[StatisticsBase]
+    reduce: Callable[
+        [
+            dict[str, list[StatisticsRow]],
+            set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+        ],
+        dict[str, list[StatisticsRow]],
+    ]
+    ts_factory: Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ]
+    # Number of older periods rolled up each hour until the oldest hourly
+    # statistics are reached
+    backfill_periods: int
+
+
+STATISTICS_ROLLUPS: dict[str, _StatisticsRollup] = {
+    "day": _StatisticsRollup(
+        "day", StatisticsDaily, _reduce_statistics_per_day, reduce_day_ts_factory, 7
+    ),
+    "month": _StatisticsRollup(
+        "month",
+        StatisticsMonthly,
+        _reduce_statistics_per_month,
+        reduce_month_ts_factory,
+        1,
+    ),
+}
+
+_ROLLUP_TYPES: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+    "last_reset",
+    "max",
+    "mean",
+    "min",
+    "state",
+    "sum",
+}
+
+
+def _build_rollup_statistics(
+    session: Session,
+    rollup: _StatisticsRollup,
+    start_ts: float,
+    end_ts: float,
+    metadata_id: int | None = None,
+) -> None:
+    """Roll up the hourly statistics of the periods between start_ts and end_ts.
+
+    start_ts and end_ts must be period boundaries, existing rollup statistics
+    in the range are replaced.
+    """
+    table = rollup.table
+    delete_query = session.query(table).filter(
+        table.start_ts >= start_ts, table.start_ts < end_ts
+    )
+    query = session.query(*QUERY_STATISTICS).filter(
+        Statistics.start_ts >= start_ts, Statistics.start_ts < end_ts
+    )
+    if metadata_id is not None:
+        delete_query = delete_query.filter(table.metadata_id == metadata_id)
+        query = query.filter(Statistics.metadata_id == metadata_id)
+    delete_query.delete(synchronize_session=False)
+
+    # The hourly statistics are reduced exactly like statistics_during_period
+    # does it, so reading a rollup gives the same result as reading the hours
+    hourly: dict[str, list[StatisticsRow]] = {
+        str(meta_id): [
+            {
+                "start": row.start_ts,
+                "mean": row.mean,
+                "min": row.min,
+                "max": row.max,
+                "last_reset": row.last_reset_ts,
+                "state": row.state,
+                "sum": row.sum,
+            }
+            for row in group
+        ]
+        for meta_id, group in groupby(
+            execute(query.order_by(Statistics.metadata_id, Statistics.start_ts)),
+            itemgetter(0),
+        )
+    }
+    if not hourly:
+        return
+    session.add_all(
+        table.from_stats_ts(
+            int(meta_id),
+            {
+                "start_ts": row["start"],
+                "mean": row["mean"],
+                "min": row["min"],
+                "max": row["max"],
+                "last_reset_ts": row["last_reset"],
+                "state": row["state"],
+                "sum": row["sum"],
+            },
+        )
+        for meta_id, rows in rollup.reduce(hourly, _ROLLUP_TYPES).items()
+        for row in rows
+    )
+
+
+def _get_rollup_run(
+    session: Session, rollup: _StatisticsRollup
+) -> StatisticsRollupRuns | None:
+    """Return the run of a rollup if it was built for the current time zone."""
+    run = session.get(StatisticsRollupRuns, rollup.period)
+    if run is None or run.time_zone != str(dt_util.get_default_time_zone()):
+        return None
+    return run
+
+
+def _compile_rollup_statistics(session: Session, end: datetime) -> None:
+    """Roll up the hourly statistics of finished days and months.
+
+    The periods which ended since the last run are rolled up first, then
+    older periods are backfilled a few at a time. The rollups are rebuilt
+    when the time zone is changed.
+    """
+    time_zone = str(dt_util.get_default_time_zone())
+    end_ts = end.timestamp()
+    oldest_ts: float | None = session.query(func.min(Statistics.start_ts)).scalar()
+    for rollup in STATISTICS_ROLLUPS.values():
+        _, period_start_end = rollup.ts_factory()
+        boundary_ts = period_start_end(end_ts)[0]
+        run = session.get(StatisticsRollupRuns, rollup.period)
+        if run is None:
+            run = StatisticsRollupRuns(
+                period=rollup.period,
+                time_zone=time_zone,
+                start_ts=boundary_ts,
+                end_ts=boundary_ts,
+            )
+            session.add(run)
+        elif run.time_zone != time_zone:
+            _LOGGER.debug("Time zone changed, rebuilding %s rollups", rollup.period)
+            session.query(rollup.table).delete(synchronize_session=False)
+            run.time_zone = time_zone
+            run.start_ts = run.end_ts = boundary_ts
+
+        if run.end_ts < boundary_ts:
+            _build_rollup_statistics(session, rollup, run.end_ts, boundary_ts)
+            run.end_ts = boundary_ts
+
+        if oldest_ts is None or oldest_ts >= run.start_ts:
+            continue
+        backfill_start_ts = run.start_ts
+        for _ in range(rollup.backfill_periods):
+            backfill_start_ts = period_start_end(backfill_start_ts - 1)[0]
+            if backfill_start_ts <= oldest_ts:
+                break
+        _LOGGER.debug(
+            "Backfilling %s rollups for %s-%s",
+            rollup.period,
+            dt_util.utc_from_timestamp(backfill_start_ts),
+            dt_util.utc_from_timestamp(run.start_ts),
+        )
+        _build_rollup_statistics(session, rollup, backfill_start_ts, run.start_ts)
+        run.start_ts = backfill_start_ts
+
+
+def _rebuild_rollup_statistics(
+    session: Session, metadata_id: int, start_ts: float
+) -> None:
+    """Rebuild the rollups of a statistic after its hourly statistics changed."""
+    for rollup in STATISTICS_ROLLUPS.values():
+        if (run := _get_rollup_run(session, rollup)) is None or start_ts >= run.end_ts:
+            continue
+        _, period_start_end = rollup.ts_factory()
+        _build_rollup_statistics(
+            session,
+            rollup,
+            max(period_start_end(start_ts)[0], run.start_ts),
+            run.end_ts,
+            metadata_id,
+        )
+
+
+def _get_statistics_during_period_with_rollup(
+    session: Session,
+    rollup: _StatisticsRollup,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Sequence[Row]:
+    """Fetch statistics, reading the rollup instead of the hours it covers.
+
+    start_time and end_time must be aligned with the period of the rollup.
+    """
+    start_ts = start_time.timestamp()
+    end_ts = end_time.timestamp() if end_time is not None else None
+    if (
+        (run := _get_rollup_run(session, rollup)) is None
+        or run.start_ts >= run.end_ts
+        or run.end_ts <= start_ts
+        or (end_ts is not None and end_ts <= run.start_ts)
+    ):
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, Statistics, types
+        )
+        return cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+
+    rollup_start_ts = max(start_ts, run.start_ts)
+    rollup_end_ts = run.end_ts if end_ts is None else min(end_ts, run.end_ts)
+    stats: list[Row] = []
+    for table, period_start_ts, period_end_ts in (
+        (Statistics, start_ts, rollup_start_ts),
+        (rollup.table, rollup_start_ts, rollup_end_ts),
+        (Statistics, rollup_end_ts, end_ts),
+    ):
+        if period_end_ts is not None and period_start_ts >= period_end_ts:
+            continue
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(period_start_ts),
+            dt_util.utc_from_timestamp(period_end_ts)
+            if period_end_ts is not None
+            else None,
+            metadata_ids,
+            table,
+            types,
+        )
+        stats.extend(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+    stats.sort(key=itemgetter(0, 1))
+    return stats
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1768,12 +2044,17 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if rollup := STATISTICS_ROLLUPS.get(period):
+        stats = _get_statistics_during_period_with_rollup(
+            session, rollup, start_time, end_time, metadata_ids, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -2066,16 +2347,17 @@ def _build_sum_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     sum_idx: int,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert: Callable[[Sequence[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
     """Build a list of sum statistics."""
+    sums = convert([db_row[sum_idx] for db_row in db_rows])
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            "sum": None if (v := db_row[sum_idx]) is None else convert(v),
+            "sum": _sum,
         }
-        for db_row in db_rows
+        for db_row, _sum in zip(db_rows, sums, strict=True)
     ]
 
 
@@ -2118,20 +2400,24 @@ def _build_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     row_mapping: tuple[tuple[str, int], ...],
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert: Callable[[Sequence[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
-    """Build a list of statistics with unit conversion."""
-    return [
+    """Build a list of statistics with unit conversion.
+
+    The values are converted a column at a time and then stored in the rows.
+    """
+    result: list[StatisticsRow] = [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            **{
-                key: None if (v := db_row[idx]) is None else convert(v)  # type: ignore[typeddict-item]
-                for key, idx in row_mapping
-            },
         }
         for db_row in db_rows
     ]
+    for key, idx in row_mapping:
+        column = convert([db_row[idx] for db_row in db_rows])
+        for row, value in zip(result, column, strict=True):
+            row[key] = value  # type: ignore[literal-required]
+    return result
 
 
 def _sorted_statistics_to_dict(
@@ -2185,8 +2471,8 @@ def _sorted_statistics_to_dict(
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
+            convert = _get_statistic_to_display_unit_batch_converter(
+                unit, state_unit, units
             )
         else:
             convert = None
@@ -2340,12 +2626,18 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    first_start: datetime | None = None
     for stat in statistics:
+        if first_start is None or stat["start"] < first_start:
+            first_start = stat["start"]
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
+    if table == Statistics and first_start is not None:
+        _rebuild_rollup_statistics(session, metadata_id, first_start.timestamp())
+
     if table != StatisticsShortTerm:
         return True
 
@@ -2475,6 +2767,9 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        _rebuild_rollup_statistics(
+            session, metadata[statistic_id][0], start_time.replace(minute=0).timestamp()
+        )
 
     return True
 
@@ -2536,6 +2831,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -55,6 +55,22 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_history_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get history cache info."""
+    if history_cache := instance.history_cache:
+        return history_cache.as_dict()
+    return {}
+
+
+@callback
+def _async_get_read_queue_info(instance: Recorder) -> dict[str, Any]:
+    """Get read executor queue info."""
+    if instance.db_read_workers:
+        return instance.read_queue_stats.as_dict()
+    return {}
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +88,6 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    history_cache_info = _async_get_history_cache_info(instance)
+    read_queue_info = _async_get_read_queue_info(instance)
+    return db_runs | db_stats | db_engine_info | history_cache_info | read_queue_info
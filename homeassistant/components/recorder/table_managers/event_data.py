@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
@@ -32,6 +33,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._pending_references: Counter[int] = Counter()
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -115,6 +117,22 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         shared_data: str = db_event_data.shared_data
         self._pending[shared_data] = db_event_data
 
+    def add_reference(self, data_id: int) -> None:
+        """Count a new row in events referencing a committed data_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_references[data_id] += 1
+
+    def get_pending_references(self) -> Counter[int]:
+        """Get the new references to committed data_ids since the last commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_references
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the data_ids of the new EventData into the LRU.
 
@@ -124,6 +142,16 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
         self._pending.clear()
+        self._pending_references.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._pending_references.clear()
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
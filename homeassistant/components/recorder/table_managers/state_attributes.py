@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
@@ -37,6 +38,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._pending_references: Counter[int] = Counter()
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -126,6 +128,22 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
 
+    def add_reference(self, attributes_id: int) -> None:
+        """Count a new row in states referencing a committed attributes_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_references[attributes_id] += 1
+
+    def get_pending_references(self) -> Counter[int]:
+        """Get the new references to committed attributes_ids since the last commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_references
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the attributes_ids of the new StateAttributes into the LRU.
 
@@ -135,6 +153,16 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
+        self._pending_references.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._pending_references.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
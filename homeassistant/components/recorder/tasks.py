@@ -15,7 +15,7 @@ from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_ACCUMULATE_STATISTICS
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -312,6 +312,10 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if accumulate_statistics := getattr(
+            platform, INTEGRATION_PLATFORM_ACCUMULATE_STATISTICS, None
+        ):
+            instance.statistics_accumulators[domain] = accumulate_statistics
 
 
 @dataclass(slots=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Generator, Sequence
 import contextlib
 from contextlib import contextmanager
@@ -61,6 +62,8 @@ from .models import (
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
 
+    from homeassistant.components.websocket_api import ActiveConnection
+
     from . import Recorder
 
 _LOGGER = logging.getLogger(__name__)
@@ -797,6 +800,27 @@ def async_migration_is_live(hass: HomeAssistant) -> bool:
     return hass.data[DATA_INSTANCE].migration_is_live
 
 
+async def async_add_read_job_for_connection[_T](
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    target: Callable[..., _T],
+    *args: Any,
+) -> _T:
+    """Run a read-only job for a websocket command.
+
+    The job is cancelled if the websocket connection is closed while
+    the job is waiting for the read executor.
+    """
+    task = asyncio.current_task()
+    assert task is not None
+    connection.subscriptions[msg_id] = task.cancel
+    try:
+        return await get_instance(hass).async_add_read_job(target, *args)
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+
+
 def second_sunday(year: int, month: int) -> date:
     """Return the datetime.date for the second sunday of a month."""
     second = date(year, month, FIRST_POSSIBLE_SUNDAY)
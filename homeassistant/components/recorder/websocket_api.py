@@ -47,7 +47,12 @@ from .statistics import (
     update_statistics_issues,
     validate_statistics,
 )
-from .util import PERIOD_SCHEMA, get_instance, resolve_period
+from .util import (
+    PERIOD_SCHEMA,
+    async_add_read_job_for_connection,
+    get_instance,
+    resolve_period,
+)
 
 CLEAR_STATISTICS_TIME_OUT = 10
 UPDATE_STATISTICS_METADATA_TIME_OUT = 10
@@ -134,7 +139,10 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -202,7 +210,10 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
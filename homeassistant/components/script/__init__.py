@@ -378,21 +378,30 @@ async def _async_process_config(
         A script or configuration is only allowed to match at most once to handle
         the case of multiple scripts with identical configuration.
 
+        Configurations are indexed by key, so each script is only compared to
+        the configuration with its unique id.
+
         Returns a tuple of sets of indices: ({script_matches}, {config_matches})
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        script_configs_by_key: dict[str, tuple[int, ScriptEntityConfig]] = {
+            script_config.key: (config_idx, script_config)
+            for config_idx, script_config in enumerate(script_configs)
+        }
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
-                if script_matches_config(script, script_config):
-                    script_matches.add(script_idx)
-                    config_matches.add(config_idx)
-                    # Only allow a script to match at most once
-                    break
+            if script.unique_id is None or not (
+                match := script_configs_by_key.get(script.unique_id)
+            ):
+                continue
+            config_idx, script_config = match
+            if config_idx in config_matches:
+                # Only allow a script config to match at most once
+                continue
+            if script_matches_config(script, script_config):
+                script_matches.add(script_idx)
+                config_matches.add(config_idx)
 
         return script_matches, config_matches
 
@@ -417,6 +426,13 @@ async def _async_process_config(
     entities = await _create_script_entities(hass, updated_script_configs)
     await component.async_add_entities(entities)
 
+    LOGGER.debug(
+        "Processed scripts: %d unchanged, %d removed, %d created",
+        len(script_matches),
+        len(tasks),
+        len(entities),
+    )
+
 
 class BaseScriptEntity(ToggleEntity, ABC):
     """Base class for script entities."""
@@ -31,7 +31,14 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -49,6 +56,7 @@ from .const import (
     SensorStateClass,
     UnitOfVolumeFlowRate,
 )
+from .statistics_accumulator import StatisticsAccumulator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,6 +84,10 @@ WARN_NEGATIVE: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_total_increasing_nega
 # Keep track of entities for which a warning about unsupported unit has been logged
 WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_unit")
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
+# The sensor states accumulated by the recorder for compiling statistics
+STATISTICS_ACCUMULATOR: HassKey[StatisticsAccumulator] = HassKey(
+    f"{DOMAIN}_statistics_accumulator"
+)
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
@@ -413,34 +425,27 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
-    entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
-    ]
-    history_list: dict[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+    accumulator = hass.data.get(STATISTICS_ACCUMULATOR)
+    if accumulator is not None and accumulator.covers(start):
+        history_list = _accumulated_history(
+            accumulator, sensor_states, wanted_statistics, start, end
         )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
-    ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        if untracked_states := [
+            i for i in sensor_states if not accumulator.tracks(i.entity_id)
+        ]:
+            # The sensors have not changed since the accumulator was
+            # started, load their state once from the database
+            untracked_history = _get_history(
+                hass, session, untracked_states, wanted_statistics, start, end
+            )
+            for entity_id, entity_history in untracked_history.items():
+                accumulator.track(entity_id, entity_history)
+            history_list |= untracked_history
+    else:
+        history_list = _get_history(
+            hass, session, sensor_states, wanted_statistics, start, end
         )
-        history_list = {**history_list, **_history_list}
+        accumulator = None
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -525,17 +530,28 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if (
+            accumulator is not None
+            and "mean" in wanted_statistics[entity_id]
+            and (measurement := accumulator.measurement(entity_id, start, end))
+            and measurement.unit == statistics_unit
+        ):
+            # The states need no unit conversion, use the precomputed aggregate
+            stat["max"] = measurement.max
+            stat["min"] = measurement.min
+            stat["mean"] = measurement.mean
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -640,9 +656,95 @@ def compile_statistics(  # noqa: C901
 
         result.append({"meta": meta, "stat": stat})
 
+    if accumulator := hass.data.get(STATISTICS_ACCUMULATOR):
+        accumulator.advance(end)
+
     return statistics.PlatformCompiledStatistics(result, old_metadatas)
 
 
+def _get_history(
+    hass: HomeAssistant,
+    session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end."""
+    entities_full_history = [
+        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+    ]
+    history_list: dict[str, list[State]] = {}
+    if entities_full_history:
+        history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_full_history,
+            significant_changes_only=False,
+        )
+    entities_significant_history = [
+        i.entity_id
+        for i in sensor_states
+        if "sum" not in wanted_statistics[i.entity_id]
+    ]
+    if entities_significant_history:
+        _history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_significant_history,
+        )
+        history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def _accumulated_history(
+    accumulator: StatisticsAccumulator,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end from the accumulator.
+
+    The result matches _get_history, sum statistics need all state
+    changes while the other statistics only need significant changes.
+    """
+    return {
+        entity_id: entity_history
+        for state in sensor_states
+        if (
+            entity_history := accumulator.period_states(
+                entity_id := state.entity_id,
+                start,
+                end,
+                "sum" not in wanted_statistics[entity_id],
+            )
+        )
+    }
+
+
+def accumulate_statistics(
+    hass: HomeAssistant, event: Event[EventStateChangedData]
+) -> None:
+    """Accumulate a recorded state change for compiling statistics.
+
+    This is called from the recorder thread for each recorded state change.
+    """
+    if not event.data["entity_id"].startswith(f"{DOMAIN}."):
+        return
+    if (accumulator := hass.data.get(STATISTICS_ACCUMULATOR)) is None:
+        # Events are processed in the order they are fired, all later
+        # state changes will pass through the accumulator
+        accumulator = hass.data[STATISTICS_ACCUMULATOR] = StatisticsAccumulator(
+            event.time_fired
+        )
+    accumulator.add(event)
+
+
 def list_statistic_ids(
     hass: HomeAssistant,
     statistic_ids: list[str] | tuple[str] | None = None,
@@ -0,0 +1,263 @@
+"""Accumulate sensor states for statistics as they are recorded."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+import datetime
+import math
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Event, EventStateChangedData, State
+
+from .const import ATTR_STATE_CLASS
+
+
+def _last_updated(state: State) -> datetime.datetime:
+    """Return the last_updated of a state."""
+    return state.last_updated
+
+
+def _float_or_none(state: State) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        fstate = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    return fstate if math.isfinite(fstate) else None
+
+
+@dataclass(slots=True)
+class MeasurementAggregate:
+    """Mean, min and max of the numeric states of a period."""
+
+    unit: str | None
+    mean: float
+    min: float
+    max: float
+
+
+class _EntityAccumulator:
+    """The states of a sensor since the start of the accumulation window.
+
+    The time weighted integral, min and max of the numeric state
+    changes are folded in as states are added, in the same order as
+    the history based calculation so the results are identical.
+    """
+
+    __slots__ = (
+        "_dirty",
+        "_first_time",
+        "_integral",
+        "_last_time",
+        "_last_value",
+        "_max",
+        "_min",
+        "_units",
+        "start_state",
+        "states",
+    )
+
+    def __init__(self, window_start: datetime.datetime) -> None:
+        """Initialize the accumulator."""
+        self.start_state: State | None = None
+        self.states: list[State] = []
+        self._reset_aggregate(window_start)
+
+    def _reset_aggregate(self, window_start: datetime.datetime) -> None:
+        """Fold the start state and the states in the window again."""
+        self._dirty = False
+        self._first_time: datetime.datetime | None = None
+        self._last_time: datetime.datetime | None = None
+        self._last_value = 0.0
+        self._integral = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._units: set[str | None] = set()
+        if self.start_state is not None:
+            self._fold(self.start_state, window_start)
+        for state in self.states:
+            if state.last_changed == state.last_updated:
+                self._fold(state, window_start)
+
+    def _fold(self, state: State, window_start: datetime.datetime) -> None:
+        """Fold a state into the time weighted integral, min and max."""
+        if (fstate := _float_or_none(state)) is None:
+            return
+        start_time = max(state.last_updated, window_start)
+        if self._last_time is None:
+            self._first_time = start_time
+        else:
+            self._integral += (
+                self._last_value * (start_time - self._last_time).total_seconds()
+            )
+        self._last_value = fstate
+        self._last_time = start_time
+        self._min = min(self._min, fstate)
+        self._max = max(self._max, fstate)
+        self._units.add(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+
+    def add(self, state: State, window_start: datetime.datetime) -> None:
+        """Add a new state of the sensor."""
+        last_updated = state.last_updated
+        if last_updated < window_start:
+            # A late state from before the window can only
+            # replace the start state
+            if self.start_state is None or (
+                self.start_state.last_updated <= last_updated
+            ):
+                self.start_state = state
+                self._dirty = True
+            return
+        if not self.states or self.states[-1].last_updated <= last_updated:
+            self.states.append(state)
+            if not self._dirty and state.last_changed == last_updated:
+                self._fold(state, window_start)
+            return
+        insort(self.states, state, key=_last_updated)
+        self._dirty = True
+
+    def period_states(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> list[State]:
+        """Return the start state and the states during start-end."""
+        start_state = self.start_state
+        states: list[State] = []
+        for state in self.states:
+            if (last_updated := state.last_updated) < start:
+                start_state = state
+                continue
+            if last_updated >= end:
+                break
+            if significant_changes_only and state.last_changed != last_updated:
+                continue
+            states.append(state)
+        if start_state is not None:
+            states.insert(0, start_state)
+        return states
+
+    def measurement(
+        self, window_start: datetime.datetime, end: datetime.datetime
+    ) -> MeasurementAggregate | None:
+        """Return the aggregate of the period from window_start to end.
+
+        Returns None if the states do not share a single unit.
+        """
+        if self._dirty:
+            self._reset_aggregate(window_start)
+        if (
+            self._last_time is None
+            or self._first_time is None
+            or len(self._units) != 1
+            or (self.states and self.states[-1].last_updated >= end)
+        ):
+            return None
+        accumulated = (
+            self._integral + self._last_value * (end - self._last_time).total_seconds()
+        )
+        if period_seconds := (end - self._first_time).total_seconds():
+            mean = accumulated / period_seconds
+        else:
+            mean = 0.0
+        return MeasurementAggregate(next(iter(self._units)), mean, self._min, self._max)
+
+    def advance(self, end: datetime.datetime) -> None:
+        """Drop the states before end and start a new window at end."""
+        if idx := bisect_left(self.states, end, key=_last_updated):
+            self.start_state = self.states[idx - 1]
+            del self.states[:idx]
+        self._reset_aggregate(end)
+
+
+class StatisticsAccumulator:
+    """Accumulate the states of sensors with a state class.
+
+    The recorder feeds the accumulator with the state_changed events
+    it records, so compiling statistics for a period after the start
+    of the window does not need to query the history of the sensors.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(self, window_start: datetime.datetime) -> None:
+        """Initialize the accumulator."""
+        self.window_start = window_start
+        self._entities: dict[str, _EntityAccumulator] = {}
+
+    def add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a recorded state_changed event of a sensor.
+
+        Sensors are tracked from the first state with a state class
+        until they are removed.
+        """
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            self._entities.pop(entity_id, None)
+            return
+        if (entity := self._entities.get(entity_id)) is None:
+            if ATTR_STATE_CLASS not in new_state.attributes:
+                return
+            entity = self._entities[entity_id] = _EntityAccumulator(self.window_start)
+            if (old_state := event.data["old_state"]) is not None:
+                entity.add(old_state, self.window_start)
+        entity.add(new_state, self.window_start)
+
+    def tracks(self, entity_id: str) -> bool:
+        """Return if the states of entity_id are accumulated."""
+        return entity_id in self._entities
+
+    def track(self, entity_id: str, states: list[State]) -> None:
+        """Start accumulating entity_id from states loaded from the database.
+
+        This is used for sensors which have not changed since the
+        start of the window.
+        """
+        entity = self._entities[entity_id] = _EntityAccumulator(self.window_start)
+        for state in states:
+            entity.add(state, self.window_start)
+
+    def covers(self, start: datetime.datetime) -> bool:
+        """Return if all states of the period starting at start are accumulated."""
+        return self.window_start <= start
+
+    def period_states(
+        self,
+        entity_id: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> list[State] | None:
+        """Return the start state and the states of entity_id during start-end.
+
+        Returns None if there are no states, like the history queries
+        leave out sensors without states.
+        """
+        if (entity := self._entities.get(entity_id)) is None:
+            return None
+        return entity.period_states(start, end, significant_changes_only) or None
+
+    def measurement(
+        self, entity_id: str, start: datetime.datetime, end: datetime.datetime
+    ) -> MeasurementAggregate | None:
+        """Return the precomputed mean, min and max of entity_id during start-end.
+
+        Returns None if the aggregate is not available for the period.
+        """
+        if (
+            start != self.window_start
+            or (entity := self._entities.get(entity_id)) is None
+        ):
+            return None
+        return entity.measurement(self.window_start, end)
+
+    def advance(self, end: datetime.datetime) -> None:
+        """Start a new window after the period ending at end was compiled."""
+        if end <= self.window_start:
+            return
+        for entity in self._entities.values():
+            entity.advance(end)
+        self.window_start = end
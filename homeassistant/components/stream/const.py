@@ -21,6 +21,9 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
+SEGMENT_BUFFER_INITIAL_SIZE = 262144  # Bytes preallocated for the first segment
+# The buffer of the next segment is this much larger than the last segment
+SEGMENT_BUFFER_HEADROOM = 1.25
 TARGET_SEGMENT_DURATION_NON_LL_HLS = 2.0  # Each segment is about this many seconds
 SEGMENT_DURATION_ADJUSTER = 0.1  # Used to avoid missing keyframe boundaries
 # Number of target durations to start before the end of the playlist.
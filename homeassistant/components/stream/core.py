@@ -71,6 +71,49 @@ STREAM_SETTINGS_NON_LL_HLS = StreamSettings(
 )
 
 
+class SegmentBuffer:
+    """A preallocated buffer holding the data of the parts of a Segment.
+
+    The data of each part is copied once into the buffer and handed out
+    as a memoryview slice, so the parts and the complete segment can be
+    served without copying or joining them again.
+
+    The buffer is appended to by the worker thread while the event loop
+    reads the data of the parts it already received. Appending never
+    modifies data which was handed out. If the buffer is full, the data
+    is moved to a larger buffer, and the old buffer is kept alive by
+    the parts which still reference it.
+    """
+
+    __slots__ = ("_size", "_view")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize SegmentBuffer."""
+        self._view = memoryview(bytearray(capacity))
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes appended to the buffer."""
+        return self._size
+
+    def append(self, data: bytes | memoryview) -> memoryview:
+        """Append data to the buffer and return a view of it."""
+        start = self._size
+        end = start + len(data)
+        if end > len(self._view):
+            view = memoryview(bytearray(max(end, 2 * len(self._view))))
+            view[:start] = self._view[:start]
+            self._view = view
+        self._view[start:end] = data
+        self._size = end
+        return self._view[start:end]
+
+    def view(self, size: int) -> memoryview:
+        """Return a view of the first size bytes of the buffer."""
+        return self._view[:size]
+
+
 @dataclass(slots=True)
 class Part:
     """Represent a segment part."""
@@ -78,7 +121,7 @@ class Part:
     duration: float
     has_keyframe: bool
     # video data (moof+mdat)
-    data: bytes
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -94,6 +137,8 @@ class Segment:
     _stream_outputs: Iterable[StreamOutput]
     duration: float = 0
     parts: list[Part] = field(default_factory=list)
+    # The buffer holding the data of the parts, if the parts are stored in one
+    buffer: SegmentBuffer | None = None
     # Store text of this segment's hls playlist for reuse
     # Use list[str] for easy appends
     hls_playlist_template: list[str] = field(default_factory=list)
@@ -138,8 +183,11 @@ class Segment:
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init."""
+        if self.buffer is not None:
+            # The parts are stored back to back in the buffer
+            return self.buffer.view(self.data_size)
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
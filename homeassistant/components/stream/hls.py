@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from http import HTTPStatus
 from typing import TYPE_CHECKING, cast
 
@@ -64,6 +65,8 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # The last rendered playlist and the state of the last segment it is for
+        self._playlist_cache: tuple[tuple[int, int, int, bool], bytes] | None = None
 
     @property
     def name(self) -> str:
@@ -74,12 +77,31 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self._playlist_cache = None
 
     @property
     def target_duration(self) -> float:
         """Return the target duration."""
         return self._target_duration
 
+    def get_playlist(self, render: Callable[[HlsStreamOutput], str]) -> bytes:
+        """Return the encoded playlist, rendering it only if it changed.
+
+        The playlist only changes when a segment is added or removed, or
+        when a part is added to or the duration is set on the last segment.
+        """
+        last_segment = self.last_segment
+        assert last_segment
+        key = (
+            last_segment.stream_id,
+            last_segment.sequence,
+            len(last_segment.parts),
+            last_segment.complete,
+        )
+        if self._playlist_cache is None or self._playlist_cache[0] != key:
+            self._playlist_cache = (key, render(self).encode("utf-8"))
+        return self._playlist_cache[1]
+
     @callback
     def _async_put(self, segment: Segment) -> None:
         """Async put and also update the target duration.
@@ -325,7 +347,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=track.get_playlist(self.render),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -24,6 +24,8 @@ from .const import (
     MAX_MISSING_DTS,
     MAX_TIMESTAMP_GAP,
     PACKETS_TO_WAIT_FOR_AUDIO,
+    SEGMENT_BUFFER_HEADROOM,
+    SEGMENT_BUFFER_INITIAL_SIZE,
     SEGMENT_CONTAINER_FORMAT,
     SOURCE_TIMEOUT,
 )
@@ -32,6 +34,7 @@ from .core import (
     KeyFrameConverter,
     Part,
     Segment,
+    SegmentBuffer,
     StreamOutput,
     StreamSettings,
 )
@@ -144,6 +147,9 @@ class StreamMuxer:
         self._output_video_stream: av.video.VideoStream = None
         self._output_audio_stream: av.audio.stream.AudioStream | None = None
         self._segment: Segment | None = None
+        # the part data of the segment is copied from the memory_file to this buffer
+        self._segment_buffer: SegmentBuffer = cast(SegmentBuffer, None)
+        self._segment_buffer_size = SEGMENT_BUFFER_INITIAL_SIZE
         # the following 3 member variables are used for Part formation
         self._memory_file_pos: int = cast(int, None)
         self._part_start_dts: int = cast(int, None)
@@ -240,6 +246,7 @@ class StreamMuxer:
         self._segment = None
         self._memory_file = BytesIO()
         self._memory_file_pos = 0
+        self._segment_buffer = SegmentBuffer(self._segment_buffer_size)
         (
             self._av_output,
             self._output_video_stream,
@@ -292,6 +299,7 @@ class StreamMuxer:
             # worker started.
             _stream_outputs=self._stream_state.outputs,
             start_time=self._start_time,
+            buffer=self._segment_buffer,
         )
         self._memory_file_pos = self._memory_file.tell()
         self._memory_file.seek(0, SEEK_END)
@@ -356,7 +364,12 @@ class StreamMuxer:
         if not self._stream_settings.ll_hls:
             adjusted_dts = packet.dts
         assert self._segment
-        self._memory_file.seek(self._memory_file_pos)
+        with (
+            self._memory_file.getbuffer() as memory_view,
+            memory_view[self._memory_file_pos :] as part_view,
+        ):
+            data = self._segment_buffer.append(part_view)
+        self._memory_file.seek(0, SEEK_END)
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
             Part(
@@ -364,7 +377,7 @@ class StreamMuxer:
                     (adjusted_dts - self._part_start_dts) * packet.time_base
                 ),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=data,
             ),
             (
                 (
@@ -379,6 +392,10 @@ class StreamMuxer:
         if last_part:
             # If we've written the last part, we can close the memory_file.
             self._memory_file.close()  # We don't need the BytesIO object anymore
+            # Size the buffer of the next segment after this one
+            self._segment_buffer_size = int(
+                self._segment_buffer.size * SEGMENT_BUFFER_HEADROOM
+            )
             self._start_time += datetime.timedelta(seconds=segment_duration)
             # Reinitialize
             self.reset(packet.dts)
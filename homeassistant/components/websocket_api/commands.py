@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Sequence
 from functools import lru_cache, partial
 import json
 import logging
+import time
 from typing import Any, cast
 
 import voluptuous as vol
@@ -19,6 +21,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +63,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +71,19 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_CHANGES_FAN_OUT: HassKey[_EntityChangesFanOut] = HassKey(
+    "websocket_api_entity_changes_fan_out"
+)
+SERIALIZED_STATES_CACHE: HassKey[_SerializedStatesCache] = HassKey(
+    "websocket_api_serialized_states_cache"
+)
+
+# The longest interval in seconds subscribe_entities can coalesce changes
+MAX_COALESCE_INTERVAL = 10
+
+# The serialized states are dropped once get_states has not been
+# called for this many seconds
+SERIALIZED_STATES_CACHE_IDLE_TIMEOUT = 300
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -312,61 +329,210 @@ async def handle_call_service(
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
-) -> list[State]:
+) -> Sequence[State]:
     user = connection.user
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
+        return hass.states.async_all_snapshot()
     entity_perm = connection.user.permissions.check_entity
     return [
         state
-        for state in hass.states.async_all()
+        for state in hass.states.async_all_snapshot()
         if entity_perm(state.entity_id, POLICY_READ)
     ]
 
 
+class _SerializedStatesCache:
+    """Cache the JSON of the states users that can read all entities get.
+
+    Clients that reconnect together all request the same states, so the
+    serialized state of each entity is kept and only the entities that
+    changed since the last request are serialized again. Users that can
+    only read some entities are not cached, as what they can read also
+    depends on the entity and device registries.
+
+    The cache stops listening for state changes and drops the serialized
+    states when get_states has not been called for a while.
+    """
+
+    __slots__ = (
+        "_changed_entity_ids",
+        "_hass",
+        "_last_used",
+        "_payloads",
+        "_serialized",
+        "_unsub",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._changed_entity_ids: set[str] = set()
+        self._serialized: dict[bool, dict[str, bytes]] = {}
+        self._payloads: dict[bool, bytes] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._last_used = 0.0
+
+    @callback
+    def async_get(self, connection: ActiveConnection, compressed: bool) -> bytes:
+        """Return the joined JSON of the states the user can read."""
+        user = connection.user
+        if not (user.is_admin or user.permissions.access_all_entities(POLICY_READ)):
+            return _async_serialize_states(
+                connection,
+                _async_get_allowed_states(self._hass, connection),
+                compressed,
+            )
+        self._last_used = time.time()
+        if self._changed_entity_ids:
+            self._async_apply_changes(connection)
+        if (payload := self._payloads.get(compressed)) is not None:
+            return payload
+        if (serialized := self._serialized.get(compressed)) is None:
+            serialized = self._serialized[compressed] = {
+                state.entity_id: state_json
+                for state in self._hass.states.async_all_snapshot()
+                if (state_json := _async_serialize_state(connection, state, compressed))
+                is not None
+            }
+            if self._unsub is None:
+                self._unsub = self._hass.bus.async_listen(
+                    EVENT_STATE_CHANGED, self._async_state_changed
+                )
+        payload = self._payloads[compressed] = b",".join(serialized.values())
+        return payload
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Remember the entity to serialize again."""
+        if (
+            event.time_fired_timestamp - self._last_used
+            > SERIALIZED_STATES_CACHE_IDLE_TIMEOUT
+        ):
+            self._async_drop()
+            return
+        self._changed_entity_ids.add(event.data["entity_id"])
+
+    @callback
+    def _async_drop(self) -> None:
+        """Stop listening for state changes and drop the serialized states."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._changed_entity_ids.clear()
+        self._serialized.clear()
+        self._payloads.clear()
+
+    @callback
+    def _async_apply_changes(self, connection: ActiveConnection) -> None:
+        """Serialize the states of the changed entities again."""
+        get_state = self._hass.states.get
+        for entity_id in self._changed_entity_ids:
+            state = get_state(entity_id)
+            for compressed, serialized in self._serialized.items():
+                state_json = None
+                if state is not None:
+                    state_json = _async_serialize_state(connection, state, compressed)
+                if state_json is None:
+                    serialized.pop(entity_id, None)
+                else:
+                    serialized[entity_id] = state_json
+        self._changed_entity_ids.clear()
+        self._payloads.clear()
+
+
 @callback
-@decorators.websocket_command({vol.Required("type"): "get_states"})
-def handle_get_states(
-    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
-) -> None:
-    """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
+def _async_get_serialized_states(
+    hass: HomeAssistant, connection: ActiveConnection, compressed: bool
+) -> bytes:
+    """Return the cached joined JSON of the states the user can read."""
+    if (cache := hass.data.get(SERIALIZED_STATES_CACHE)) is None:
+        cache = hass.data[SERIALIZED_STATES_CACHE] = _SerializedStatesCache(hass)
+    return cache.async_get(connection, compressed)
+
+
+def _async_serialize_state(
+    connection: ActiveConnection, state: State, compressed: bool
+) -> bytes | None:
+    """Return the JSON of a state or None if it can't be serialized."""
+    try:
+        return state.as_compressed_state_json if compressed else state.as_dict_json
+    except (ValueError, TypeError):
+        connection.logger.error(
+            "Unable to serialize to JSON. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(state, dump=JSON_DUMP)
+            ),
+        )
+    return None
+
+
+def _async_serialize_states(
+    connection: ActiveConnection, states: Sequence[State], compressed: bool
+) -> bytes:
+    """Return the joined JSON of states.
 
+    States that can't be serialized are logged and left out.
+    """
     try:
-        serialized_states = [state.as_dict_json for state in states]
+        if compressed:
+            serialized_states = [state.as_compressed_state_json for state in states]
+        else:
+            serialized_states = [state.as_dict_json for state in states]
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
-        return
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized_states = []
-    for state in states:
-        try:
-            serialized_states.append(state.as_dict_json)
-        except (ValueError, TypeError):
-            connection.logger.error(
-                "Unable to serialize to JSON. Bad data found at %s",
-                format_unserializable_data(
-                    find_paths_unserializable_data(state, dump=JSON_DUMP)
-                ),
-            )
+        return b",".join(serialized_states)
 
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
+    return b",".join(
+        state_json
+        for state in states
+        if (state_json := _async_serialize_state(connection, state, compressed))
+        is not None
+    )
 
 
-def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_states"})
+def handle_get_states(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Send handle get states response."""
+    """Handle get states command."""
     connection.send_message(
         construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
+            msg["id"],
+            b"".join(
+                (b"[", _async_get_serialized_states(hass, connection, False), b"]")
+            ),
         )
     )
 
 
+def _user_can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if the user can read the state of an entity."""
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+def _entity_change_wanted(
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    entity_id: str,
+) -> bool:
+    """Return if a subscription wants the state changes of an entity."""
+    if (entity_ids and entity_id not in entity_ids) or (
+        entity_filter and not entity_filter(entity_id)
+    ):
+        return False
+    return _user_can_read_entity(user, entity_id)
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
@@ -377,21 +543,122 @@ def _forward_entity_changes(
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    if _entity_change_wanted(entity_ids, entity_filter, user, event.data["entity_id"]):
+        send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+
+
+class _EntityChangesFanOut:
+    """Forward state changed events to the unfiltered entity subscriptions.
+
+    All subscribe_entities subscriptions without entity_ids or a filter
+    share one listener on the event bus, so each state change is
+    serialized once and the same bytes are sent to every connection.
+    """
+
+    __slots__ = ("_hass", "_subscriptions", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fan out."""
+        self._hass = hass
+        self._subscriptions: dict[
+            object, tuple[Callable[[str | bytes | dict[str, Any]], None], User, bytes]
+        ] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        key = object()
+        self._subscriptions[key] = (send_message, user, message_id_as_bytes)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward
+            )
+        return partial(self._async_remove, key)
+
+    @callback
+    def _async_remove(self, key: object) -> None:
+        """Remove a subscription."""
+        del self._subscriptions[key]
+        if not self._subscriptions and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state changed event to all subscriptions."""
+        entity_id = event.data["entity_id"]
+        # Sending a message can close a connection whose queue is
+        # full which removes its subscriptions
+        for send_message, user, message_id_as_bytes in tuple(
+            self._subscriptions.values()
+        ):
+            if _user_can_read_entity(user, entity_id):
+                send_message(
+                    messages.cached_state_diff_message(message_id_as_bytes, event)
+                )
+
+
+class _EntityChangesCoalescer:
+    """Merge the state changes of entities during an interval into one message."""
+
+    __slots__ = ("_changes", "_hass", "_interval", "_msg_id", "_send_message", "_timer")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: float,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        msg_id: int,
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._interval = interval
+        self._send_message = send_message
+        self._msg_id = msg_id
+        self._changes: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Add a state changed event to the next message."""
+        entity_id = event.data["entity_id"]
+        if not _entity_change_wanted(entity_ids, entity_filter, user, entity_id):
+            return
+        new_state = event.data["new_state"]
+        if (change := self._changes.get(entity_id)) is not None:
+            self._changes[entity_id] = (change[0], new_state)
+        else:
+            self._changes[entity_id] = (event.data["old_state"], new_state)
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self._interval, self._async_send)
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the changes of the interval."""
+        self._timer = None
+        changes = self._changes
+        self._changes = {}
+        if message := messages.coalesced_state_diff_message(self._msg_id, changes):
+            self._send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
 
 @callback
@@ -399,6 +666,9 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_interval"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_INTERVAL)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -412,74 +682,68 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    if coalesce_interval := msg.get("coalesce_interval"):
+        coalescer = _EntityChangesCoalescer(
+            hass, coalesce_interval, connection.send_message, msg_id
+        )
+        unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(coalescer.async_add, entity_ids, entity_filter, connection.user),
+        )
+
+        @callback
+        def _async_unsub() -> None:
+            unsub()
+            coalescer.async_cancel()
+
+        connection.subscriptions[msg_id] = _async_unsub
+    elif entity_ids or entity_filter:
+        connection.subscriptions[msg_id] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                entity_filter,
+                connection.user,
+                message_id_as_bytes,
+            ),
+        )
+    else:
+        if (fan_out := hass.data.get(ENTITY_CHANGES_FAN_OUT)) is None:
+            fan_out = hass.data[ENTITY_CHANGES_FAN_OUT] = _EntityChangesFanOut(hass)
+        connection.subscriptions[msg_id] = fan_out.async_add(
+            connection.send_message, connection.user, message_id_as_bytes
+        )
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
-    try:
-        if entity_ids or entity_filter:
-            serialized_states = [
-                state.as_compressed_state_json
-                for state in states
+    if entity_ids or entity_filter:
+        serialized_states = _async_serialize_states(
+            connection,
+            [
+                state
+                for state in _async_get_allowed_states(hass, connection)
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
-            ]
-        else:
-            # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
-    except (ValueError, TypeError):
-        pass
-    else:
-        _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            ],
+            True,
         )
-        return
-
-    serialized_states = []
-    for state in states:
-        try:
-            serialized_states.append(state.as_compressed_state_json)
-        except (ValueError, TypeError):
-            connection.logger.error(
-                "Unable to serialize to JSON. Bad data found at %s",
-                format_unserializable_data(
-                    find_paths_unserializable_data(state, dump=JSON_DUMP)
-                ),
-            )
-
-    _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
-    )
-
+    else:
+        # Fast path when not filtering
+        serialized_states = _async_get_serialized_states(hass, connection, True)
 
-def _send_handle_entities_init_response(
-    connection: ActiveConnection,
-    message_id_as_bytes: bytes,
-    serialized_states: list[bytes],
-) -> None:
-    """Send handle entities init response."""
     connection.send_message(
         b"".join(
             (
                 b'{"id":',
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
+                serialized_states,
                 b"}}}",
             )
         )
@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -199,6 +199,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +242,36 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+def coalesced_state_diff_message(
+    msg_id: int, changes: dict[str, tuple[State | None, State | None]]
+) -> bytes | None:
+    """Return a message with the changes of entities during an interval.
+
+    The changes map the entity_id to the state before the first change
+    and the state after the last change during the interval. Returns
+    None if no entity has changed from the point of view of the client.
+    """
+    event: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            # An entity added and removed during the interval
+            # was never seen by the client
+            if old_state is not None:
+                event.setdefault(ENTITY_EVENT_REMOVE, []).append(entity_id)
+        elif old_state is None:
+            event.setdefault(ENTITY_EVENT_ADD, {})[entity_id] = (
+                new_state.as_compressed_state
+            )
+        else:
+            event.setdefault(ENTITY_EVENT_CHANGE, {})[entity_id] = _state_diff(
+                old_state, new_state
+            )
+    if not event:
+        return None
+    return message_to_json_bytes({"id": msg_id, "type": "event", "event": event})
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
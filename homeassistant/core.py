@@ -108,7 +108,7 @@ from .util.async_ import (
 from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
-from .util.json import JsonObjectType
+from .util.json import JsonObjectType, json_loads_object
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.ulid import ulid_at_time, ulid_now
@@ -146,6 +146,11 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# Number of distinct encoded attributes of compact states which are shared
+COMPACT_ATTRIBUTES_CACHE_SIZE = 4096
+# Number of recently decoded attributes of compact states which are kept
+COMPACT_ATTRIBUTES_DECODE_CACHE_SIZE = 128
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -1446,10 +1451,6 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
-# Empty list, used by EventBus.async_fire_internal
-EMPTY_LIST: list[Any] = []
-
-
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1460,7 +1461,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_listener_snapshots",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1469,6 +1476,11 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The listeners an event type is dispatched to, including the match all
+        # listeners. Rebuilt when a listener is added or removed.
+        self._listener_snapshots: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1549,14 +1561,11 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if (listeners := self._listener_snapshots.get(event_type)) is None:
+            listeners = self._async_listener_snapshot(event_type)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in listeners:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1579,6 +1588,38 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_listener_snapshot(
+        self, event_type: EventType[_DataT] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build the listeners an event type is dispatched to."""
+        listeners = self._listeners
+        snapshots = self._listener_snapshots
+        if event_type in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            if event_type not in listeners:
+                return ()
+            snapshot = tuple(listeners[event_type])
+        elif event_type in listeners and event_type != MATCH_ALL:
+            snapshot = (*listeners[event_type], *self._match_all_listeners)
+        else:
+            # Event types without listeners share the match all snapshot
+            # so firing arbitrary event types does not grow the snapshots
+            if (snapshot := snapshots.get(MATCH_ALL)) is None:
+                snapshot = snapshots[MATCH_ALL] = tuple(self._match_all_listeners)
+            return snapshot
+        snapshots[event_type] = snapshot
+        return snapshot
+
+    @callback
+    def _async_invalidate_listener_snapshots(
+        self, event_type: EventType[_DataT] | str
+    ) -> None:
+        """Drop the snapshots affected by adding or removing a listener."""
+        if event_type == MATCH_ALL:
+            self._listener_snapshots.clear()
+        else:
+            self._listener_snapshots.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1650,6 +1691,7 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_invalidate_listener_snapshots(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1729,6 +1771,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        self._async_invalidate_listener_snapshots(event_type)
         try:
             self._listeners[event_type].remove(filterable_job)
 
@@ -1861,6 +1904,10 @@ class State:
         Callers should be careful to not mutate the returned dictionary
         as it will mutate the cached version.
         """
+        return self._as_dict_with_attributes(self.attributes)
+
+    def _as_dict_with_attributes(self, attributes: Any) -> dict[str, Any]:
+        """Return a dict representation of the State with the given attributes."""
         last_changed_isoformat = self.last_changed.isoformat()
         if self.last_changed == self.last_updated:
             last_updated_isoformat = last_changed_isoformat
@@ -1873,7 +1920,7 @@ class State:
         return {
             "entity_id": self.entity_id,
             "state": self.state,
-            "attributes": self.attributes,
+            "attributes": attributes,
             "last_changed": last_changed_isoformat,
             "last_reported": last_reported_isoformat,
             "last_updated": last_updated_isoformat,
@@ -1928,6 +1975,10 @@ class State:
 
         Sends c (context) as a string if it only contains an id.
         """
+        return self._compressed_state_with_attributes(self.attributes)
+
+    def _compressed_state_with_attributes(self, attributes: Any) -> CompressedState:
+        """Build a compressed dict of a state with the given attributes."""
         state_context = self.context
         if state_context.parent_id is None and state_context.user_id is None:
             context: dict[str, Any] | str = state_context.id
@@ -1938,7 +1989,7 @@ class State:
             context = state_context._as_dict  # noqa: SLF001
         compressed_state: CompressedState = {
             COMPRESSED_STATE_STATE: self.state,
-            COMPRESSED_STATE_ATTRIBUTES: self.attributes,
+            COMPRESSED_STATE_ATTRIBUTES: attributes,
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
@@ -2022,17 +2073,89 @@ class State:
         )
 
 
+@functools.lru_cache(maxsize=COMPACT_ATTRIBUTES_CACHE_SIZE)
+def _intern_attributes_json(attributes_json: bytes) -> bytes:
+    """Return a shared copy of identical encoded attributes."""
+    return attributes_json
+
+
+@functools.lru_cache(maxsize=COMPACT_ATTRIBUTES_DECODE_CACHE_SIZE)
+def _decode_attributes_json(attributes_json: bytes) -> ReadOnlyDict[str, Any]:
+    """Decode attributes, sharing the result between identical attributes."""
+    return ReadOnlyDict(json_loads_object(attributes_json))
+
+
+class CompactState(State):
+    """State which keeps its attributes encoded as JSON.
+
+    The attributes are encoded once when the state is created and the
+    bytes are reused when the state is serialized with as_dict_json
+    or as_compressed_state_json. They are only decoded when accessed,
+    and identical attributes of different states share the same bytes.
+    Only the most recently decoded attributes are kept decoded.
+
+    Since the attributes make a round trip through JSON, they are only
+    made of JSON types, e.g. tuples become lists and datetimes become
+    ISO formatted strings. Entities opt in by setting
+    _compact_state_attributes.
+    """
+
+    __slots__ = ("_attributes_json", "_attributes_fallback")
+
+    @property  # type: ignore[override]
+    def attributes(self) -> ReadOnlyDict[str, Any]:
+        """Return the decoded attributes."""
+        if (attributes_json := self._attributes_json) is None:
+            return self._attributes_fallback
+        return _decode_attributes_json(attributes_json)
+
+    @attributes.setter
+    def attributes(self, attributes: ReadOnlyDict[str, Any]) -> None:
+        """Encode the attributes."""
+        try:
+            attributes_json = json_bytes(attributes)
+        except (TypeError, ValueError):
+            # Keep attributes which can not be encoded as is
+            self._attributes_json = None
+            self._attributes_fallback = attributes
+            return
+        self._attributes_json = _intern_attributes_json(attributes_json)
+
+    @under_cached_property
+    def as_dict_json(self) -> bytes:
+        """Return a JSON string of the State."""
+        if (attributes_json := self._attributes_json) is None:
+            return json_bytes(self._as_dict)
+        return json_bytes(self._as_dict_with_attributes(json_fragment(attributes_json)))
+
+    @under_cached_property
+    def as_compressed_state_json(self) -> bytes:
+        """Build a compressed JSON key value pair of a state for adds."""
+        if (attributes_json := self._attributes_json) is None:
+            compressed_state = self.as_compressed_state
+        else:
+            compressed_state = self._compressed_state_with_attributes(
+                json_fragment(attributes_json)
+            )
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    The version is incremented every time a state is added, replaced or
+    removed, and an immutable snapshot of all states is kept until then.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self.version = 0
+        self._snapshot: tuple[State, ...] | None = None
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2042,12 +2165,22 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        self.version += 1
+        self._snapshot = None
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
+        self.version += 1
+        self._snapshot = None
+
+    def snapshot(self) -> tuple[State, ...]:
+        """Return all states, shared between callers until a state changes."""
+        if (snapshot := self._snapshot) is None:
+            snapshot = self._snapshot = tuple(self.data.values())
+        return snapshot
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
@@ -2148,6 +2281,26 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_snapshot(self) -> tuple[State, ...]:
+        """Return an immutable snapshot of all states.
+
+        Unlike async_all, the same tuple is returned until a state is added,
+        changed or removed, so it is cheap to call for every request. Use
+        async_version to find out if a snapshot is still current.
+
+        This method must be run in the event loop.
+        """
+        return self._states.snapshot()
+
+    @callback
+    def async_version(self) -> int:
+        """Return a number which changes every time a state changes.
+
+        This method must be run in the event loop.
+        """
+        return self._states.version
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2317,7 +2470,18 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            if (
+                type(old_state) is CompactState
+                and (old_attributes_json := old_state._attributes_json) is not None  # noqa: SLF001
+            ):
+                # Decoded attributes only hold JSON types, so compare the
+                # encoded attributes instead
+                try:
+                    same_attr = json_bytes(attributes) == old_attributes_json
+                except (TypeError, ValueError):
+                    same_attr = False
+            else:
+                same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2359,9 +2523,14 @@ class StateMachine:
                 assert old_state is not None
             attributes = old_state.attributes
 
+        state_cls = (
+            CompactState
+            if state_info is not None and state_info.get("compact_attributes")
+            else State
+        )
         # This is intentionally called with positional only arguments for performance
         # reasons
-        state = State(
+        state = state_cls(
             entity_id,
             new_state,
             attributes,
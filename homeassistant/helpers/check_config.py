@@ -15,6 +15,7 @@ from homeassistant.config import (  # type: ignore[attr-defined]
     CONF_PACKAGES,
     CORE_CONFIG_SCHEMA,
     YAML_CONFIG_FILE,
+    async_get_yaml_cache,
     config_per_platform,
     extract_domain_configs,
     format_homeassistant_error,
@@ -150,6 +151,7 @@ async def async_check_ha_config_file(  # noqa: C901
             load_yaml_config_file,
             config_path,
             yaml_loader.Secrets(Path(hass.config.config_dir)),
+            async_get_yaml_cache(hass),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
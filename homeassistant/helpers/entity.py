@@ -211,6 +211,7 @@ class StateInfo(TypedDict):
     """State info."""
 
     unrecorded_attributes: frozenset[str]
+    compact_attributes: NotRequired[bool]
 
 
 class EntityPlatformState(Enum):
@@ -511,8 +512,13 @@ class Entity(
     __combined_unrecorded_attributes: frozenset[str] = (
         _entity_component_unrecorded_attributes | _unrecorded_attributes
     )
+    # Store the state attributes encoded as JSON, see core.CompactState
+    _compact_state_attributes: bool = False
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
+    # If the state can be written by EntityPlatform.async_write_ha_states,
+    # set automatically by __init_subclass__
+    _batch_state_writes: bool = True
 
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
@@ -553,6 +559,11 @@ class Entity(
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        # Entities that customize writing their state are written one by one
+        cls._batch_state_writes = (
+            cls.async_write_ha_state is Entity.async_write_ha_state
+            and cls._async_write_ha_state is Entity._async_write_ha_state
+        )
 
     def get_hassjob_type(self, function_name: str) -> HassJobType:
         """Get the job type function for the given name.
@@ -1107,9 +1118,23 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (
+            state_to_write := self._async_calculate_state_to_write(timer())
+        ) is not None:
+            self._async_set_state_internal(*state_to_write)
+
+    @callback
+    def _async_calculate_state_to_write(
+        self, state_calculate_start: float
+    ) -> tuple[str, dict[str, Any], float] | None:
+        """Calculate the state and attributes to write to the state machine.
+
+        Returns the state, the attributes and the time the calculation
+        finished, or None if the state must not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1125,9 +1150,8 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
-        state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
             self.__async_calculate_state()
         )
@@ -1207,6 +1231,15 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        return state, attr, time_now
+
+    @callback
+    def _async_set_state_internal(
+        self, state: str, attr: dict[str, Any], timestamp: float
+    ) -> None:
+        """Set a calculated state in the state machine."""
+        hass = self.hass
+        entity_id = self.entity_id
         try:
             hass.states.async_set_internal(
                 entity_id,
@@ -1215,7 +1248,7 @@ class Entity(
                 self.force_update,
                 self._context,
                 self._state_info,
-                time_now,
+                timestamp,
             )
         except InvalidStateError:
             _LOGGER.exception(
@@ -1461,6 +1494,8 @@ class Entity(
         self._state_info = {
             "unrecorded_attributes": self.__combined_unrecorded_attributes
         }
+        if self._compact_state_attributes:
+            self._state_info["compact_attributes"] = True
 
         if self.registry_entry is not None:
             # This is an assert as it should never happen, but helps in tests
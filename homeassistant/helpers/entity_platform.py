@@ -7,6 +7,8 @@ from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant import config_entries
@@ -46,6 +48,7 @@ from . import (
 )
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
+from .frame import report_non_thread_safe_operation
 from .issue_registry import IssueSeverity, async_create_issue
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
@@ -689,6 +692,37 @@ class EntityPlatform:
                 eager_start=True,
             )
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity]) -> None:
+        """Write the states of entities of this platform in one pass.
+
+        The states of all entities are calculated first and then set in the
+        state machine with one timestamp, so the state changed events of the
+        batch are fired together. Entities that customize writing their state
+        are written one by one.
+
+        This method must be run in the event loop.
+        """
+        if self.hass.loop_thread_id != threading.get_ident():
+            report_non_thread_safe_operation("async_write_ha_states")
+        states_to_write: list[tuple[Entity, str, dict[str, Any]]] = []
+        timestamp = time.time()
+        for entity in entities:
+            if not entity._batch_state_writes:  # noqa: SLF001
+                entity.async_write_ha_state()
+                continue
+            if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+                entity._async_verify_state_writable()  # noqa: SLF001
+            # The end of the calculation of one state is the start of the next
+            if (
+                state_to_write := entity._async_calculate_state_to_write(timestamp)  # noqa: SLF001
+            ) is not None:
+                state, attr, timestamp = state_to_write
+                states_to_write.append((entity, state, attr))
+
+        for entity, state, attr in states_to_write:
+            entity._async_set_state_internal(state, attr, timestamp)  # noqa: SLF001
+
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
@@ -75,6 +74,7 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_RENDER_BATCH: HassKey[_TemplateRenderBatch] = HassKey("template_render_batch")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -102,7 +102,7 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
     dispatcher_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+            dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]],
             Event[_TypedDictT],
         ],
         None,
@@ -110,7 +110,7 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
     filter_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+            dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]],
             _TypedDictT,
         ],
         bool,
@@ -122,7 +122,7 @@ class _KeyedEventData(Generic[_TypedDictT]):
     """Class to track data for events by key."""
 
     listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    callbacks: dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]]
 
 
 @dataclass(slots=True)
@@ -172,6 +172,120 @@ class TrackTemplateResult:
     result: Any
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for render statistics of a tracked template.
+
+    renders
+        Number of times the template was rendered.
+    deduplicated
+        Number of re-renders served by an identical render of another
+        tracker triggered by the same event.
+    total_duration, max_duration, last_duration
+        Render durations in seconds.
+    """
+
+    renders: int = 0
+    deduplicated: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    last_duration: float = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a render."""
+        self.renders += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+
+
+class _TemplateRenderBatch:
+    """Share the renders of all templates triggered by the same event.
+
+    When many trackers render the same template string with equal
+    variables for a state change, only the first one renders it and the
+    others reuse its render info. Since the actions of trackers may
+    change states while the event is dispatched, a render is only
+    reused if the states it depends on are still the same objects.
+    Renders which depend on whole domains or all states are not shared.
+
+    The batch is flushed once the event has been dispatched so it does
+    not keep the event, render infos and states alive.
+    """
+
+    __slots__ = ("event", "renders")
+
+    def __init__(self, event: Event[EventStateChangedData]) -> None:
+        """Initialize the batch."""
+        self.event: Event[EventStateChangedData] | None = event
+        self.renders: dict[
+            str,
+            list[tuple[TemplateVarsType, RenderInfo, list[tuple[str, State | None]]]],
+        ] = {}
+
+    @callback
+    def async_get(
+        self, hass: HomeAssistant, template: Template, variables: TemplateVarsType
+    ) -> RenderInfo | None:
+        """Return the render info of an identical render in the batch."""
+        if (renders := self.renders.get(template.template)) is None:
+            return None
+        states_get = hass.states.get
+        for render_variables, info, states in renders:
+            if render_variables == variables and all(
+                states_get(entity_id) is state for entity_id, state in states
+            ):
+                if info.template is template:
+                    return info
+                shared_info = copy.copy(info)
+                shared_info.template = template
+                return shared_info
+        return None
+
+    @callback
+    def async_add(
+        self, hass: HomeAssistant, variables: TemplateVarsType, info: RenderInfo
+    ) -> None:
+        """Add a render to the batch if it can be shared."""
+        if (
+            info.exception
+            or info.all_states
+            or info.all_states_lifecycle
+            or info.domains
+            or info.domains_lifecycle
+        ):
+            return
+        states_get = hass.states.get
+        self.renders.setdefault(info.template.template, []).append(
+            (
+                variables,
+                info,
+                [(entity_id, states_get(entity_id)) for entity_id in info.entities],
+            )
+        )
+
+    @callback
+    def async_flush(self, hass: HomeAssistant) -> None:
+        """Release the renders of the batch."""
+        if hass.data.get(_TEMPLATE_RENDER_BATCH) is self:
+            del hass.data[_TEMPLATE_RENDER_BATCH]
+        self.event = None
+        self.renders.clear()
+
+
+@callback
+def _async_get_render_batch(
+    hass: HomeAssistant, event: Event[EventStateChangedData]
+) -> _TemplateRenderBatch:
+    """Return the render batch of an event, starting a new one if needed."""
+    batch = hass.data.get(_TEMPLATE_RENDER_BATCH)
+    if batch is None or batch.event is not event:
+        batch = hass.data[_TEMPLATE_RENDER_BATCH] = _TemplateRenderBatch(event)
+        # The trackers of the event are refreshed in this loop iteration
+        hass.loop.call_soon(batch.async_flush, hass)
+    return batch
+
+
 def threaded_listener_factory[**_P](
     async_factory: Callable[Concatenate[HomeAssistant, _P], Any],
 ) -> Callable[Concatenate[HomeAssistant, _P], CALLBACK_TYPE]:
@@ -331,7 +445,7 @@ def async_track_state_change_event(
 @callback
 def _async_dispatch_entity_id_event_soon(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_StateEventDataT]], Any], ...]],
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
@@ -341,13 +455,13 @@ def _async_dispatch_entity_id_event_soon(
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_StateEventDataT]], Any], ...]],
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["entity_id"])):
         return
-    for job in callbacks_list.copy():
+    for job in callbacks_list:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -361,7 +475,7 @@ def _async_dispatch_entity_id_event(
 @callback
 def _async_state_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_StateEventDataT]], Any], ...]],
     event_data: _StateEventDataT,
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -420,12 +534,15 @@ def _remove_listener(
     tracker: _KeyedEventTracker[_TypedDictT],
     keys: Iterable[str],
     job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]],
 ) -> None:
     """Remove listener."""
     for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
+        jobs = list(callbacks[key])
+        jobs.remove(job)
+        if jobs:
+            callbacks[key] = tuple(jobs)
+        else:
             del callbacks[key]
 
     if not callbacks:
@@ -454,7 +571,7 @@ def _async_track_event(
         event_data = hass_data[tracker_key]
         callbacks = event_data.callbacks
     else:
-        callbacks = defaultdict(list)
+        callbacks = {}
         listener = hass.bus.async_listen(
             tracker.event_type,
             partial(tracker.dispatcher_callable, hass, callbacks),
@@ -465,17 +582,16 @@ def _async_track_event(
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
 
+    # The jobs of a key are an immutable tuple which is replaced when a job
+    # is added or removed, so dispatching can iterate it without a copy
     if isinstance(keys, str):
         # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
+        # so we optimize for that case.
+        callbacks[keys] = (*callbacks.get(keys, ()), job)
         keys = (keys,)
     else:
         for key in keys:
-            callbacks[key].append(job)
+            callbacks[key] = (*callbacks.get(key, ()), job)
 
     return partial(_remove_listener, hass, tracker, keys, job, callbacks)
 
@@ -483,7 +599,9 @@ def _async_track_event(
 @callback
 def _async_dispatch_old_entity_id_or_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventEntityRegistryUpdatedData]], Any], ...]
+    ],
     event: Event[EventEntityRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
@@ -493,7 +611,7 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
         )
     ):
         return
-    for job in callbacks_list.copy():
+    for job in callbacks_list:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -507,7 +625,9 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
 @callback
 def _async_entity_registry_updated_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventEntityRegistryUpdatedData]], Any], ...]
+    ],
     event_data: EventEntityRegistryUpdatedData,
 ) -> bool:
     """Filter entity registry updates by entity_id."""
@@ -544,7 +664,9 @@ def async_track_entity_registry_updated_event(
 @callback
 def _async_device_registry_updated_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any], ...]
+    ],
     event_data: EventDeviceRegistryUpdatedData,
 ) -> bool:
     """Filter device registry updates by device_id."""
@@ -554,13 +676,15 @@ def _async_device_registry_updated_filter(
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any], ...]
+    ],
     event: Event[EventDeviceRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["device_id"])):
         return
-    for job in callbacks_list.copy():
+    for job in callbacks_list:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -598,12 +722,12 @@ def async_track_device_registry_updated_event(
 @callback
 def _async_dispatch_domain_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[EventStateChangedData]], Any], ...]],
     event: Event[EventStateChangedData],
 ) -> None:
     """Dispatch domain event listeners."""
     domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
+    for job in callbacks.get(domain, ()) + callbacks.get(MATCH_ALL, ()):
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -615,7 +739,7 @@ def _async_dispatch_domain_event(
 @callback
 def _async_domain_added_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[EventStateChangedData]], Any], ...]],
     event_data: EventStateChangedData,
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -665,7 +789,7 @@ def _async_track_state_added_domain(
 @callback
 def _async_domain_removed_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[EventStateChangedData]], Any], ...]],
     event_data: EventStateChangedData,
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -1001,6 +1125,7 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._render_stats: dict[Template, TemplateRenderStats] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1018,9 +1143,8 @@ class TrackTemplateResultInfo:
         # Render the super template first
         if super_template is not None:
             template = super_template.template
-            variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                super_template, None, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -1039,9 +1163,8 @@ class TrackTemplateResultInfo:
             if block_render or track_template_ == super_template:
                 continue
             template = track_template_.template
-            variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                track_template_, None, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -1077,6 +1200,39 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_stats(self) -> dict[Template, TemplateRenderStats]:
+        """Render statistics of the tracked templates."""
+        return self._render_stats
+
+    @callback
+    def _async_render_to_info(
+        self,
+        track_template_: TrackTemplate,
+        batch: _TemplateRenderBatch | None,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render a template, reusing an identical render of the batch."""
+        template = track_template_.template
+        variables = track_template_.variables
+        if (stats := self._render_stats.get(template)) is None:
+            stats = self._render_stats[template] = TemplateRenderStats()
+
+        if batch is not None and (
+            info := batch.async_get(self.hass, template, variables)
+        ):
+            stats.deduplicated += 1
+            return info
+
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables, strict=strict, log_fn=log_fn)
+        stats.record(time.perf_counter() - start)
+
+        if batch is not None:
+            batch.async_add(self.hass, variables, info)
+        return info
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1126,6 +1282,7 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        batch: _TemplateRenderBatch | None,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1165,9 +1322,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        self._info[template] = info = self._async_render_to_info(track_template_, batch)
 
         try:
             result: str | TemplateError = info.result()
@@ -1239,9 +1394,17 @@ class TrackTemplateResultInfo:
 
         track_templates = track_templates or self._track_templates
 
+        # Renders triggered by the same event are shared between trackers,
+        # unless the event is replayed after a rate limit
+        batch = (
+            _async_get_render_batch(self.hass, event)
+            if event and not replayed
+            else None
+        )
+
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(super_template, now, event, batch)
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1272,7 +1435,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, batch
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -22,6 +22,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -49,6 +50,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -85,6 +87,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +105,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -153,6 +157,10 @@ CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
+MAX_BYTECODE_CACHE_SIZE = 16 * 1024 * 1024
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -2808,6 +2816,96 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled code of the templates from the previous run."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """Cache the compiled code of templates across restarts.
+
+    Templates are keyed by the hash of their source. The cache is loaded
+    into memory at startup and saved to storage with a delay when new
+    templates are compiled, so compiling a template never does I/O.
+
+    The least recently used templates are evicted when the cache grows
+    over MAX_BYTECODE_CACHE_SIZE. The whole cache is discarded when the
+    version of Home Assistant or Jinja changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            atomic_writes=True,
+        )
+        # Base64 encoded bytecode by key, ordered from least to most recently used
+        self._bytecode: dict[str, str] = {}
+        self._size = 0
+        # Templates may be compiled outside the event loop
+        self._lock = threading.Lock()
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        if (
+            not (data := await self._store.async_load())
+            or data["ha_version"] != HA_VERSION
+            or data["jinja_version"] != jinja2.__version__
+        ):
+            return
+        self._bytecode = data["bytecode"]
+        self._size = sum(len(encoded) for encoded in self._bytecode.values())
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode of a bucket if it is cached."""
+        with self._lock:
+            if (encoded := self._bytecode.pop(bucket.key, None)) is None:
+                return
+            self._bytecode[bucket.key] = encoded
+        bucket.bytecode_from_string(base64.b64decode(encoded))
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Cache the bytecode of a bucket."""
+        encoded = base64.b64encode(bucket.bytecode_to_string()).decode()
+        with self._lock:
+            bytecode = self._bytecode
+            if (old_encoded := bytecode.pop(bucket.key, None)) is not None:
+                self._size -= len(old_encoded)
+            bytecode[bucket.key] = encoded
+            self._size += len(encoded)
+            while self._size > MAX_BYTECODE_CACHE_SIZE and len(bytecode) > 1:
+                self._size -= len(bytecode.pop(next(iter(bytecode))))
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._bytecode = {}
+            self._size = 0
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        with self._lock:
+            bytecode = dict(self._bytecode)
+        return {
+            "ha_version": HA_VERSION,
+            "jinja_version": jinja2.__version__,
+            "bytecode": bytecode,
+        }
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2854,6 +2952,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        if hass is not None:
+            self.bytecode_cache = hass.data.get(_BYTECODE_CACHE)
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3209,7 +3309,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (bytecode_cache := self.bytecode_cache) is None or not isinstance(
+            source, str
+        ):
+            compiled = super().compile(source)
+        else:
+            # The source is the key so the bytecode is shared by all
+            # templates with the same source
+            bucket = bytecode_cache.get_bucket(self, source, None, source)
+            if (compiled := bucket.code) is None:
+                compiled = bucket.code = super().compile(source)
+                bytecode_cache.set_bucket(bucket)
         self.template_cache[source] = compiled
         return compiled
 
@@ -9,12 +9,13 @@ from dataclasses import dataclass
 import logging
 import pathlib
 import string
-from typing import Any
+from typing import Any, TypedDict, cast
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    __version__,
 )
 from homeassistant.core import Event, HomeAssistant, async_get_hass, callback
 from homeassistant.loader import (
@@ -23,7 +24,7 @@ from homeassistant.loader import (
     async_get_integrations,
     bind_hass,
 )
-from homeassistant.util.json import load_json
+from homeassistant.util.json import json_loads_object, load_json
 
 from . import singleton
 
@@ -31,6 +32,24 @@ _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
+TRANSLATION_BUNDLES_DIR = pathlib.Path(__file__).parent.parent / "translations"
+TRANSLATION_BUNDLE_SUFFIX = ".bundle"
+
+
+class TranslationBundleHeader(TypedDict):
+    """Header of the precompiled translations of a language.
+
+    A bundle starts with the JSON header on its first line followed by
+    the JSON of the categories of every built-in integration. The index
+    maps each integration to the offset of its categories after the
+    header and their length in bytes, so only the requested integrations
+    have to be read. The strings are flattened per category, merged with
+    the English fallback and have their placeholders validated by
+    script.translations.bundle.
+    """
+
+    ha_version: str
+    index: dict[str, list[int]]
 
 
 def recursive_flatten(
@@ -71,6 +90,41 @@ def _load_translations_files_by_language(
     return loaded
 
 
+def _load_translation_bundle(
+    language: str, components: set[str]
+) -> dict[str, dict[str, dict[str, str]]]:
+    """Load the components from the translation bundle of a language.
+
+    Nothing is loaded if the bundle was not built for this version.
+    """
+    loaded: dict[str, dict[str, dict[str, str]]] = {}
+    bundle_file = TRANSLATION_BUNDLES_DIR / f"{language}{TRANSLATION_BUNDLE_SUFFIX}"
+    try:
+        file = bundle_file.open("rb")
+    except FileNotFoundError:
+        return loaded
+
+    with file:
+        header = cast(TranslationBundleHeader, json_loads_object(file.readline()))
+        if header.get("ha_version") != __version__:
+            _LOGGER.debug("Ignoring outdated translation bundle %s", bundle_file)
+            return loaded
+
+        start = file.tell()
+        index = header["index"]
+        # Read the components in the order they are stored in the file
+        for component in sorted(
+            components.intersection(index), key=lambda component: index[component][0]
+        ):
+            offset, length = index[component]
+            file.seek(start + offset)
+            loaded[component] = cast(
+                dict[str, dict[str, str]], json_loads_object(file.read(length))
+            )
+
+    return loaded
+
+
 def build_resources(
     translation_strings: dict[str, dict[str, dict[str, Any] | str]],
     components: set[str],
@@ -229,107 +283,154 @@ class _TranslationCache:
                 continue
             integrations[domain] = int_or_exc
 
+        if bundled := await self._async_load_from_bundle(
+            language, components, integrations
+        ):
+            loaded[language].update(bundled)
+            if not (components := components - bundled):
+                return
+
         translation_by_language_strings = await _async_get_component_strings(
             self.hass, languages, components, integrations
         )
 
+        cache = self.cache_data.cache
         # English is always the fallback language so we load them first
-        self._build_category_cache(
-            language, components, translation_by_language_strings[LOCALE_EN]
+        build_category_cache(
+            cache.setdefault(language, {}),
+            language,
+            components,
+            translation_by_language_strings[LOCALE_EN],
         )
 
         if language != LOCALE_EN:
             # Now overlay the requested language on top of the English
-            self._build_category_cache(
-                language, components, translation_by_language_strings[language]
+            build_category_cache(
+                cache[language],
+                language,
+                components,
+                translation_by_language_strings[language],
             )
 
             loaded_english_components = loaded.setdefault(LOCALE_EN, set())
             # Since we just loaded english anyway we can avoid loading
             # again if they switch back to english.
             if loaded_english_components.isdisjoint(components):
-                self._build_category_cache(
-                    LOCALE_EN, components, translation_by_language_strings[LOCALE_EN]
+                build_category_cache(
+                    cache.setdefault(LOCALE_EN, {}),
+                    LOCALE_EN,
+                    components,
+                    translation_by_language_strings[LOCALE_EN],
                 )
                 loaded_english_components.update(components)
 
         loaded[language].update(components)
 
-    def _validate_placeholders(
+    async def _async_load_from_bundle(
         self,
         language: str,
-        updated_resources: dict[str, str],
-        cached_resources: dict[str, str] | None = None,
-    ) -> dict[str, str]:
-        """Validate if updated resources have same placeholders as cached resources."""
-        if cached_resources is None:
-            return updated_resources
+        components: set[str],
+        integrations: dict[str, Integration],
+    ) -> set[str]:
+        """Populate the cache from the language bundles and return loaded components.
+
+        Only built-in integrations are taken from the bundles, custom
+        integrations are always loaded from their own translation files.
+        """
+        # Development versions change their strings without a version bump
+        if "dev" in __version__:
+            return set()
+
+        built_in = {
+            domain
+            for domain in components
+            if (integration := integrations.get(domain)) and integration.is_built_in
+        }
+        if not built_in:
+            return set()
 
-        mismatches: set[str] = set()
+        bundles = await self.hass.async_add_executor_job(
+            _load_translation_bundle, language, built_in
+        )
+        cache = self.cache_data.cache.setdefault(language, {})
+        for domain, categories in bundles.items():
+            for category, category_strings in categories.items():
+                cache.setdefault(category, {})[domain] = category_strings
 
-        for key, value in updated_resources.items():
-            if key not in cached_resources:
-                continue
-            try:
-                tuples = list(string.Formatter().parse(value))
-            except ValueError:
-                _LOGGER.error(
-                    ("Error while parsing localized (%s) string %s"), language, key
-                )
-                continue
-            updated_placeholders = {tup[1] for tup in tuples if tup[1] is not None}
-
-            tuples = list(string.Formatter().parse(cached_resources[key]))
-            cached_placeholders = {tup[1] for tup in tuples if tup[1] is not None}
-            if updated_placeholders != cached_placeholders:
-                _LOGGER.error(
-                    (
-                        "Validation of translation placeholders for localized (%s) string "
-                        "%s failed: (%s != %s)"
-                    ),
-                    language,
-                    key,
-                    updated_placeholders,
-                    cached_placeholders,
-                )
-                mismatches.add(key)
+        return set(bundles)
 
-        for mismatch in mismatches:
-            del updated_resources[mismatch]
 
+def _validate_placeholders(
+    language: str,
+    updated_resources: dict[str, str],
+    cached_resources: dict[str, str] | None = None,
+) -> dict[str, str]:
+    """Validate if updated resources have same placeholders as cached resources."""
+    if cached_resources is None:
         return updated_resources
 
-    @callback
-    def _build_category_cache(
-        self,
-        language: str,
-        components: set[str],
-        translation_strings: dict[str, dict[str, Any]],
-    ) -> None:
-        """Extract resources into the cache."""
-        resource: dict[str, Any] | str
-        cached = self.cache_data.cache.setdefault(language, {})
-        categories = {
-            category
-            for component in translation_strings.values()
-            for category in component
-        }
+    mismatches: set[str] = set()
 
-        for category in categories:
-            new_resources = build_resources(translation_strings, components, category)
-            category_cache = cached.setdefault(category, {})
+    for key, value in updated_resources.items():
+        if key not in cached_resources:
+            continue
+        try:
+            tuples = list(string.Formatter().parse(value))
+        except ValueError:
+            _LOGGER.error(
+                ("Error while parsing localized (%s) string %s"), language, key
+            )
+            continue
+        updated_placeholders = {tup[1] for tup in tuples if tup[1] is not None}
+
+        tuples = list(string.Formatter().parse(cached_resources[key]))
+        cached_placeholders = {tup[1] for tup in tuples if tup[1] is not None}
+        if updated_placeholders != cached_placeholders:
+            _LOGGER.error(
+                (
+                    "Validation of translation placeholders for localized (%s) string "
+                    "%s failed: (%s != %s)"
+                ),
+                language,
+                key,
+                updated_placeholders,
+                cached_placeholders,
+            )
+            mismatches.add(key)
+
+    for mismatch in mismatches:
+        del updated_resources[mismatch]
+
+    return updated_resources
+
+
+def build_category_cache(
+    cached: dict[str, dict[str, dict[str, str]]],
+    language: str,
+    components: set[str],
+    translation_strings: dict[str, dict[str, Any]],
+) -> None:
+    """Flatten translation strings into the category cache of a language."""
+    resource: dict[str, Any] | str
+    categories = {
+        category for component in translation_strings.values() for category in component
+    }
 
-            for component, resource in new_resources.items():
-                component_cache = category_cache.setdefault(component, {})
+    for category in categories:
+        new_resources = build_resources(translation_strings, components, category)
+        category_cache = cached.setdefault(category, {})
 
-                if not isinstance(resource, dict):
-                    component_cache[f"component.{component}.{category}"] = resource
-                    continue
+        for component, resource in new_resources.items():
+            component_cache = category_cache.setdefault(component, {})
+
+            if not isinstance(resource, dict):
+                component_cache[f"component.{component}.{category}"] = resource
+                continue
 
-                prefix = f"component.{component}.{category}."
-                flat = recursive_flatten(prefix, resource)
-                flat = self._validate_placeholders(language, flat, component_cache)
-                component_cache.update(flat)
+            prefix = f"component.{component}.{category}."
+            flat = recursive_flatten(prefix, resource)
+            flat = _validate_placeholders(language, flat, component_cache)
+            component_cache.update(flat)
 
 
 @bind_hass
@@ -7,7 +7,7 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
@@ -132,6 +132,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[dict[str, ManifestCacheEntry]] = HassKey("manifest_cache")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, dict[str, float]]] = HassKey("import_timings")
+DATA_LAZY_PLATFORM_IMPORTS: HassKey[bool] = HassKey("lazy_platform_imports")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -263,6 +266,74 @@ class Manifest(TypedDict, total=False):
     single_config_entry: bool
 
 
+class ManifestCacheEntry(TypedDict):
+    """A parsed manifest in the manifest cache."""
+
+    manifest: Manifest
+    top_level_files: list[str] | None
+    # Latest modification time of the directory and the manifest
+    # of a custom integration, None for built-in integrations
+    mtime_ns: int | None
+
+
+class _ManifestCache:
+    """Lookup of parsed manifests for a batch of integrations.
+
+    The entries are shared with the event loop and are never modified
+    here, manifests that had to be read are collected in new_entries.
+    """
+
+    __slots__ = ("entries", "new_entries")
+
+    def __init__(self, entries: Mapping[str, ManifestCacheEntry]) -> None:
+        """Initialize the lookup."""
+        self.entries = entries
+        self.new_entries: dict[str, ManifestCacheEntry] = {}
+
+    def get(self, file_path: pathlib.Path, built_in: bool) -> ManifestCacheEntry | None:
+        """Return the cached manifest of an integration if it is still valid."""
+        if (entry := self.entries.get(str(file_path))) is None:
+            return None
+        if built_in:
+            return entry
+        try:
+            mtime_ns = _custom_integration_mtime_ns(file_path)
+        except OSError:
+            return None
+        return entry if entry["mtime_ns"] == mtime_ns else None
+
+    def add(
+        self,
+        file_path: pathlib.Path,
+        built_in: bool,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Add a manifest that was read from disk."""
+        try:
+            mtime_ns = None if built_in else _custom_integration_mtime_ns(file_path)
+        except OSError:
+            return
+        self.new_entries[str(file_path)] = {
+            "manifest": manifest,
+            "top_level_files": (
+                None if top_level_files is None else sorted(top_level_files)
+            ),
+            "mtime_ns": mtime_ns,
+        }
+
+
+def _custom_integration_mtime_ns(file_path: pathlib.Path) -> int:
+    """Return the latest modification time of a custom integration.
+
+    Adding or removing files changes the modification time of the
+    directory, editing the manifest only that of the manifest.
+    """
+    return max(
+        file_path.stat().st_mtime_ns, (file_path / "manifest.json").stat().st_mtime_ns
+    )
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -270,6 +341,32 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
+
+
+@callback
+def async_enable_lazy_platform_imports(hass: HomeAssistant) -> None:
+    """Import the preload platforms of integrations on first use.
+
+    The preload platforms are otherwise imported together with the
+    integration even if they are not used until much later.
+    """
+    hass.data[DATA_LAZY_PLATFORM_IMPORTS] = True
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return the import time of the modules of each integration.
+
+    The import time of a module includes the time it took to import
+    the modules it imports that were not imported before.
+    """
+    # Integrations are resolved and imported in the executor, so copy
+    # the timings without iterating over them in Python code
+    return {
+        domain: timings.copy()
+        for domain, timings in list(hass.data[DATA_IMPORT_TIMINGS].items())
+    }
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -283,7 +380,9 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
-def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
+def _get_custom_components(
+    hass: HomeAssistant, manifest_cache: _ManifestCache | None = None
+) -> dict[str, Integration]:
     """Return list of custom integrations."""
     if hass.config.recovery_mode or hass.config.safe_mode:
         return {}
@@ -304,6 +403,7 @@ def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
         hass,
         custom_components,
         [comp.name for comp in dirs],
+        manifest_cache,
     )
     return {
         integration.domain: integration
@@ -321,7 +421,11 @@ async def async_get_custom_components(
     if comps_or_future is None:
         future = hass.data[DATA_CUSTOM_COMPONENTS] = hass.loop.create_future()
 
-        comps = await hass.async_add_executor_job(_get_custom_components, hass)
+        manifest_cache = _async_get_manifest_cache(hass)
+        comps = await hass.async_add_executor_job(
+            _get_custom_components, hass, manifest_cache
+        )
+        _async_update_manifest_cache(hass, manifest_cache)
 
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
@@ -636,6 +740,23 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
     return mqtt
 
 
+@callback
+def _async_get_manifest_cache(hass: HomeAssistant) -> _ManifestCache | None:
+    """Return a manifest cache lookup if the manifest cache is enabled."""
+    if (entries := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        return None
+    return _ManifestCache(entries)
+
+
+@callback
+def _async_update_manifest_cache(
+    hass: HomeAssistant, manifest_cache: _ManifestCache | None
+) -> None:
+    """Add the manifests that were read to the manifest cache."""
+    if manifest_cache is not None and manifest_cache.new_entries:
+        hass.data[DATA_MANIFEST_CACHE].update(manifest_cache.new_entries)
+
+
 @callback
 def async_register_preload_platform(hass: HomeAssistant, platform_name: str) -> None:
     """Register a platform to be preloaded."""
@@ -649,33 +770,57 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_cache: _ManifestCache | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
+            if manifest_cache is not None and (
+                cached := manifest_cache.get(file_path, built_in)
+            ):
+                manifest = cast(Manifest, dict(cached["manifest"]))
+                top_level_files = (
+                    None
+                    if cached["top_level_files"] is None
+                    else set(cached["top_level_files"])
                 )
-                continue
+            else:
+                if not manifest_path.is_file():
+                    continue
+
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None:
+                    manifest_cache.add(
+                        file_path,
+                        built_in,
+                        cast(Manifest, dict(manifest)),
+                        top_level_files,
+                    )
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -770,6 +915,9 @@ class Integration:
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
         self._top_level_files = top_level_files or set()
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS].setdefault(
+            self.domain, {}
+        )
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @cached_property
@@ -1009,7 +1157,8 @@ class Integration:
         try:
             try:
                 comp = await self.hass.async_add_import_executor_job(
-                    self._get_component, True
+                    self._get_component,
+                    not self.hass.data.get(DATA_LAZY_PLATFORM_IMPORTS, False),
                 )
             except ModuleNotFoundError:
                 raise
@@ -1066,6 +1215,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1081,6 +1231,8 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        self._import_timings.setdefault(self.pkg_path, time.perf_counter() - start)
+
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
                 with suppress(ImportError):
@@ -1264,6 +1416,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1289,6 +1442,9 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        self._import_timings.setdefault(
+            f"{self.pkg_path}.{platform_name}", time.perf_counter() - start
+        )
         return cast(ModuleType, cache[full_name])
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -1319,13 +1475,18 @@ def _version_blocked(
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    manifest_cache: _ManifestCache | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_cache
+            )
         except Exception:
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -1411,9 +1572,11 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_cache = _async_get_manifest_cache(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root, hass, components, needed, manifest_cache
         )
+        _async_update_manifest_cache(hass, manifest_cache)
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
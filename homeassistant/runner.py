@@ -57,6 +57,8 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    lazy_platform_imports: bool = False
+
 
 def can_use_pidfd() -> bool:
     """Check if pidfd_open is available.
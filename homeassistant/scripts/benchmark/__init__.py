@@ -6,11 +6,15 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
 from timeit import default_timer as timer
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -116,6 +120,51 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+async def _fire_events_with_match_all_listeners(hass, listener_count):
+    """Fire 100k events with listener_count match all listeners."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def event_filter(event_data):
+        """Filter event."""
+        return False
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(event_name, listener)
+    for _ in range(listener_count):
+        hass.bus.async_listen(MATCH_ALL, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire_internal(event_name)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_10_match_all_listeners(hass):
+    """Fire 100k events with 10 match all listeners that reject them."""
+    return await _fire_events_with_match_all_listeners(hass, 10)
+
+
+@benchmark
+async def fire_events_1000_match_all_listeners(hass):
+    """Fire 100k events with 1000 match all listeners that reject them."""
+    return await _fire_events_with_match_all_listeners(hass, 1000)
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +357,113 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+async def _async_setup_entity_platform(hass, entity_count):
+    """Set up an entity platform with entity_count sensors."""
+    await asyncio.gather(dr.async_load(hass), er.async_load(hass))
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    entities = []
+    for idx in range(entity_count):
+        sensor = Entity()
+        sensor.entity_id = f"sensor.benchmark_{idx}"
+        sensor._attr_should_poll = False  # noqa: SLF001
+        entities.append(sensor)
+    await platform.async_add_entities(entities)
+    return platform, entities
+
+
+@benchmark
+async def write_ha_state_entities(hass):
+    """Write the states of 200 entities a thousand times one by one."""
+    _, entities = await _async_setup_entity_platform(hass, 200)
+
+    start = timer()
+    for value in range(1000):
+        for sensor in entities:
+            sensor._attr_state = value  # noqa: SLF001
+            sensor.async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def write_ha_states_platform(hass):
+    """Write the states of 200 entities a thousand times as a batch."""
+    platform, entities = await _async_setup_entity_platform(hass, 200)
+
+    start = timer()
+    for value in range(1000):
+        for sensor in entities:
+            sensor._attr_state = value  # noqa: SLF001
+        platform.async_write_ha_states(entities)
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states_orm(hass):
+    """Write 21000 states to the recorder database through the session."""
+    return await hass.async_add_executor_job(_write_states_rows, False)
+
+
+@benchmark
+async def recorder_write_states_bulk(hass):
+    """Write 21000 states to the recorder database with multi-row inserts."""
+    return await hass.async_add_executor_job(_write_states_rows, True)
+
+
+def _write_states_rows(bulk):
+    """Write the states of 1000 entities 21 times in a single commit."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_writer import StatesBulkWriter
+    from homeassistant.components.recorder.const import SQLITE_MODERN_MAX_BIND_VARS
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    rows = []
+    for idx in range(1000):
+        states_meta = StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+        state_attributes = StateAttributes(shared_attrs="{}", hash=idx)
+        rows.extend((states_meta, state_attributes))
+        old_state = None
+        for state_idx in range(21):
+            old_state = States(
+                state=str(state_idx),
+                last_updated_ts=state_idx,
+                states_meta_rel=states_meta,
+                state_attributes=state_attributes,
+                old_state=old_state,
+            )
+            rows.append(old_state)
+
+    start = timer()
+    with Session(engine) as session:
+        if bulk:
+            states_bulk_writer = StatesBulkWriter(
+                SQLITE_MODERN_MAX_BIND_VARS, engine.dialect
+            )
+            for row in rows:
+                states_bulk_writer.add(row)
+            states_bulk_writer.write(session)
+        else:
+            session.add_all(rows)
+        session.commit()
+    runtime = timer() - start
+    engine.dispose()
+    return runtime
@@ -181,10 +181,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable-next=possibly-unused-variable
-    def mock_load(filename, secrets=None):
+    def mock_load(filename, secrets=None, cache=None, dependencies=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
-        return MOCKS["load"][1](filename, secrets)
+        return MOCKS["load"][1](filename, secrets, cache, dependencies)
 
     # pylint: disable-next=possibly-unused-variable
     def mock_secrets(ldr, node):
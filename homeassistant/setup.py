@@ -72,6 +72,12 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TRACE is a list of the setup phases which finished
+# during startup, with the time they started and how long they took.
+DATA_SETUP_TRACE: HassKey[list[tuple[str, str | None, SetupPhases, float, float]]] = (
+    HassKey("setup_trace")
+)
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -730,6 +736,14 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_TRACE)
+def _setup_trace(
+    hass: core.HomeAssistant,
+) -> list[tuple[str, str | None, SetupPhases, float, float]]:
+    """Return the setup trace list."""
+    return []
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -776,6 +790,7 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        _setup_trace(hass).append((integration, group, phase, started, time_taken))
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -816,6 +831,45 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the startup setup phases in the Chrome trace event format.
+
+    Every integration is shown as a thread with the setup phases of
+    the integration and its groups as complete events, so the trace
+    can be loaded in chrome://tracing or Perfetto.
+    """
+    setup_trace = _setup_trace(hass)
+    trace_start = min((started for *_, started, _ in setup_trace), default=0.0)
+    thread_ids: dict[str, int] = {}
+    trace_events: list[dict[str, Any]] = []
+    for integration, group, phase, started, time_taken in setup_trace:
+        if (thread_id := thread_ids.get(integration)) is None:
+            thread_id = thread_ids[integration] = len(thread_ids) + 1
+            trace_events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": thread_id,
+                    "args": {"name": integration},
+                }
+            )
+        trace_events.append(
+            {
+                "name": integration if group is None else f"{integration} ({group})",
+                "cat": phase,
+                "ph": "X",
+                "ts": round((started - trace_start) * 1_000_000),
+                "dur": round(time_taken * 1_000_000),
+                "pid": 1,
+                "tid": thread_id,
+                "args": {"group": group},
+            }
+        )
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
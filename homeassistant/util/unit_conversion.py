@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -116,6 +116,30 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def converter_factory_batch(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Sequence[float | None]], list[float | None]]:
+        """Return a function to convert a column of values which allows None.
+
+        Converting a whole column avoids a function call per value, which adds
+        up when converting long term statistics of many entities.
+        """
+        if from_unit == to_unit:
+            return list
+        return cls._batch_converter_factory(from_unit, to_unit)
+
+    @classmethod
+    def _batch_converter_factory(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Sequence[float | None]], list[float | None]]:
+        """Return a function to convert a column of values between two units."""
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [
+            None if val is None else (val / from_ratio) * to_ratio for val in values
+        ]
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -416,6 +440,16 @@ class SpeedConverter(BaseUnitConverter):
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: (val / from_ratio) * to_ratio
 
+    @classmethod
+    def _batch_converter_factory(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Sequence[float | None]], list[float | None]]:
+        """Return a function to convert a column of speeds between two units."""
+        if UnitOfSpeed.BEAUFORT not in (from_unit, to_unit):
+            return super()._batch_converter_factory(from_unit, to_unit)
+        convert = cls._converter_factory(from_unit, to_unit)
+        return lambda values: [None if val is None else convert(val) for val in values]
+
     @classmethod
     def _ms_to_beaufort(cls, ms: float) -> float:
         """Convert a speed in m/s to Beaufort."""
@@ -513,6 +547,14 @@ class TemperatureConverter(BaseUnitConverter):
             UNIT_NOT_RECOGNIZED_TEMPLATE.format(from_unit, cls.UNIT_CLASS)
         )
 
+    @classmethod
+    def _batch_converter_factory(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Sequence[float | None]], list[float | None]]:
+        """Return a function to convert a column of temperatures between two units."""
+        convert = cls._converter_factory(from_unit, to_unit)
+        return lambda values: [None if val is None else convert(val) for val in values]
+
     @classmethod
     def convert_interval(cls, interval: float, from_unit: str, to_unit: str) -> float:
         """Convert a temperature interval from one unit to another.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+import copy
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
@@ -34,6 +35,10 @@ from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
 JSON_TYPE = list | dict | str
 
+# A dependency of a parsed YAML file is a (kind, name) tuple, which is
+# mapped to its fingerprint at the time the file was parsed.
+type _Dependencies = dict[tuple[str, str], Any]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -49,11 +54,9 @@ class Secrets:
         self.config_dir = config_dir
         self._cache: dict[Path, dict[str, str]] = {}
 
-    def get(self, requester_path: str, secret: str) -> str:
-        """Return the value of a secret."""
-        current_path = Path(requester_path)
-
-        secret_dir = current_path
+    def secret_dirs(self, requester_path: str) -> Iterator[Path]:
+        """Return the directories searched for secrets of a file, nearest first."""
+        secret_dir = Path(requester_path)
         while True:
             secret_dir = secret_dir.parent
 
@@ -61,8 +64,13 @@ class Secrets:
                 secret_dir.relative_to(self.config_dir)
             except ValueError:
                 # We went above the config dir
-                break
+                return
+
+            yield secret_dir
 
+    def get(self, requester_path: str, secret: str) -> str:
+        """Return the value of a secret."""
+        for secret_dir in self.secret_dirs(requester_path):
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -108,11 +116,90 @@ class Secrets:
         return secrets
 
 
+def _file_fingerprint(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file, None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _fingerprint(kind: str, name: str) -> Any:
+    """Return the current fingerprint of a dependency."""
+    if kind == "dir":
+        return list(_find_files(name, "*.yaml"))
+    if kind == "env":
+        return os.environ.get(name)
+    # Files and secrets files
+    return _file_fingerprint(name)
+
+
+class YamlCache:
+    """Cache of parsed YAML files.
+
+    A file is parsed again when it or one of the files, directories, secrets
+    files or environment variables it depends on has changed. The included
+    files are cached separately, so a change to an included file only parses
+    that file and the files including it again.
+
+    Data is copied in and out of the cache as loaded YAML is mutated when the
+    configuration is processed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[
+            tuple[str, Path | None], tuple[JSON_TYPE | None, _Dependencies]
+        ] = {}
+
+    def load(
+        self,
+        fname: str | os.PathLike[str],
+        secrets: Secrets | None = None,
+        dependencies: _Dependencies | None = None,
+    ) -> JSON_TYPE | None:
+        """Load a YAML file from the cache or parse it if it changed.
+
+        The dependencies of the file are added to dependencies if passed.
+        """
+        fname = os.fspath(fname)
+        key = (fname, None if secrets is None else secrets.config_dir)
+        if (entry := self._entries.get(key)) is not None and all(
+            _fingerprint(*dependency) == fingerprint
+            for dependency, fingerprint in entry[1].items()
+        ):
+            data, file_dependencies = entry
+            data = copy.deepcopy(data)
+        else:
+            file_dependencies = {("file", fname): _file_fingerprint(fname)}
+            with open(fname, encoding="utf-8") as conf_file:
+                data = parse_yaml(conf_file, secrets, self, file_dependencies)
+            # Files that can't be fingerprinted are never cached
+            if all(
+                fingerprint is not None
+                for (kind, _), fingerprint in file_dependencies.items()
+                if kind == "file"
+            ):
+                self._entries[key] = (copy.deepcopy(data), file_dependencies)
+
+        if dependencies is not None:
+            dependencies.update(file_dependencies)
+        return data
+
+    def clear(self) -> None:
+        """Remove all files from the cache."""
+        self._entries.clear()
+
+
 class _LoaderMixin:
     """Mixin class with extensions for YAML loader."""
 
     name: str
     stream: Any
+    secrets: Secrets | None
+    cache: YamlCache | None
+    dependencies: _Dependencies
 
     @cached_property
     def get_name(self) -> str:
@@ -128,7 +215,13 @@ class _LoaderMixin:
 class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
     """The fastest available safe loader, either C or Python."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+        dependencies: _Dependencies | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
 
@@ -142,6 +235,8 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
 
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
+        self.dependencies = {} if dependencies is None else dependencies
 
 
 class SafeLoader(FastSafeLoader):
@@ -178,10 +273,18 @@ class SafeLoader(FastSafeLoader):
 class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
     """Python safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+        dependencies: _Dependencies | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
+        self.dependencies = {} if dependencies is None else dependencies
 
 
 class SafeLineLoader(PythonSafeLoader):
@@ -219,14 +322,23 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
+    dependencies: _Dependencies | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    If a cache is passed, the file and the files it includes are only parsed
+    again when they changed since they were last loaded with the cache. What
+    the file depends on is then added to dependencies if passed.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
     try:
+        if cache is not None:
+            return cache.load(fname, secrets, dependencies)
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
@@ -239,14 +351,16 @@ def load_yaml(
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    loaded_yaml = load_yaml(fname, secrets, cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -255,28 +369,38 @@ def load_yaml_dict(
 
 
 def parse_yaml(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
+    dependencies: _Dependencies | None = None,
 ) -> JSON_TYPE:
-    """Parse YAML with the fastest available loader."""
+    """Parse YAML with the fastest available loader.
+
+    Included files are loaded with the cache if passed and what the content
+    depends on is added to dependencies.
+    """
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cache, dependencies)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(FastSafeLoader, content, secrets, cache, dependencies)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cache, dependencies)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
+    dependencies: _Dependencies | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the python loader (this is very slow)."""
     try:
-        return _parse_yaml(PythonSafeLoader, content, secrets)
+        return _parse_yaml(PythonSafeLoader, content, secrets, cache, dependencies)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -286,9 +410,14 @@ def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
+    dependencies: _Dependencies | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
+    return yaml.load(
+        content,
+        Loader=lambda stream: loader(stream, secrets, cache, dependencies),  # type: ignore[arg-type]
+    )
 
 
 @overload
@@ -379,7 +508,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
         return _add_reference(loaded_yaml, loader, node)
@@ -394,6 +523,19 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
+def _find_yaml_files(loader: LoaderType, directory: str) -> list[str]:
+    """Return the YAML files in a directory and track them if cached."""
+    files = list(_find_files(directory, "*.yaml"))
+    if loader.cache is not None:
+        loader.dependencies["dir", directory] = files
+    return files
+
+
+def _load_included_yaml(loader: LoaderType, fname: str) -> JSON_TYPE | None:
+    """Load a YAML file included by the file of the loader."""
+    return load_yaml(fname, loader.secrets, loader.cache, loader.dependencies)
+
+
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
@@ -409,11 +551,11 @@ def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDi
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loader, loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -429,10 +571,10 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference_to_node_class(mapping, loader, node)
@@ -446,9 +588,9 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loader, loc)
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := _load_included_yaml(loader, f)) is not None
     ]
 
 
@@ -459,10 +601,10 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -528,6 +670,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if loader.cache is not None:
+        loader.dependencies["env", args[0]] = os.environ.get(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -543,6 +687,11 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
+    if loader.cache is not None:
+        for secret_dir in loader.secrets.secret_dirs(loader.get_name):
+            secret_path = str(secret_dir / SECRET_YAML)
+            loader.dependencies["secrets", secret_path] = _file_fingerprint(secret_path)
+
     return loader.secrets.get(loader.get_name, node.value)
 
 
@@ -0,0 +1,82 @@
+"""Compile the translations of the built-in integrations into language bundles."""
+
+import json
+from typing import Any
+
+from homeassistant.const import __version__
+from homeassistant.helpers.translation import (
+    LOCALE_EN,
+    TRANSLATION_BUNDLE_SUFFIX,
+    TRANSLATION_BUNDLES_DIR,
+    TranslationBundleHeader,
+    build_category_cache,
+)
+
+from .const import INTEGRATIONS_DIR
+from .util import load_json_from_path
+
+
+def load_strings(names: dict[str, str], language: str) -> dict[str, dict[str, Any]]:
+    """Load the translations of all integrations for a language."""
+    translation_strings: dict[str, dict[str, Any]] = {}
+    for domain, name in names.items():
+        translation_file = (
+            INTEGRATIONS_DIR / domain / "translations" / f"{language}.json"
+        )
+        strings = (
+            load_json_from_path(translation_file) if translation_file.is_file() else {}
+        )
+        # Translations that miss "title" will get integration put in.
+        strings.setdefault("title", name)
+        translation_strings[domain] = strings
+    return translation_strings
+
+
+def _dump_json(data: Any) -> bytes:
+    """Return compact JSON without line breaks."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def run() -> None:
+    """Write a translation bundle for every language."""
+    names: dict[str, str] = {}
+    languages: set[str] = {LOCALE_EN}
+    for manifest_file in sorted(INTEGRATIONS_DIR.glob("*/manifest.json")):
+        domain = manifest_file.parent.name
+        names[domain] = load_json_from_path(manifest_file)["name"]
+        languages.update(
+            path.stem for path in (manifest_file.parent / "translations").glob("*.json")
+        )
+
+    components = set(names)
+    english_strings = load_strings(names, LOCALE_EN)
+    TRANSLATION_BUNDLES_DIR.mkdir(exist_ok=True)
+
+    for language in sorted(languages):
+        categories: dict[str, dict[str, dict[str, str]]] = {}
+        # English is always the fallback language so we build it first
+        build_category_cache(categories, language, components, english_strings)
+        if language != LOCALE_EN:
+            build_category_cache(
+                categories, language, components, load_strings(names, language)
+            )
+
+        header: TranslationBundleHeader = {"ha_version": __version__, "index": {}}
+        body: list[bytes] = []
+        offset = 0
+        for domain in sorted(components):
+            domain_categories = _dump_json(
+                {
+                    category: category_strings[domain]
+                    for category, category_strings in categories.items()
+                    if domain in category_strings
+                }
+            )
+            header["index"][domain] = [offset, len(domain_categories)]
+            body.append(domain_categories)
+            offset += len(domain_categories)
+
+        bundle_file = TRANSLATION_BUNDLES_DIR / f"{language}{TRANSLATION_BUNDLE_SUFFIX}"
+        bundle_file.write_bytes(b"\n".join((_dump_json(header), b"".join(body))))
+
+    print(f"Wrote translation bundles for {len(languages)} languages")
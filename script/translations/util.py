@@ -17,6 +17,7 @@ def get_base_arg_parser() -> argparse.ArgumentParser:
         "action",
         type=str,
         choices=[
+            "bundle",
             "clean",
             "deduplicate",
             "develop",
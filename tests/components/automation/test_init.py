@@ -1346,6 +1346,52 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+async def test_reload_only_changed_automations(
+    hass: HomeAssistant, calls: list[ServiceCall], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test only changed automations are recreated on reload."""
+    caplog.set_level(logging.DEBUG)
+
+    def automation_config(alias: str, action: str, **extra: Any) -> dict[str, Any]:
+        return {
+            "alias": alias,
+            "triggers": {"platform": "event", "event_type": "test_event"},
+            "actions": [{"action": action}],
+            **extra,
+        }
+
+    with patch(
+        "homeassistant.components.automation.AutomationEntity", wraps=AutomationEntity
+    ) as automation_entity_init:
+        config = {
+            automation.DOMAIN: [
+                automation_config("with id", "test.automation", id="sun"),
+                automation_config("unchanged", "test.automation"),
+                automation_config("changed", "test.automation"),
+            ]
+        }
+        assert await async_setup_component(hass, automation.DOMAIN, config)
+        assert automation_entity_init.call_count == 3
+        automation_entity_init.reset_mock()
+
+        config[automation.DOMAIN][2] = automation_config("changed", "test.other")
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+
+        assert automation_entity_init.call_count == 1
+        assert "Processed automations: 2 unchanged, 1 removed, 1 created" in caplog.text
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 @pytest.mark.parametrize("extra_config", [{}, {"id": "sun"}])
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls: list[ServiceCall], extra_config: dict[str, str]
@@ -0,0 +1,109 @@
+"""Test the MQTT topic trie."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/b/c", "a/b/c/d", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a//c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("+/+", "a/b", True),
+        ("+", "/", False),
+        ("+/", "/", True),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "b/a", False),
+        ("a/+/#", "a/b", True),
+        ("a/+/#", "a", False),
+        ("#", "a/b/c", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against topic filters."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "item")
+    assert trie.match(topic) == (["item"] if matches else [])
+
+
+def test_add_and_remove() -> None:
+    """Test the cached matches are updated when filters are added or removed."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/sensor/state", "simple")
+    assert trie.match("home/sensor/state") == ["simple"]
+
+    trie.add("home/+/state", "single")
+    trie.add("home/#", "multi")
+    assert sorted(trie.match("home/sensor/state")) == ["multi", "simple", "single"]
+    assert trie.match("home/sensor") == ["multi"]
+    assert trie.has_topic_filter("home/+/state")
+    assert not trie.has_topic_filter("home/+")
+    assert sorted(trie) == ["multi", "simple", "single"]
+    assert sorted(trie.iter_wildcard()) == ["multi", "single"]
+
+    trie.remove("home/#", "multi")
+    assert sorted(trie.match("home/sensor/state")) == ["simple", "single"]
+    assert trie.match("home/sensor") == []
+    trie.remove("home/+/state", "single")
+    trie.remove("home/sensor/state", "simple")
+    assert trie.match("home/sensor/state") == []
+    assert not trie.has_topic_filter("home/+/state")
+    assert list(trie) == []
+
+    with pytest.raises(KeyError):
+        trie.remove("home/+/state", "single")
+    with pytest.raises(KeyError):
+        trie.remove("home/sensor/state", "simple")
+
+
+def test_match_cache_size() -> None:
+    """Test the least recently used matches are evicted from the cache."""
+    trie: TopicTrie[str] = TopicTrie(cache_size=2)
+    trie.add("home/+", "item")
+    first = trie.match("home/a")
+    assert trie.match("home/a") is first
+    trie.match("home/b")
+    trie.match("home/c")
+    assert trie.match("home/a") is not first
+    assert trie.match("home/a") == ["item"]
+
+
+def test_match_many_subscriptions() -> None:
+    """Test matching 100k messages against 10k subscriptions."""
+    trie: TopicTrie[str] = TopicTrie()
+    for device in range(2500):
+        for suffix in ("state", "availability", "set"):
+            trie.add(f"zigbee2mqtt/device_{device}/{suffix}", f"{device}/{suffix}")
+        trie.add(f"tasmota/+/device_{device}/#", f"{device}/tasmota")
+    trie.add("zigbee2mqtt/+/state", "all_states")
+    trie.add("homeassistant/#", "discovery")
+
+    matched = 0
+    with patch.object(
+        TopicTrie, "_match", autospec=True, side_effect=TopicTrie._match
+    ) as mock_match:
+        for message in range(100000):
+            device = message % 3000
+            if message % 2:
+                matched += len(trie.match(f"zigbee2mqtt/device_{device}/state"))
+            else:
+                matched += len(trie.match(f"tasmota/tele/device_{device}/SENSOR"))
+
+    # The zigbee2mqtt state topics of devices 0-2499 match two subscriptions,
+    # the other devices only match the zigbee2mqtt/+/state wildcard
+    assert matched == 133500
+    # Each of the 3000 different topics is only matched against the trie once
+    assert mock_match.call_count == 3000
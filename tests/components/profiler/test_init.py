@@ -20,6 +20,7 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_IMPORT_TIMES,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -244,6 +245,29 @@ async def test_log_current_tasks(
     await hass.async_block_till_done()
 
 
+async def test_log_import_times(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the import times of integrations."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_IMPORT_TIMES)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_IMPORT_TIMES, {}, blocking=True)
+
+    assert "Import time of profiler" in caplog.text
+    assert "homeassistant.components.profiler" in caplog.text
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_scheduled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -5,13 +5,15 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from typing import Any
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.const import DOMAIN
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
@@ -19,6 +21,7 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.services import SERVICE_PURGE_ENTITIES
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
@@ -1014,3 +1017,141 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def _as_dicts(
+    states: dict[str, list[State | dict[str, Any]]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Convert history results to dicts so they can be compared."""
+    return {
+        entity_id: [
+            state.as_dict() if isinstance(state, State) else state
+            for state in entity_states
+        ]
+        for entity_id, entity_states in states.items()
+    }
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 1000}])
+async def test_history_cache_matches_database(hass: HomeAssistant) -> None:
+    """Test the states served by the history cache match the database."""
+    instance = recorder.get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+    start = dt_util.utcnow() + timedelta(seconds=10)
+    entity_ids = ["sensor.one", "climate.two", "light.three"]
+
+    for idx in range(10):
+        with freeze_time(start + timedelta(seconds=idx)):
+            hass.states.async_set("sensor.one", str(idx // 2), {"idx": idx})
+            hass.states.async_set("climate.two", "heat", {"temperature": idx})
+            if idx % 3 == 0:
+                hass.states.async_set("light.three", "on" if idx % 2 else "off")
+        with freeze_time(start + timedelta(seconds=idx, milliseconds=500)):
+            hass.states.async_set("light.three", hass.states.get("light.three").state)
+    await async_wait_recording_done(hass)
+    assert history_cache.rows == 24
+
+    def _get_states() -> list[dict[str, list[State | dict[str, Any]]]]:
+        results: list[dict[str, list[State | dict[str, Any]]]] = []
+        for start_time, end_time in (
+            (start - timedelta(seconds=1), None),
+            (start + timedelta(seconds=2.5), None),
+            (start + timedelta(seconds=2.5), start + timedelta(seconds=7.5)),
+        ):
+            results.extend(
+                history.get_significant_states(
+                    hass, start_time, end_time, ids, **kwargs
+                )
+                for ids in (entity_ids, ["sensor.one"])
+                for kwargs in (
+                    {},
+                    {"significant_changes_only": False},
+                    {"minimal_response": True},
+                    {"no_attributes": True, "compressed_state_format": True},
+                    {"include_start_time_state": False},
+                )
+            )
+            results.extend(
+                history.state_changes_during_period(
+                    hass, start_time, end_time, "light.three", **kwargs
+                )
+                for kwargs in (
+                    {},
+                    {"descending": True, "limit": 2},
+                    {"no_attributes": True, "include_start_time_state": False},
+                )
+            )
+        return results
+
+    # Drop the oldest states from the cache so some queries need the database
+    for cutoff_ts in (start.timestamp() - 1, start.timestamp() + 5):
+        history_cache.evict_purged_before(cutoff_ts)
+        cached = await instance.async_add_executor_job(_get_states)
+        with patch.object(instance, "history_cache", None):
+            uncached = await instance.async_add_executor_job(_get_states)
+        assert [_as_dicts(states) for states in cached] == [
+            _as_dicts(states) for states in uncached
+        ]
+        assert any(states for states in cached)
+
+    assert history_cache.hits
+    assert history_cache.partial_hits
+    assert history_cache.misses
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 5}])
+async def test_history_cache_size_limit(hass: HomeAssistant) -> None:
+    """Test the history cache drops the oldest states when it is full."""
+    instance = recorder.get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+    start = dt_util.utcnow() + timedelta(seconds=10)
+    for idx in range(20):
+        with freeze_time(start + timedelta(seconds=idx)):
+            hass.states.async_set("sensor.one", str(idx))
+    await async_wait_recording_done(hass)
+    assert 0 < history_cache.rows <= 5
+    assert history_cache.covered_from_ts > start.timestamp()
+
+    states = await instance.async_add_executor_job(
+        history.get_significant_states, hass, start, None, ["sensor.one"]
+    )
+    assert [state.state for state in states["sensor.one"]] == [
+        str(idx) for idx in range(1, 20)
+    ]
+    assert history_cache.partial_hits == 1
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 1000}])
+async def test_history_cache_purge(hass: HomeAssistant) -> None:
+    """Test purging entity data evicts the states from the history cache."""
+    instance = recorder.get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+    start = dt_util.utcnow() + timedelta(seconds=10)
+    for idx in range(5):
+        with freeze_time(start + timedelta(seconds=idx)):
+            hass.states.async_set("sensor.one", str(idx))
+            hass.states.async_set("sensor.two", str(idx))
+    await async_wait_recording_done(hass)
+    assert history_cache.rows == 10
+
+    with freeze_time(start + timedelta(seconds=10)):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PURGE_ENTITIES,
+            {"entity_id": "sensor.one", "keep_days": 0},
+            blocking=True,
+        )
+        await async_wait_recording_done(hass)
+    assert history_cache.rows == 5
+
+    states = await instance.async_add_executor_job(
+        history.get_significant_states,
+        hass,
+        start,
+        None,
+        ["sensor.one", "sensor.two"],
+    )
+    assert list(states) == ["sensor.two"]
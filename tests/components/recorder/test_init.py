@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, Mock, patch
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm.session import Session
 from sqlalchemy.pool import QueuePool
 
 from homeassistant.components import recorder
@@ -33,7 +34,9 @@ from homeassistant.components.recorder import (
     migration,
     statistics,
 )
+from homeassistant.components.recorder.bulk_writer import StatesBulkWriter
 from homeassistant.components.recorder.const import (
+    DB_READER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -136,6 +139,8 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        history_cache_size=0,
+        db_read_workers=0,
     )
 
 
@@ -231,6 +236,74 @@ async def test_shutdown_closes_connections(
         assert instance.get_session()
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{"db_read_workers": 2}])
+async def test_async_add_read_job(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test read jobs run in the read executor with read-only connections.
+
+    This test is specific for SQLite.
+    """
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    def _count_states() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return threading.current_thread().name, session.query(States).count()
+
+    thread_name, count = await recorder_mock.async_add_read_job(_count_states)
+    assert thread_name.startswith(DB_READER_PREFIX)
+    assert count == 1
+
+    def _delete_states() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(States).delete()
+
+    with pytest.raises(OperationalError, match="readonly"):
+        await recorder_mock.async_add_read_job(_delete_states)
+    assert recorder_mock.read_queue_stats.jobs == 2
+
+    # A job which does not get a thread before the timeout never runs
+    started = threading.Barrier(3)
+    release = threading.Event()
+
+    def _block() -> None:
+        started.wait()
+        release.wait()
+
+    blocking = [
+        hass.async_create_task(recorder_mock.async_add_read_job(_block))
+        for _ in range(2)
+    ]
+    await hass.async_add_executor_job(started.wait)
+    ran: list[bool] = []
+    with pytest.raises(TimeoutError):
+        await recorder_mock.async_add_read_job(ran.append, True, timeout=0.01)
+    release.set()
+    await asyncio.gather(*blocking)
+    await recorder_mock.async_add_read_job(_count_states)
+    assert ran == []
+    assert recorder_mock.read_queue_stats.jobs == 5
+
+    # A job which started before the timeout runs to completion
+    slow_started = threading.Event()
+    slow_release = threading.Event()
+
+    def _slow() -> bool:
+        slow_started.set()
+        slow_release.wait()
+        return True
+
+    slow = hass.async_create_task(recorder_mock.async_add_read_job(_slow, timeout=0.01))
+    await hass.async_add_executor_job(slow_started.wait)
+    await asyncio.sleep(0.05)
+    assert not slow.done()
+    slow_release.set()
+    assert await slow is True
+    assert recorder_mock.read_queue_stats.jobs == 6
+
+
 async def test_state_gets_saved_when_set_before_start_event(
     hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
 ) -> None:
@@ -401,8 +474,11 @@ async def test_saving_state_with_exception(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    # Failures of the bulk writer are not retried, they are tested in
+    # test_saving_state_with_operational_error_during_bulk_write
     with (
         patch("time.sleep"),
+        patch.object(get_instance(hass), "states_bulk_writer", None),
         patch.object(
             get_instance(hass).event_session,
             "flush",
@@ -444,6 +520,12 @@ async def test_saving_state_with_sqlalchemy_exception(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    def _throw_if_state_in_bulk_writer(
+        states_bulk_writer: StatesBulkWriter, session: Session
+    ) -> None:
+        if states_bulk_writer.pending_states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+
     with (
         patch("time.sleep"),
         patch.object(
@@ -451,6 +533,12 @@ async def test_saving_state_with_sqlalchemy_exception(
             "flush",
             side_effect=_throw_if_state_in_session,
         ),
+        patch.object(
+            StatesBulkWriter,
+            "write",
+            autospec=True,
+            side_effect=_throw_if_state_in_bulk_writer,
+        ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -470,6 +558,83 @@ async def test_saving_state_with_sqlalchemy_exception(
     assert "SQLAlchemyError error processing task" not in caplog.text
 
 
+async def test_saving_state_with_exception_during_bulk_write(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    setup_recorder: None,
+) -> None:
+    """Test saving state after the bulk writer failed part way through a write."""
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    instance = get_instance(hass)
+    assert instance.states_bulk_writer is not None
+    original_insert = StatesBulkWriter._insert
+    inserts = 0
+
+    def _throw_on_second_insert(*args: Any) -> None:
+        nonlocal inserts
+        inserts += 1
+        if inserts == 2:
+            raise ValueError("forced to fail")
+        original_insert(*args)
+
+    with patch.object(
+        StatesBulkWriter, "_insert", autospec=True, side_effect=_throw_on_second_insert
+    ):
+        hass.states.async_set(entity_id, "fail", attributes)
+        await async_wait_recording_done(hass)
+
+    assert "Error while processing event" in caplog.text
+
+    caplog.clear()
+    hass.states.async_set(entity_id, "restoring_from_db", attributes)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state == "restoring_from_db"
+
+    assert "IntegrityError" not in caplog.text
+    assert "Unhandled database error" not in caplog.text
+
+
+async def test_saving_state_with_operational_error_during_bulk_write(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    setup_recorder: None,
+) -> None:
+    """Test an operational error of the bulk writer is not retried."""
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    instance = get_instance(hass)
+    assert instance.states_bulk_writer is not None
+
+    with patch.object(
+        StatesBulkWriter,
+        "write",
+        autospec=True,
+        side_effect=OperationalError("insert the state", {}, "forced to fail"),
+    ) as write_mock:
+        hass.states.async_set(entity_id, "fail", attributes)
+        await async_wait_recording_done(hass)
+
+    assert write_mock.call_count == 1
+    assert "Unhandled database error while processing task" in caplog.text
+    assert "retrying" not in caplog.text
+
+    caplog.clear()
+    hass.states.async_set(entity_id, "restoring_from_db", attributes)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state == "restoring_from_db"
+
+    assert "Unhandled database error" not in caplog.text
+
+
 async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -1494,6 +1659,81 @@ async def test_saving_state_with_serializable_data(
     assert "State is not JSON serializable" in caplog.text
 
 
+async def test_saving_many_states_in_one_commit(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    recorder_db_url: str,
+) -> None:
+    """Test saving many states for the same entities in a single commit."""
+    config = {
+        recorder.CONF_DB_URL: recorder_db_url,
+        recorder.CONF_COMMIT_INTERVAL: 60,
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    if recorder_db_url.startswith("sqlite://"):
+        assert instance.states_bulk_writer is not None
+
+    for idx in range(5):
+        hass.states.async_set("test.one", f"one_{idx}", {"shared": True})
+        hass.states.async_set("test.two", f"two_{idx}", {"shared": True})
+        hass.states.async_set("test.three", f"three_{idx}", {"idx": idx})
+    hass.states.async_remove("test.three")
+    # The commit is only triggered once the recorder has the pending writes
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        )
+        assert len(states) == 16
+        assert session.query(StatesMeta).count() == 3
+        # shared, five for test.three and the empty attributes of the removal
+        assert session.query(StateAttributes).count() == 7
+
+    states_by_state = {state.state: state for state in states}
+    removed = states[-1]
+    assert removed.entity_id == "test.three"
+    assert removed.state is None
+    assert removed.old_state_id == states_by_state["three_4"].state_id
+
+    for entity_id in ("one", "two", "three"):
+        assert states_by_state[f"{entity_id}_0"].old_state_id is None
+        for idx in range(1, 5):
+            assert (
+                states_by_state[f"{entity_id}_{idx}"].old_state_id
+                == states_by_state[f"{entity_id}_{idx - 1}"].state_id
+            )
+    assert (
+        states_by_state["one_4"].attributes_id == states_by_state["two_0"].attributes_id
+    )
+    assert (
+        states_by_state["three_3"].attributes_id
+        != states_by_state["three_4"].attributes_id
+    )
+
+    # The next commit links the old_state_id to the committed states
+    hass.states.async_set("test.one", "one_5", {"shared": True})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        state = (
+            session.query(States.old_state_id, States.attributes_id)
+            .filter(States.state == "one_5")
+            .one()
+        )
+    assert state.old_state_id == states_by_state["one_4"].state_id
+    assert state.attributes_id == states_by_state["one_4"].attributes_id
+
+
 async def test_has_services(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test the services exist."""
     assert hass.services.has_service(DOMAIN, SERVICE_DISABLE)
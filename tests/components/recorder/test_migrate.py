@@ -2,6 +2,7 @@
 
 import datetime
 import importlib
+import json
 import sqlite3
 import sys
 from unittest.mock import ANY, Mock, PropertyMock, call, patch
@@ -26,6 +27,7 @@ from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -641,12 +643,78 @@ async def test_schema_migrate(
         assert instrument_migration.apply_update_mock.called
 
 
+async def test_backfill_ref_counts(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the ref_count of the state attributes is backfilled."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("my.entity", "on", {"attr": 1})
+    hass.states.async_set("my.entity", "off", {"attr": 1})
+    hass.states.async_set("my.other", "on", {"attr": 2})
+    await async_wait_recording_done(hass)
+
+    def _reset_and_backfill() -> dict[int, int | None]:
+        with session_scope(session=instance.get_session()) as session:
+            session.query(StateAttributes).update({StateAttributes.ref_count: None})
+        with patch.object(migration, "REF_COUNT_BACKFILL_BATCH_SIZE", 1):
+            migration._backfill_ref_counts(
+                instance,
+                instance.get_session,
+                "state_attributes",
+                "attributes_id",
+                "states",
+            )
+        with session_scope(session=instance.get_session()) as session:
+            return {
+                json.loads(row.shared_attrs)["attr"]: row.ref_count
+                for row in session.query(StateAttributes)
+            }
+
+    assert await instance.async_add_executor_job(_reset_and_backfill) == {1: 2, 2: 1}
+
+
 def test_invalid_update(hass: HomeAssistant) -> None:
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
         migration._apply_update(Mock(), hass, Mock(), Mock(), -1, 0)
 
 
+def test_statistics_rollup_tables_created_by_migration(
+    hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test an existing database gets the statistics rollup tables when migrated."""
+    rollup_tables = {
+        "statistics_daily",
+        "statistics_monthly",
+        "statistics_rollup_runs",
+    }
+    engine = create_engine(recorder_db_url, poolclass=StaticPool)
+    # A new database is created with all tables
+    assert {table.name for table in migration.get_tables_to_create(engine)} == set(
+        db_schema.Base.metadata.tables
+    )
+
+    db_schema.Base.metadata.create_all(
+        engine,
+        [
+            table
+            for table in db_schema.Base.metadata.sorted_tables
+            if table.name not in rollup_tables
+        ],
+    )
+    assert rollup_tables.isdisjoint(
+        table.name for table in migration.get_tables_to_create(engine)
+    )
+
+    session_maker = scoped_session(sessionmaker(bind=engine, future=True))
+    migration._apply_update(Mock(), hass, engine, session_maker, 49, 48)
+    assert rollup_tables <= set(inspect(engine).get_table_names())
+    # The migration can be applied again
+    migration._apply_update(Mock(), hass, engine, session_maker, 49, 48)
+    engine.dispose()
+
+
 @pytest.mark.parametrize(
     ("engine_type", "substr"),
     [
@@ -15,6 +15,7 @@ from voluptuous.error import MultipleInvalid
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -206,6 +207,54 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_ref_counts(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the ref_count of attributes and event data is maintained."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    def _ref_counts() -> tuple[dict[str, int | None], list[int | None]]:
+        with session_scope(hass=hass) as session:
+            return (
+                {
+                    next(iter(json.loads(row.shared_attrs))): row.ref_count
+                    for row in session.query(StateAttributes)
+                },
+                [
+                    row.ref_count
+                    for row in session.query(EventData)
+                    if "test_attr_10" in row.shared_data
+                ],
+            )
+
+    assert _ref_counts() == (
+        {"autopurgeme": 2, "purgeme": 2, "dontpurgeme": 2},
+        [6],
+    )
+
+    # A ref_count which is too low must not purge attributes still in use
+    with session_scope(hass=hass) as session:
+        session.query(StateAttributes).update({StateAttributes.ref_count: 0})
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    assert purge_old_data(recorder_mock, purge_before, repack=False)
+
+    attributes_ref_counts, data_ref_counts = _ref_counts()
+    assert attributes_ref_counts == {"dontpurgeme": 0}
+    assert data_ref_counts == [2]
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+    # The ref_count of rows written to the database is incremented
+    hass.states.async_set(
+        "test.recorder2",
+        "on",
+        {"dontpurgeme": True, "test_attr": 5, "test_attr_10": "nice"},
+    )
+    hass.bus.async_fire("EVENT_TEST", {"test_attr": 5, "test_attr_10": "nice"})
+    await async_wait_recording_done(hass)
+    assert _ref_counts() == ({"dontpurgeme": 1}, [3])
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
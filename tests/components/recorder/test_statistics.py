@@ -9,7 +9,13 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    Statistics,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsRollupRuns,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1850,110 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-05 12:00:00+00:00")
+async def test_rollup_statistics(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+) -> None:
+    """Test daily and monthly statistics are read from the rollup tables."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    first_hour = dt_util.as_utc(dt_util.parse_datetime("2022-09-20 00:00:00"))
+    external_statistics = [
+        {
+            "start": first_hour + timedelta(hours=hour),
+            "mean": hour % 24,
+            "min": hour % 24 - 1,
+            "max": hour % 24 + 1,
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(15 * 24)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    zero = dt_util.as_utc(dt_util.parse_datetime("2022-09-01 00:00:00"))
+    expected_days = statistics_during_period(hass, zero, period="day")
+    expected_months = statistics_during_period(hass, zero, period="month")
+    expected_change = statistics_during_period(
+        hass, zero, period="day", types={"change"}
+    )
+    assert len(expected_days["test:total_energy_import"]) in (15, 16)
+    assert len(expected_months["test:total_energy_import"]) == 2
+
+    # Compiling an hour of statistics rolls up the finished days and months
+    do_adhoc_statistics(
+        hass, start=dt_util.as_utc(dt_util.parse_datetime("2022-10-05 10:55:00"))
+    )
+    await async_wait_recording_done(hass)
+
+    day_start = dt_util.start_of_local_day(dt_util.utcnow()).timestamp()
+    month_start = (
+        dt_util.start_of_local_day(dt_util.utcnow()).replace(day=1).timestamp()
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        runs = {run.period: run for run in session.query(StatisticsRollupRuns)}
+        assert runs["day"].time_zone == timezone
+        assert runs["day"].end_ts == day_start
+        assert runs["day"].start_ts == day_start - 7 * 86400
+        assert runs["month"].end_ts == month_start
+        daily = session.query(StatisticsDaily).count()
+        monthly = session.query(StatisticsMonthly).count()
+    assert daily == 7
+    assert monthly == 1
+
+    assert statistics_during_period(hass, zero, period="day") == expected_days
+    assert statistics_during_period(hass, zero, period="month") == expected_months
+    assert (
+        statistics_during_period(hass, zero, period="day", types={"change"})
+        == expected_change
+    )
+
+    # The hourly statistics covered by both rollups are no longer read
+    with session_scope(hass=hass) as session:
+        session.query(Statistics).filter(
+            Statistics.start_ts >= day_start - 7 * 86400,
+            Statistics.start_ts < month_start,
+        ).delete()
+    assert statistics_during_period(hass, zero, period="day") == expected_days
+    assert statistics_during_period(hass, zero, period="month") == expected_months
+
+    # Adjusting the hourly statistics rebuilds the rollups from the adjusted hour
+    adjust_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 12:00:00"))
+    recorder.get_instance(hass).async_adjust_statistics(
+        "test:total_energy_import", adjust_start, 1000, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="day", types={"sum"})
+    for expected, row in zip(
+        expected_days["test:total_energy_import"],
+        stats["test:total_energy_import"],
+        strict=True,
+    ):
+        adjusted = row["end"] > adjust_start.timestamp()
+        assert row["sum"] == expected["sum"] + (1000 if adjusted else 0)
+
+    # The rollups are removed with the statistics
+    recorder.get_instance(hass).async_clear_statistics(["test:total_energy_import"])
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 0
+        assert session.query(StatisticsMonthly).count() == 0
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
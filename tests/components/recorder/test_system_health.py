@@ -38,6 +38,39 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 1000}])
+async def test_recorder_system_health_history_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health with the history cache enabled."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["history_cache_rows"] == 1
+    assert info["history_cache_hits"] == 0
+    assert info["history_cache_partial_hits"] == 0
+    assert info["history_cache_misses"] == 0
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"db_read_workers": 2}])
+async def test_recorder_system_health_read_queue(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health with the read executor enabled."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    await recorder_mock.async_add_read_job(int)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["read_jobs"] == 1
+    assert info["read_queue_wait_average"] >= 0
+    assert info["read_queue_wait_max"] >= info["read_queue_wait_average"]
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
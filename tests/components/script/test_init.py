@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+import logging
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -557,6 +558,45 @@ async def test_reload_unchanged_script(
         assert len(calls) == 2
 
 
+async def test_reload_only_changed_scripts(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test only changed scripts are recreated on reload."""
+    caplog.set_level(logging.DEBUG)
+    with patch(
+        "homeassistant.components.script.ScriptEntity", wraps=ScriptEntity
+    ) as script_entity_init:
+        config = {
+            script.DOMAIN: {
+                "unchanged": {"sequence": [{"action": "test.script"}]},
+                "changed": {"sequence": [{"action": "test.script"}]},
+                "removed": {"sequence": [{"action": "test.script"}]},
+            }
+        }
+        assert await async_setup_component(hass, script.DOMAIN, config)
+        assert script_entity_init.call_count == 3
+        script_entity_init.reset_mock()
+
+        config = {
+            script.DOMAIN: {
+                "unchanged": {"sequence": [{"action": "test.script"}]},
+                "changed": {"sequence": [{"action": "test.other"}]},
+            }
+        }
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ):
+            await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+        assert script_entity_init.call_count == 1
+        assert "Processed scripts: 1 unchanged, 2 removed, 1 created" in caplog.text
+
+    assert hass.states.get("script.unchanged")
+    assert hass.states.get("script.changed")
+
+
 async def test_service_descriptions(hass: HomeAssistant) -> None:
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -35,7 +35,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -313,6 +318,104 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_accumulated(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test compiling statistics from the states accumulated by the recorder."""
+    zero = get_start_time(dt_util.utcnow())
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero) as freezer:
+        # sensor.test2 does not change after the accumulator is started
+        hass.states.async_set("sensor.test2", "20", attributes=attributes)
+        await async_setup_component(hass, "sensor", {})
+        # Wait for the sensor recorder platform to be added
+        await async_recorder_block_till_done(hass)
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+        freezer.move_to(zero + timedelta(minutes=6))
+        hass.states.async_set("sensor.test1", "50", attributes=attributes)
+        freezer.move_to(zero + timedelta(minutes=15))
+        await async_wait_recording_done(hass)
+
+        # The first period starts before the first accumulated state
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+        with patch(
+            "homeassistant.components.sensor.recorder._get_history",
+            wraps=sensor_recorder._get_history,
+        ) as get_history_mock:
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5))
+            await async_wait_recording_done(hass)
+            # Only the unchanged sensor is loaded from the database
+            assert len(get_history_mock.mock_calls) == 1
+            assert [
+                state.entity_id for state in get_history_mock.mock_calls[0].args[2]
+            ] == ["sensor.test2"]
+
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=10))
+            await async_wait_recording_done(hass)
+            assert len(get_history_mock.mock_calls) == 1
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(13.050847),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=10)).timestamp(),
+                "mean": pytest.approx(46.0),
+                "min": pytest.approx(30.0),
+                "max": pytest.approx(50.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": process_timestamp(zero + timedelta(minutes=10)).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=15)).timestamp(),
+                "mean": pytest.approx(50.0),
+                "min": pytest.approx(50.0),
+                "max": pytest.approx(50.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(
+                    zero + timedelta(minutes=period)
+                ).timestamp(),
+                "end": process_timestamp(
+                    zero + timedelta(minutes=period + 5)
+                ).timestamp(),
+                "mean": pytest.approx(20.0),
+                "min": pytest.approx(20.0),
+                "max": pytest.approx(20.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+            for period in (0, 5, 10)
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
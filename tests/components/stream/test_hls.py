@@ -2,7 +2,7 @@
 
 from datetime import timedelta
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from urllib.parse import urlparse
 
 import av
@@ -383,6 +383,43 @@ async def test_hls_playlist_view(
     await stream.stop()
 
 
+async def test_hls_playlist_cache(
+    hass: HomeAssistant, setup_component, stream_worker_sync
+) -> None:
+    """Test the playlist is only rendered again when the last segment changes."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    hls.put(Segment(sequence=0, duration=SEGMENT_DURATION))
+    hls.put(Segment(sequence=1))
+    await hass.async_block_till_done()
+
+    render = Mock(return_value="playlist")
+    playlist = hls.get_playlist(render)
+    assert playlist == b"playlist"
+    assert hls.get_playlist(render) is playlist
+    assert render.call_count == 1
+
+    hls.get_segment(1).async_add_part(
+        Part(duration=1.0, has_keyframe=True, data=FAKE_PAYLOAD), 0
+    )
+    hls.get_playlist(render)
+    assert render.call_count == 2
+
+    hls.get_segment(1).duration = SEGMENT_DURATION
+    hls.get_playlist(render)
+    assert render.call_count == 3
+
+    hls.put(Segment(sequence=2))
+    await hass.async_block_till_done()
+    hls.get_playlist(render)
+    hls.get_playlist(render)
+    assert render.call_count == 4
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_max_segments(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
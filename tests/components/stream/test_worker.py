@@ -380,6 +380,52 @@ async def test_stream_worker_success(hass: HomeAssistant) -> None:
     assert len(decoded_stream.audio_packets) == 0
 
 
+async def test_segment_data_shares_buffer(hass: HomeAssistant) -> None:
+    """Test the parts of a segment are views of a single buffer."""
+    decoded_stream = await async_decode_stream(
+        hass, PacketSequence(LONGER_TEST_SEQUENCE_LENGTH)
+    )
+    complete_segments = decoded_stream.complete_segments
+    assert complete_segments
+    for segment in complete_segments:
+        assert all(isinstance(part.data, memoryview) for part in segment.parts)
+        buffer = segment.parts[0].data.obj
+        assert all(part.data.obj is buffer for part in segment.parts)
+        data = segment.get_data()
+        assert data.obj is buffer
+        assert data == b"".join(bytes(part.data) for part in segment.parts)
+
+
+async def test_segment_buffer_grows(hass: HomeAssistant) -> None:
+    """Test the parts keep their data when the segment buffer is full."""
+    with (
+        patch("homeassistant.components.stream.worker.SEGMENT_BUFFER_INITIAL_SIZE", 1),
+        patch("homeassistant.components.stream.worker.SEGMENT_BUFFER_HEADROOM", 0),
+    ):
+        decoded_stream = await async_decode_stream(
+            hass, PacketSequence(LONGER_TEST_SEQUENCE_LENGTH)
+        )
+    complete_segments = decoded_stream.complete_segments
+    assert complete_segments
+    for segment in complete_segments:
+        assert len(segment.parts) > 1
+        # The buffer grew while the parts were appended
+        buffers = [part.data.obj for part in segment.parts]
+        assert buffers[0] is not buffers[-1]
+        data = segment.get_data()
+        assert data.obj is buffers[-1]
+        assert data == b"".join(bytes(part.data) for part in segment.parts)
+
+
+async def test_stream_worker_long_stream(hass: HomeAssistant) -> None:
+    """Test muxing a long synthetic stream into segments."""
+    num_packets = 600 * VIDEO_FRAME_RATE
+    decoded_stream = await async_decode_stream(hass, PacketSequence(num_packets))
+    complete_segments = decoded_stream.complete_segments
+    assert len(complete_segments) == int((num_packets - 1) * SEGMENTS_PER_PACKET)
+    assert all(segment.data_size for segment in complete_segments)
+
+
 async def test_skip_out_of_order_packet(hass: HomeAssistant) -> None:
     """Skip a single out of order packet."""
     packets = list(PacketSequence(TEST_SEQUENCE_LENGTH))
@@ -2,16 +2,22 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
 from homeassistant import loader
+from homeassistant.auth.permissions import PermissionLookup
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import (
+    commands as websocket_api_commands,
+    const,
+)
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -22,11 +28,12 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +41,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -843,6 +851,112 @@ async def test_get_states_not_allows_nan(
     ]
 
 
+async def test_get_states_payload_cache(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test only the changed states are serialized again."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.other_entity", "world")
+
+    with patch(
+        "homeassistant.components.websocket_api.commands._async_serialize_state",
+        wraps=websocket_api_commands._async_serialize_state,
+    ) as mock_serialize:
+        for msg_id in (5, 6):
+            await websocket_client.send_json({"id": msg_id, "type": "get_states"})
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == msg_id
+            assert [state["entity_id"] for state in msg["result"]] == [
+                "test.entity",
+                "test.other_entity",
+            ]
+        assert mock_serialize.call_count == 2
+
+        for state in ("goodbye", "hello again", "goodbye again"):
+            hass.states.async_set("test.entity", state)
+        await websocket_client.send_json({"id": 7, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert [(state["entity_id"], state["state"]) for state in msg["result"]] == [
+            ("test.entity", "goodbye again"),
+            ("test.other_entity", "world"),
+        ]
+        assert mock_serialize.call_count == 3
+        assert mock_serialize.mock_calls[-1].args[1].entity_id == "test.entity"
+
+        hass.states.async_remove("test.entity")
+        hass.states.async_set("test.new_entity", "new")
+        await websocket_client.send_json({"id": 8, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert [(state["entity_id"], state["state"]) for state in msg["result"]] == [
+            ("test.other_entity", "world"),
+            ("test.new_entity", "new"),
+        ]
+        assert mock_serialize.call_count == 4
+
+
+async def test_get_states_payload_cache_dropped_when_idle(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the payload cache stops listening once get_states is not called."""
+    hass.states.async_set("test.entity", "hello")
+    listeners_before = hass.bus.async_listeners().get("state_changed", 0)
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 1
+
+    hass.states.async_set("test.entity", "goodbye")
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 1
+
+    freezer.tick(websocket_api_commands.SERIALIZED_STATES_CACHE_IDLE_TIMEOUT + 1)
+    hass.states.async_set("test.entity", "hello again")
+    assert hass.bus.async_listeners().get("state_changed", 0) == listeners_before
+
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert [(state["entity_id"], state["state"]) for state in msg["result"]] == [
+        ("test.entity", "hello again"),
+    ]
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 1
+
+
+async def test_get_states_restricted_user_follows_registry(
+    hass: HomeAssistant,
+    hass_admin_user: MockUser,
+    websocket_client: MockHAClientWebSocket,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test restricted users see entity registry changes to their permissions."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entity_entry = entity_registry.async_get_or_create("light", "test", "unique")
+    hass.states.async_set(entity_entry.entity_id, "on")
+    hass.states.async_set("test.other_entity", "world")
+
+    hass_admin_user.groups = []
+    hass_admin_user.perm_lookup = PermissionLookup(entity_registry, device_registry)
+    hass_admin_user.mock_policy({"entities": {"device_ids": {device_entry.id: True}}})
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == []
+
+    # The permissions object is not replaced when the entity moves to the device
+    entity_registry.async_update_entity(
+        entity_entry.entity_id, device_id=device_entry.id
+    )
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert [state["entity_id"] for state in msg["result"]] == [entity_entry.entity_id]
+
+
 async def test_subscribe_unsubscribe_events_whitelist(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1310,6 +1424,122 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_by_subscriptions(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test unfiltered entity subscriptions share the state changed listener."""
+    hass.states.async_set("light.permitted", "off")
+    # The serialized states cache keeps its own listener
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    listeners_before = hass.bus.async_listeners().get("state_changed", 0)
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 1
+
+    hass.states.async_set("light.permitted", "on")
+    for msg_id in (7, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"] == {
+            "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+
+    hass.states.async_set("light.permitted", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+    await websocket_client.send_json(
+        {"id": 10, "type": "unsubscribe_events", "subscription": 8}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert msg["success"]
+    assert hass.bus.async_listeners().get("state_changed", 0) == listeners_before
+
+
+async def test_subscribe_entities_coalesce_interval(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test changes to entities during the coalesce interval are merged."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass.states.async_set("light.unchanged", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_interval": 1}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert set(msg["event"]["a"]) == {
+        "light.changed",
+        "light.removed",
+        "light.unchanged",
+    }
+
+    hass.states.async_set("light.changed", "on", {"color": "red"})
+    hass.states.async_set("light.changed", "on", {"effect": "help"})
+    hass.states.async_set("light.changed", "off", {"effect": "help"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added_and_removed", "on")
+    hass.states.async_remove("light.added_and_removed")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.changed": {
+                "+": {"a": {"effect": "help"}, "c": ANY, "lc": ANY},
+                "-": {"a": ["color"]},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.unchanged", "off", {"color": "blue"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    # The pending changes are dropped when unsubscribing
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.1):
+            await websocket_client.receive_json()
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
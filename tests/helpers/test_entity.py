@@ -26,6 +26,7 @@ from homeassistant.const import (
     EntityCategory,
 )
 from homeassistant.core import (
+    CompactState,
     Context,
     HassJobType,
     HomeAssistant,
@@ -589,6 +590,28 @@ async def test_async_remove_no_platform(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_compact_state_attributes(hass: HomeAssistant) -> None:
+    """Test entities can opt in to compact state attributes."""
+
+    class CompactEntity(entity.Entity):
+        _compact_state_attributes = True
+        _attr_extra_state_attributes = {"forecast": [{"temperature": 10}]}
+
+    platform = MockEntityPlatform(hass, domain="test")
+    ent = CompactEntity()
+    ent.entity_id = "test.compact"
+    await platform.async_add_entities([ent, entity.Entity()])
+
+    state = hass.states.get("test.compact")
+    assert isinstance(state, CompactState)
+    assert state.attributes == {"forecast": [{"temperature": 10}]}
+    assert not any(
+        isinstance(state, CompactState)
+        for state in hass.states.async_all()
+        if state.entity_id != "test.compact"
+    )
+
+
 async def test_async_remove_runs_callbacks(hass: HomeAssistant) -> None:
     """Test async_remove runs on_remove callback."""
     result = []
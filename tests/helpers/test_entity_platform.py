@@ -12,7 +12,12 @@ from syrupy.assertion import SnapshotAssertion
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+    EntityCategory,
+)
 from homeassistant.core import (
     CoreState,
     HomeAssistant,
@@ -45,6 +50,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_platform,
     mock_registry,
@@ -632,6 +638,48 @@ async def test_async_remove_with_platform_update_finishes(hass: HomeAssistant) -
         assert hass.states.async_entity_ids() == []
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of many entities at once."""
+
+    class CustomWriteEntity(MockEntity):
+        """Mock entity which customizes writing its state."""
+
+        @callback
+        def _async_write_ha_state(self) -> None:
+            written.append(self.entity_id)
+            super()._async_write_ha_state()
+
+    written: list[str] = []
+    platform = MockEntityPlatform(hass)
+    entities = [MockEntity(name=f"test_{idx}", should_poll=False) for idx in range(3)]
+    custom = CustomWriteEntity(name="custom", should_poll=False)
+    removed = MockEntity(name="removed", should_poll=False)
+    await platform.async_add_entities([*entities, custom, removed])
+    await removed.async_remove()
+    written.clear()
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for idx, entity in enumerate([*entities, custom, removed]):
+        entity._attr_state = str(idx)
+    platform.async_write_ha_states([*entities, custom, removed])
+    await hass.async_block_till_done()
+
+    assert written == [custom.entity_id]
+    assert sorted(event.data["new_state"].state for event in events) == [
+        "0",
+        "1",
+        "2",
+        "3",
+    ]
+    assert hass.states.get(removed.entity_id) is None
+    # All states of the batch are written with the same timestamp
+    batch_events = [
+        event for event in events if event.data["entity_id"] != custom.entity_id
+    ]
+    assert len({event.time_fired_timestamp for event in batch_events}) == 1
+    assert len({event.data["new_state"].last_updated for event in batch_events}) == 1
+
+
 async def test_not_adding_duplicate_entities_with_unique_id(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -26,6 +26,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TEMPLATE_RENDER_BATCH,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -1756,6 +1757,69 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_shares_renders(hass: HomeAssistant) -> None:
+    """Test identical templates triggered by the same event render once."""
+    template_str = "{{ states('sensor.power') }}-{{ states('sensor.echo') }}"
+    results: list[list[str]] = [[], [], []]
+
+    def _make_callback(idx: int) -> Callable[..., None]:
+        @ha.callback
+        def _run_callback(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            results[idx].append(updates.pop().result)
+            if idx == 0 and event and event.data["entity_id"] == "sensor.power":
+                hass.states.async_set("sensor.echo", event.data["new_state"].state)
+
+        return _run_callback
+
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), variables)],
+            _make_callback(idx),
+        )
+        for idx, variables in enumerate((None, None, {"factor": 3}))
+    ]
+    await hass.async_block_till_done()
+    templates = [info._track_templates[0].template for info in infos]
+
+    hass.states.async_set("sensor.echo", "1")
+    await hass.async_block_till_done()
+    assert results == [["unknown-1"], ["unknown-1"], ["unknown-1"]]
+
+    stats = [
+        info.render_stats[template]
+        for info, template in zip(infos, templates, strict=True)
+    ]
+    assert [(stat.renders, stat.deduplicated) for stat in stats] == [
+        (2, 0),
+        (1, 1),
+        (2, 0),
+    ]
+    assert all(stat.total_duration >= stat.max_duration > 0 for stat in stats)
+
+    # The first tracker changes sensor.echo before the others are
+    # refreshed, so its render of the sensor.power change can not be shared
+    hass.states.async_set("sensor.power", "5")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert results[0] == ["unknown-1", "5-1", "5-5"]
+    assert results[1] == ["unknown-1", "5-5"]
+    assert results[2] == ["unknown-1", "5-5"]
+    assert [(stat.renders, stat.deduplicated) for stat in stats] == [
+        (4, 0),
+        (2, 2),
+        (4, 0),
+    ]
+
+    # The batch is flushed in the loop iteration after the trackers refreshed
+    assert _TEMPLATE_RENDER_BATCH in hass.data
+    await asyncio.sleep(0)
+    assert _TEMPLATE_RENDER_BATCH not in hass.data
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
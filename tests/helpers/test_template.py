@@ -13,6 +13,8 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -31,6 +33,7 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
     UnitOfVolume,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -5170,6 +5173,63 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the compiled code of templates is reused after a restart."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+    await hass.async_block_till_done()
+
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == HA_VERSION
+    assert len(data["bytecode"]) == 1
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(jinja2.Environment, "compile") as compile_mock:
+        assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+    assert not compile_mock.called
+
+    # The cache is discarded when the version changes
+    data["ha_version"] = "2024.1.0"
+    await template.async_load_bytecode_cache(hass)
+    assert not hass.data[template._BYTECODE_CACHE]._bytecode
+
+
+async def test_bytecode_cache_eviction(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the least recently used templates are evicted from the bytecode cache."""
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    env = template.TemplateEnvironment(hass)
+    env.compile("{{ 1 }}")
+    max_size = bytecode_cache._size * 5 // 2
+    with patch.object(template, "MAX_BYTECODE_CACHE_SIZE", max_size):
+        env.compile("{{ 2 }}")
+        # Compiling the first template again marks it as recently used
+        env.compile("{{ 1 }}")
+        env.compile("{{ 3 }}")
+    await hass.async_block_till_done()
+
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    bytecode = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]["bytecode"]
+    assert list(bytecode) == [
+        bytecode_cache.get_cache_key(source) for source in ("{{ 1 }}", "{{ 3 }}")
+    ]
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
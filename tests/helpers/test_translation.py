@@ -1,6 +1,7 @@
 """Test the translation helper."""
 
 import asyncio
+import json
 import pathlib
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -682,3 +683,44 @@ async def test_get_translations_still_has_title_without_translations_files(
     assert translations == {
         "component.component1.title": "Component 1",
     }
+
+
+@pytest.mark.parametrize(
+    ("ha_version", "bundle_version", "switch_title"),
+    [
+        ("2024.11.0", "2024.11.0", "Bundled switch"),
+        ("2024.11.0", "2024.10.0", "Switch"),
+        ("2024.11.0.dev0", "2024.11.0.dev0", "Switch"),
+    ],
+)
+async def test_get_translations_from_bundle(
+    hass: HomeAssistant,
+    tmp_path: pathlib.Path,
+    ha_version: str,
+    bundle_version: str,
+    switch_title: str,
+) -> None:
+    """Test built-in translations are loaded from a bundle of the same version."""
+    sensor = json.dumps({"title": {"component.sensor.title": "Bundled sensor"}})
+    switch = json.dumps({"title": {"component.switch.title": "Bundled switch"}})
+    header = {
+        "ha_version": bundle_version,
+        "index": {
+            "sensor": [0, len(sensor)],
+            "switch": [len(sensor), len(switch)],
+        },
+    }
+    (tmp_path / "en.bundle").write_text(f"{json.dumps(header)}\n{sensor}{switch}")
+
+    with (
+        patch.object(translation, "TRANSLATION_BUNDLES_DIR", tmp_path),
+        patch.object(translation, "__version__", ha_version),
+    ):
+        translations = await translation.async_get_translations(
+            hass, "en", "title", ["switch", "light"]
+        )
+
+    assert translations == {
+        "component.switch.title": switch_title,
+        "component.light.title": "Light",
+    }
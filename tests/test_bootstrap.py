@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
+from datetime import timedelta
 import glob
 import logging
 import os
@@ -26,11 +27,13 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.util import dt as dt_util
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -40,6 +43,13 @@ from .common import (
 VERSION_PATH = os.path.join(get_test_config_dir(), config_util.VERSION_FILE)
 
 
+@pytest.fixture(autouse=True)
+def mock_write_startup_trace() -> Generator[Mock]:
+    """Avoid writing the startup trace to the test config dir."""
+    with patch("homeassistant.bootstrap.write_utf8_file") as mock_write:
+        yield mock_write
+
+
 @pytest.fixture(autouse=True)
 def disable_installed_check() -> Generator[None]:
     """Disable package installed check."""
@@ -252,6 +262,109 @@ async def test_setup_after_deps_all_present(hass: HomeAssistant) -> None:
     assert order == ["logger", "root", "first_dep", "second_dep"]
 
 
+async def test_critical_path_priorities(hass: HomeAssistant) -> None:
+    """Test domains are prioritized by the longest chain of dependants."""
+    for domain, manifest in (
+        ("root", {}),
+        ("child", {"dependencies": ["root"]}),
+        ("grandchild", {"dependencies": ["child"], "after_dependencies": ["slow"]}),
+        ("slow", {}),
+        ("standalone", {}),
+    ):
+        mock_integration(hass, MockModule(domain, partial_manifest=manifest))
+    domains = {"root", "child", "grandchild", "slow", "standalone"}
+    integrations = {
+        domain: await loader.async_get_integration(hass, domain) for domain in domains
+    }
+
+    priorities = bootstrap._critical_path_priorities(
+        domains, integrations, {"slow": 5, "grandchild": 1}
+    )
+    assert priorities == {
+        "root": pytest.approx(1.2),
+        "child": pytest.approx(1.1),
+        "grandchild": pytest.approx(1),
+        "slow": pytest.approx(6),
+        "standalone": pytest.approx(0.1),
+    }
+
+
+async def test_setup_timings_and_trace_saved(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_write_startup_trace: Mock,
+) -> None:
+    """Test the setup timings are saved and the startup trace is written."""
+    hass_storage[bootstrap.SETUP_TIMINGS_STORAGE_KEY] = {
+        "version": bootstrap.SETUP_TIMINGS_STORAGE_VERSION,
+        "key": bootstrap.SETUP_TIMINGS_STORAGE_KEY,
+        "data": {"root": 3.0, "removed": 1.0},
+    }
+    mock_integration(hass, MockModule(domain="root"))
+    hass.set_state(CoreState.not_running)
+
+    with patch(
+        "homeassistant.bootstrap.async_get_setup_timings", return_value={"root": 1.0}
+    ):
+        await bootstrap._async_set_up_integrations(hass, {"root": {}})
+        await hass.async_block_till_done()
+
+    assert "root" in hass.config.components
+    assert len(mock_write_startup_trace.mock_calls) == 1
+    path, trace, _, mode = mock_write_startup_trace.mock_calls[0][1]
+    assert path == hass.config.path(bootstrap.STARTUP_TRACE_FILENAME)
+    assert mode == "wb"
+    assert b'"name":"root"' in trace
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=bootstrap.SETUP_TIMINGS_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[bootstrap.SETUP_TIMINGS_STORAGE_KEY]["data"] == {"root": 2.0}
+
+
+async def test_manifest_cache_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the manifest cache is enabled and saved for release versions."""
+    hass_storage[bootstrap.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": bootstrap.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": bootstrap.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {"ha_version": "2024.10.0", "manifests": {"/removed": {}}},
+    }
+    with patch("homeassistant.bootstrap.__version__", "2024.11.0"):
+        manifest_cache = await bootstrap._async_load_manifest_cache(hass)
+        assert manifest_cache is not None
+        # Manifests of other versions are dropped
+        assert hass.data[loader.DATA_MANIFEST_CACHE] == {}
+        integration = await loader.async_get_integration(hass, "sun")
+        bootstrap._async_save_manifest_cache(hass, *manifest_cache)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=bootstrap.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[bootstrap.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == "2024.11.0"
+    assert data["manifests"].keys() == {str(integration.file_path)}
+
+    # Nothing is saved when all manifests came from the cache
+    hass.data[loader.DATA_INTEGRATIONS].pop("sun")
+    with patch("homeassistant.bootstrap.__version__", "2024.11.0"):
+        manifest_cache = await bootstrap._async_load_manifest_cache(hass)
+        assert manifest_cache is not None
+        await loader.async_get_integration(hass, "sun")
+        with patch("homeassistant.helpers.storage.Store.async_delay_save") as mock_save:
+            bootstrap._async_save_manifest_cache(hass, *manifest_cache)
+    assert not mock_save.called
+
+    # Development versions do not use the manifest cache
+    hass.data.pop(loader.DATA_MANIFEST_CACHE)
+    with patch("homeassistant.bootstrap.__version__", "2024.11.0.dev0"):
+        assert await bootstrap._async_load_manifest_cache(hass) is None
+    assert loader.DATA_MANIFEST_CACHE not in hass.data
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     """Test after_dependencies are ignored in stage 1."""
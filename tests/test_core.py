@@ -60,6 +60,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     ServiceValidationError,
 )
+from homeassistant.helpers.entity import StateInfo
 from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
@@ -1121,6 +1122,112 @@ def test_state_as_compressed_state_json() -> None:
     assert state.as_compressed_state_json is as_compressed_state
 
 
+def test_compact_state() -> None:
+    """Test a CompactState keeps its attributes encoded."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    attributes = {"pig": "dog", "forecast": ({"temperature": 10},)}
+    states = [
+        ha.CompactState(
+            entity_id,
+            "on",
+            attributes,
+            last_updated=last_time,
+            last_changed=last_time,
+            last_reported=last_time,
+            context=ha.Context(id="01H0D6H5K3SZJ3XGDHED1TJ79N"),
+        )
+        for entity_id in ("happy.happy", "happy.sad")
+    ]
+    reference = ha.State(
+        "happy.happy",
+        "on",
+        attributes,
+        last_updated=last_time,
+        last_changed=last_time,
+        last_reported=last_time,
+        context=ha.Context(id="01H0D6H5K3SZJ3XGDHED1TJ79N"),
+    )
+    state = states[0]
+
+    # Attributes are decoded from JSON, so tuples become lists
+    assert state.attributes == {"pig": "dog", "forecast": [{"temperature": 10}]}
+    assert isinstance(state.attributes, ReadOnlyDict)
+    assert state.name == "happy"
+    assert state.as_dict_json == reference.as_dict_json
+    assert state.as_compressed_state_json == reference.as_compressed_state_json
+
+    # Identical attributes are shared between states
+    assert state._attributes_json is states[1]._attributes_json
+    assert state.attributes is states[1].attributes
+
+    # Attributes which can not be encoded are kept as is
+    unencodable = ha.CompactState("happy.happy", "on", {"obj": object()})
+    assert unencodable._attributes_json is None
+    assert "obj" in unencodable.attributes
+
+
+async def test_statemachine_compact_state(hass: HomeAssistant) -> None:
+    """Test the state machine creates compact states when requested."""
+    state_info: StateInfo = {
+        "unrecorded_attributes": frozenset(),
+        "compact_attributes": True,
+    }
+    hass.states.async_set(
+        "light.compact", "on", {"brightness": 100}, False, None, state_info
+    )
+    hass.states.async_set("light.regular", "on", {"brightness": 100})
+
+    compact = hass.states.get("light.compact")
+    assert isinstance(compact, ha.CompactState)
+    assert compact.attributes == {"brightness": 100}
+    assert type(hass.states.get("light.regular")) is ha.State
+
+    hass.states.async_set(
+        "light.compact", "off", {"brightness": 100}, False, None, state_info
+    )
+    new_compact = hass.states.get("light.compact")
+    assert new_compact.state == "off"
+    assert new_compact._attributes_json is compact._attributes_json
+
+
+async def test_statemachine_compact_state_same_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test compact states with non JSON attribute types are reported when unchanged."""
+    state_info: StateInfo = {
+        "unrecorded_attributes": frozenset(),
+        "compact_attributes": True,
+    }
+    attributes = {
+        "hs_color": (30.0, 50.0),
+        "media_position_updated_at": datetime(2024, 1, 1, tzinfo=dt_util.UTC),
+    }
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set("light.compact", "on", attributes, False, None, state_info)
+    state = hass.states.get("light.compact")
+    hass.states.async_set(
+        "light.compact", "on", dict(attributes), False, None, state_info
+    )
+    await hass.async_block_till_done()
+
+    # The unchanged state is reported instead of replaced
+    assert len(state_changed_events) == 1
+    assert hass.states.get("light.compact") is state
+    assert state.last_reported > state.last_updated
+
+    hass.states.async_set(
+        "light.compact",
+        "on",
+        {**attributes, "hs_color": (31.0, 50.0)},
+        False,
+        None,
+        state_info,
+    )
+    await hass.async_block_till_done()
+    assert len(state_changed_events) == 2
+
+
 async def test_eventbus_add_remove_listener(hass: HomeAssistant) -> None:
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -1243,6 +1350,160 @@ async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     assert len(calls) == 1
 
 
+async def test_eventbus_listener_snapshots(hass: HomeAssistant) -> None:
+    """Test the listeners an event is dispatched to follow subscribe and unsubscribe."""
+    calls = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener which subscribes another listener."""
+        calls.append(("listener", event.event_type))
+        unsubs.append(hass.bus.async_listen("test", added_listener))
+
+    @ha.callback
+    def added_listener(event: ha.Event) -> None:
+        """Mock listener added while dispatching."""
+        calls.append(("added", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        """Mock match all listener."""
+        calls.append(("match_all", event.event_type))
+
+    unsubs = [hass.bus.async_listen("test", listener)]
+    hass.bus.async_fire("test")
+    assert calls == [("listener", "test")]
+
+    calls.clear()
+    unsubs.append(hass.bus.async_listen(MATCH_ALL, match_all_listener))
+    hass.bus.async_fire("test")
+    assert calls == [("listener", "test"), ("added", "test"), ("match_all", "test")]
+
+    # Event types without listeners share the snapshot of the match all listeners
+    hass.bus.async_fire("other")
+    calls.clear()
+    snapshots = len(hass.bus._listener_snapshots)
+    for idx in range(10):
+        hass.bus.async_fire(f"other_{idx}")
+    assert calls == [("match_all", f"other_{idx}") for idx in range(10)]
+    assert len(hass.bus._listener_snapshots) == snapshots
+
+    calls.clear()
+    for unsub in unsubs:
+        unsub()
+    hass.bus.async_fire("test")
+    assert calls == []
+
+
+async def test_eventbus_listener_snapshots_invalidated(hass: HomeAssistant) -> None:
+    """Test listeners changed after an event type was fired get the next events."""
+    calls = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+        calls.append(("listener", event.event_type))
+
+    @ha.callback
+    def other_listener(event: ha.Event) -> None:
+        """Mock other listener."""
+        calls.append(("other_listener", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        """Mock match all listener."""
+        calls.append(("match_all", event.event_type))
+
+    unsub_listener = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    assert "test" in hass.bus._listener_snapshots
+    assert calls == [("listener", "test")]
+
+    # A listener added to an event type which was fired already
+    calls.clear()
+    unsub_other_listener = hass.bus.async_listen("test", other_listener)
+    hass.bus.async_fire("test")
+    assert calls == [("listener", "test"), ("other_listener", "test")]
+
+    # A match all listener added after the event types were fired
+    calls.clear()
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    assert calls == [
+        ("listener", "test"),
+        ("other_listener", "test"),
+        ("match_all", "test"),
+        ("match_all", "other"),
+    ]
+
+    # A listener removed after the event type was fired
+    calls.clear()
+    unsub_listener()
+    hass.bus.async_fire("test")
+    assert calls == [("other_listener", "test"), ("match_all", "test")]
+
+    # A match all listener removed after the event types were fired
+    calls.clear()
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    assert calls == [("other_listener", "test")]
+
+    calls.clear()
+    unsub_other_listener()
+    hass.bus.async_fire("test")
+    assert calls == []
+
+
+async def test_eventbus_listener_snapshots_excluded_from_match_all(
+    hass: HomeAssistant,
+) -> None:
+    """Test events excluded from match all are not dispatched to match all listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+        calls.append(("listener", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        """Mock match all listener."""
+        calls.append(("match_all", event.event_type))
+
+    @ha.callback
+    def event_filter(event_data: dict[str, Any]) -> bool:
+        """Mock event filter."""
+        return event_data["entity_id"] == "test.entity"
+
+    event_data = {"entity_id": "test.entity"}
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire_internal(EVENT_STATE_REPORTED, event_data)
+    assert calls == []
+
+    # A listener added after the excluded event type was fired
+    unsub_listener = hass.bus.async_listen(
+        EVENT_STATE_REPORTED, listener, event_filter=event_filter
+    )
+    hass.bus.async_fire_internal(EVENT_STATE_REPORTED, event_data)
+    assert calls == [("listener", EVENT_STATE_REPORTED)]
+
+    # Changing the match all listeners keeps the event type excluded
+    calls.clear()
+    unsub_match_all()
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire_internal(EVENT_STATE_REPORTED, event_data)
+    assert calls == [("listener", EVENT_STATE_REPORTED)]
+
+    calls.clear()
+    unsub_listener()
+    hass.bus.async_fire_internal(EVENT_STATE_REPORTED, event_data)
+    assert calls == []
+    unsub_match_all()
+
+
 async def test_eventbus_listen_once_event_with_callback(hass: HomeAssistant) -> None:
     """Test listen_once_event method."""
     runs = []
@@ -1492,6 +1753,42 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test the snapshot of all states is shared until a state changes."""
+    hass.states.async_set("light.bowl", "on")
+    version = hass.states.async_version()
+    snapshot = hass.states.async_all_snapshot()
+    assert snapshot == (hass.states.get("light.bowl"),)
+    assert hass.states.async_all_snapshot() is snapshot
+
+    # Reporting the same state does not change the states
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.async_version() == version
+    assert hass.states.async_all_snapshot() is snapshot
+
+    hass.states.async_set("light.bowl", "off")
+    assert hass.states.async_version() > version
+    version = hass.states.async_version()
+    assert snapshot[0].state == "on"
+    snapshot = hass.states.async_all_snapshot()
+    assert snapshot == (hass.states.get("light.bowl"),)
+    assert snapshot[0].state == "off"
+
+    hass.states.async_set("switch.ac", "on")
+    assert hass.states.async_version() > version
+    version = hass.states.async_version()
+    assert [state.entity_id for state in hass.states.async_all_snapshot()] == [
+        "light.bowl",
+        "switch.ac",
+    ]
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_version() > version
+    assert [state.entity_id for state in hass.states.async_all_snapshot()] == [
+        "switch.ac"
+    ]
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -828,7 +828,47 @@ async def test_get_custom_components(hass: HomeAssistant) -> None:
         assert integrations == mock_get.return_value
         integrations = await loader.async_get_custom_components(hass)
         assert integrations == mock_get.return_value
-        mock_get.assert_called_once_with(hass)
+        mock_get.assert_called_once_with(hass, None)
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_manifest_cache(hass: HomeAssistant) -> None:
+    """Test manifests are read from the manifest cache when it is enabled."""
+    hass.data[loader.DATA_MANIFEST_CACHE] = {}
+    hue_integration = await loader.async_get_integration(hass, "hue")
+    custom_integration = await loader.async_get_integration(hass, "test_package")
+
+    manifests = hass.data[loader.DATA_MANIFEST_CACHE]
+    hue_entry = manifests[str(hue_integration.file_path)]
+    assert hue_entry["manifest"] == json_loads(
+        (hue_integration.file_path / "manifest.json").read_text()
+    )
+    assert "light.py" in hue_entry["top_level_files"]
+    assert hue_entry["mtime_ns"] is None
+    custom_entry = manifests[str(custom_integration.file_path)]
+    assert custom_entry["manifest"]["domain"] == "test_package"
+    assert custom_entry["mtime_ns"] is not None
+
+    def _forget_integrations() -> None:
+        hass.data[loader.DATA_INTEGRATIONS].clear()
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+
+    _forget_integrations()
+    with patch("homeassistant.loader.json_loads", wraps=json_loads) as mock_loads:
+        integration = await loader.async_get_integration(hass, "hue")
+        assert integration.manifest == hue_integration.manifest
+        assert integration.platforms_exists(["light"]) == ["light"]
+        integration = await loader.async_get_integration(hass, "test_package")
+        assert integration.manifest == custom_integration.manifest
+    mock_loads.assert_not_called()
+
+    # Custom integrations are read again when they were changed
+    custom_entry["mtime_ns"] -= 1
+    _forget_integrations()
+    with patch("homeassistant.loader.json_loads", wraps=json_loads) as mock_loads:
+        await loader.async_get_integration(hass, "test_package")
+    assert mock_loads.call_count == 1
+    assert manifests[str(custom_integration.file_path)] is not custom_entry
 
 
 @pytest.mark.usefixtures("enable_custom_integrations")
@@ -1373,6 +1413,49 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_async_get_component_lazy_platform_imports(
+    hass: HomeAssistant,
+) -> None:
+    """Verify async_get_component does not preload platforms in lazy mode."""
+    loader.async_enable_lazy_platform_imports(hass)
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        await executor_import_integration.async_get_component()
+
+    assert mock_import.call_count == 1
+    assert (
+        mock_import.call_args_list[0][0][0]
+        == "homeassistant.components.executor_import"
+    )
+
+    # Platforms are imported on first use
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        await executor_import_integration.async_get_platform("diagnostics")
+
+    assert mock_import.call_count == 1
+    assert (
+        mock_import.call_args_list[0][0][0]
+        == "homeassistant.components.executor_import.diagnostics"
+    )
+
+
+async def test_import_timings(hass: HomeAssistant) -> None:
+    """Test the import time of integrations and their platforms is recorded."""
+    integration = await loader.async_get_integration(hass, "sun")
+    await integration.async_get_component()
+    await integration.async_get_platform("sensor")
+
+    timings = loader.async_get_import_timings(hass)["sun"]
+    assert timings.keys() >= {
+        "homeassistant.components.sun",
+        "homeassistant.components.sun.sensor",
+    }
+    assert all(import_time >= 0 for import_time in timings.values())
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
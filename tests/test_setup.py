@@ -1150,6 +1150,79 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     }
 
 
+async def test_async_get_setup_trace(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the setup phases of startup are returned as a Chrome trace."""
+    hass.set_state(CoreState.not_running)
+
+    with setup.async_start_setup(
+        hass, integration="august", phase=setup.SetupPhases.SETUP
+    ):
+        freezer.tick(2)
+        with setup.async_start_setup(
+            hass,
+            integration="august",
+            group="entry_id",
+            phase=setup.SetupPhases.CONFIG_ENTRY_SETUP,
+        ):
+            freezer.tick(1)
+    with setup.async_start_setup(
+        hass, integration="sensor", phase=setup.SetupPhases.SETUP
+    ):
+        freezer.tick(0.5)
+
+    assert setup.async_get_setup_trace(hass) == {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "august"},
+            },
+            {
+                "name": "august (entry_id)",
+                "cat": setup.SetupPhases.CONFIG_ENTRY_SETUP,
+                "ph": "X",
+                "ts": 2_000_000,
+                "dur": 1_000_000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"group": "entry_id"},
+            },
+            {
+                "name": "august",
+                "cat": setup.SetupPhases.SETUP,
+                "ph": "X",
+                "ts": 0,
+                "dur": 3_000_000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"group": None},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"name": "sensor"},
+            },
+            {
+                "name": "sensor",
+                "cat": setup.SetupPhases.SETUP,
+                "ph": "X",
+                "ts": 3_000_000,
+                "dur": 500_000,
+                "pid": 1,
+                "tid": 2,
+                "args": {"group": None},
+            },
+        ],
+    }
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -851,6 +851,42 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "expected", "to_unit"),
+    [
+        # Process all items in _CONVERTED_VALUE
+        (converter, value, from_unit, expected, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, expected, to_unit in item
+    ],
+)
+def test_unit_conversion_factory_batch(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    expected: float,
+    to_unit: str,
+) -> None:
+    """Test conversion of a column of values to other units."""
+    convert = converter.converter_factory(from_unit, to_unit)
+    assert converter.converter_factory_batch(from_unit, to_unit)(
+        [value, None, value * 2]
+    ) == [convert(value), None, convert(value * 2)]
+    assert converter.converter_factory_batch(from_unit, to_unit)([value])[
+        0
+    ] == pytest.approx(expected)
+
+
+def test_unit_conversion_factory_batch_same_unit() -> None:
+    """Test converting a column of values to the same unit returns a copy."""
+    values = [1.0, None]
+    converted = EnergyConverter.converter_factory_batch(
+        UnitOfEnergy.KILO_WATT_HOUR, UnitOfEnergy.KILO_WATT_HOUR
+    )(values)
+    assert converted == values
+    assert converted is not values
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [
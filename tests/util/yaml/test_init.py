@@ -627,3 +627,68 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test the cache only parses changed files and the files including them."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text(
+        "included: !include included.yaml\n"
+        "merged: !include_dir_merge_named merged\n"
+        "password: !secret password\n"
+    )
+    (tmp_path / "included.yaml").write_text("key: value\n")
+    (tmp_path / "merged").mkdir()
+    (tmp_path / "merged" / "one.yaml").write_text("one: 1\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: secret\n")
+
+    cache = yaml_loader.YamlCache()
+
+    def load() -> tuple[dict, list[str]]:
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as parse_mock:
+            data = yaml_loader.load_yaml_dict(
+                config_file, yaml_loader.Secrets(tmp_path), cache
+            )
+        return data, [call.args[0].name for call in parse_mock.call_args_list]
+
+    data, parsed = load()
+    assert data == {
+        "included": {"key": "value"},
+        "merged": {"one": 1},
+        "password": "secret",
+    }
+    assert len(parsed) == 4
+
+    # Nothing changed, the cached data is returned as a copy
+    data["included"]["key"] = "mutated"
+    data, parsed = load()
+    assert data["included"] == {"key": "value"}
+    assert data["included"].__line__ == 1
+    assert data["included"].__config_file__ == str(config_file)
+    assert parsed == []
+
+    (tmp_path / "included.yaml").write_text("key: changed\n")
+    data, parsed = load()
+    assert data["included"] == {"key": "changed"}
+    assert parsed == [
+        str(config_file),
+        str(tmp_path / "included.yaml"),
+        str(tmp_path / yaml.SECRET_YAML),
+    ]
+
+    (tmp_path / "merged" / "two.yaml").write_text("two: 2\n")
+    data, parsed = load()
+    assert data["merged"] == {"one": 1, "two": 2}
+    assert parsed == [
+        str(config_file),
+        str(tmp_path / "merged" / "two.yaml"),
+        str(tmp_path / yaml.SECRET_YAML),
+    ]
+
+    (tmp_path / yaml.SECRET_YAML).write_text("password: changed\n")
+    data, parsed = load()
+    assert data["password"] == "changed"
+    assert parsed == [str(config_file), str(tmp_path / yaml.SECRET_YAML)]